@@ -0,0 +1,121 @@
+"""
+Benchmark of the feed assembly helpers on a synthetic feed
+
+Compares the previous, quadratic, implementation of sorting feed posts against
+the linear one in linkedin_api.utils.helpers.
+
+Usage: python benchmarks/feed_assembly.py [number of posts]
+"""
+
+import sys
+import time
+
+from linkedin_api.utils.helpers import (
+    append_update_post_field_to_posts_list,
+    get_update_author_name,
+    get_update_author_profile,
+    get_update_content,
+    get_update_old,
+    get_update_url,
+    iter_posts_sorted_without_promoted,
+    iter_raw_posts,
+)
+
+BASE_URL = "https://www.linkedin.com"
+
+
+def make_feed(size):
+    """Return (included, *elements) of a normalized feed of [size] posts, 1 in 10 promoted"""
+    included = []
+    elements = []
+    for n in range(size):
+        urn = f"urn:li:activity:{7000000000000000000 + n}"
+        included.append(
+            {
+                "actor": {
+                    "name": {"text": f"Author {n}"},
+                    "urn": f"urn:li:member:{n}",
+                    "subDescription": {"text": "Promoted" if n % 10 == 0 else "2h"},
+                },
+                "commentary": {"text": {"text": f"Post {n}"}},
+                "updateMetadata": {"urn": urn},
+            }
+        )
+        elements.append(f"urn:li:fs_updateV2:({urn},MAIN_FEED,EMPTY,DEFAULT,false)")
+    # posts come in a different order than the URNs
+    included.reverse()
+    urns = [e.split("(")[1].split(",")[0] for e in elements]
+    return included, urns
+
+
+def legacy_parse_list_raw_posts(l_raw_posts, linkedin_base_url):
+    l_posts = []
+    for i in l_raw_posts:
+        author_name = get_update_author_name(i)
+        if author_name:
+            l_posts = append_update_post_field_to_posts_list(
+                i, l_posts, "author_name", author_name
+            )
+        author_profile = get_update_author_profile(i, linkedin_base_url)
+        if author_profile:
+            l_posts = append_update_post_field_to_posts_list(
+                i, l_posts, "author_profile", author_profile
+            )
+        old = get_update_old(i)
+        if old:
+            l_posts = append_update_post_field_to_posts_list(i, l_posts, "old", old)
+        content = get_update_content(i, linkedin_base_url)
+        if content:
+            l_posts = append_update_post_field_to_posts_list(
+                i, l_posts, "content", content
+            )
+        url = get_update_url(i, linkedin_base_url)
+        if url:
+            l_posts = append_update_post_field_to_posts_list(i, l_posts, "url", url)
+    return l_posts
+
+
+def legacy_get_list_posts_sorted_without_promoted(l_urns, l_posts):
+    l_posts_sorted_without_promoted = []
+    l_posts[:] = [d for d in l_posts if d and "Promoted" not in d.get("old", "")]
+    for urn in l_urns:
+        for post in l_posts:
+            if urn in post["url"]:
+                l_posts_sorted_without_promoted.append(post)
+                l_posts[:] = [d for d in l_posts if urn not in d.get("url", "")]
+                break
+    return l_posts_sorted_without_promoted
+
+
+def legacy(included, urns):
+    posts = legacy_parse_list_raw_posts(included, BASE_URL)
+    return legacy_get_list_posts_sorted_without_promoted(urns, posts)
+
+
+def linear(included, urns):
+    posts = list(iter_raw_posts(included, BASE_URL))
+    return list(iter_posts_sorted_without_promoted(urns, posts))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    included, urns = make_feed(size)
+
+    legacy_seconds, legacy_posts = timed(legacy, included, urns)
+    linear_seconds, linear_posts = timed(linear, included, urns)
+    assert linear_posts == legacy_posts
+
+    print(f"{size} posts, {len(linear_posts)} after removing promoted ones")
+    print(f"legacy: {legacy_seconds * 1000:10.1f} ms")
+    print(f"linear: {linear_seconds * 1000:10.1f} ms")
+    print(f"speedup: {legacy_seconds / linear_seconds:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
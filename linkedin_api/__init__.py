@@ -3,5 +3,44 @@
 """
 
 from .linkedin import Linkedin
+from .cookie_repository import SQLiteCookieStorage
+from .entity_cache import EntityCache
+from .identity_index import IdentityIndex
+from .instrumentation import RequestMetrics
+from .json_decoder import JsonDecoder
+from .proxy_pool import ProxyPool
+from .rate_limiter import RateLimiter
+from .response_cache import CacheMissError, ResponseCache
+from .retry import RetryPolicy
+from .session_keeper import SessionKeeper
+from .session_pool import SessionPool
+from .single_flight import SingleFlight
+from .transport import TransportConfig
 
-__all__ = ["Linkedin"]
+__all__ = [
+    "Linkedin",
+    "AsyncLinkedin",
+    "CacheMissError",
+    "EntityCache",
+    "SQLiteCookieStorage",
+    "IdentityIndex",
+    "JsonDecoder",
+    "ProxyPool",
+    "RateLimiter",
+    "RequestMetrics",
+    "ResponseCache",
+    "RetryPolicy",
+    "SessionKeeper",
+    "SessionPool",
+    "SingleFlight",
+    "TransportConfig",
+]
+
+
+def __getattr__(name):
+    # AsyncLinkedin pulls in asyncio, only import it for those who use it
+    if name == "AsyncLinkedin":
+        from .async_linkedin import AsyncLinkedin
+
+        return AsyncLinkedin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
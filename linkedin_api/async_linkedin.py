@@ -0,0 +1,774 @@
+"""
+Provides an asyncio flavour of the linkedin api-related code
+"""
+
+import asyncio
+import logging
+import random
+from functools import partial
+from time import perf_counter
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
+
+from linkedin_api.cookie_repository import CookieStorage
+from linkedin_api.client import Client, RateLimitedException
+from linkedin_api.linkedin import Linkedin
+from linkedin_api.models import (
+    Company,
+    Experience,
+    JobPosting,
+    PeopleSearchHit,
+    Profile,
+    typed_parser,
+)
+from linkedin_api.pagination import AsyncPageIterator, Page
+from linkedin_api.instrumentation import build_event, emit
+from linkedin_api.json_decoder import JsonDecoder
+from linkedin_api.rate_limiter import RateLimiter
+from linkedin_api.session_keeper import SessionKeeper
+from linkedin_api.retry import OK, THROTTLED, RetryPolicy, parse_retry_after
+from linkedin_api.transport import TransportConfig
+from linkedin_api.utils.helpers import get_endpoint_family, split_profile_id
+from linkedin_api.utils.parsers import (
+    is_error_payload,
+    parse_conversation_details,
+    parse_current_profile_views,
+    parse_job_postings,
+    parse_paging_total,
+    parse_profile,
+    parse_profile_contact_info,
+    parse_profile_experiences,
+    parse_profile_skills,
+    parse_search_clusters,
+    parse_search_companies_item,
+    parse_search_people_item,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "AsyncLinkedin requires httpx. Install it with `pip install httpx`"
+        ) from e
+    return httpx
+
+
+async def default_evade():
+    """
+    Asynchronous counterpart of `linkedin_api.linkedin.default_evade`.
+    Delays the request by a random (bounded) time without blocking the event loop
+    """
+    await asyncio.sleep(random.randint(2, 5))
+
+
+class AsyncLinkedin(object):
+    """
+    Class for accessing the LinkedIn API with asyncio.
+
+    Mirrors the read methods of `Linkedin`, using the same request builders and
+    response parsers, on top of an `httpx.AsyncClient`. Authentication (and the
+    cookie cache) is handled synchronously by `Client`, once, at construction.
+
+    Requires httpx to be installed: `pip install httpx`
+
+    An instance sends all of its requests through one proxy: given a `ProxyPool`,
+    the proxy its account sticks to when it is built. Requests aren't rotated over
+    the pool nor reported to it; build a new instance to move to another proxy.
+
+    :param username: Username of LinkedIn account.
+    :type username: str
+    :param password: Password of LinkedIn account.
+    :type password: str
+    :param transport_config: Connection pool, keep-alive and timeout settings
+    :type transport_config: TransportConfig, optional
+    :param cookie_storage: Where cached cookies are kept, defaults to one pickle file
+        per username in [cookies_dir]. See `SQLiteCookieStorage`.
+    :type cookie_storage: CookieStorage, optional
+    :param rate_limiter: Rate limiter used to pace requests instead of the default random sleep
+    :type rate_limiter: RateLimiter, optional
+    :param max_concurrency: Maximum number of requests in flight at once for this instance
+    :type max_concurrency: int, optional
+    :param page_workers: Number of pages of a paginated collection to fetch concurrently,
+        once the first page has reported its total. Defaults to 1 (one page at a time).
+    :type page_workers: int, optional
+    :param retry_policy: How throttled (429, 999) and transient (5xx) responses are
+        retried, see `Linkedin`
+    :type retry_policy: RetryPolicy, optional
+    :param json_decoder: Decoder of response bodies, see `Linkedin`
+    :type json_decoder: JsonDecoder, optional
+    :param session_keeper: Refreshes the cookies of this instance in the background,
+        see `Linkedin`. Refreshed cookies are picked up before the next request.
+    :type session_keeper: SessionKeeper, optional
+    :param request_hooks: Called with a `RequestEvent` after each request sent, see `Linkedin`
+    :type request_hooks: list, optional
+    :param transport: httpx transport to send requests through. Pass the same
+        `httpx.AsyncHTTPTransport` to several instances to share one connection pool.
+    :type transport: httpx.AsyncBaseTransport, optional
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        *,
+        authenticate=True,
+        refresh_cookies=False,
+        debug=False,
+        proxies={},
+        cookies=None,
+        cookies_dir: str = "",
+        transport_config: Optional[TransportConfig] = None,
+        cookie_storage: Optional[CookieStorage] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_concurrency: int = 10,
+        page_workers: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        session_keeper: Optional[SessionKeeper] = None,
+        request_hooks: Optional[List[Callable]] = None,
+        transport=None,
+    ):
+        """Constructor method"""
+        httpx = _import_httpx()
+
+        self.client = Client(
+            refresh_cookies=refresh_cookies,
+            debug=debug,
+            proxies=proxies,
+            cookies_dir=cookies_dir,
+            transport_config=transport_config,
+            cookie_storage=cookie_storage,
+        )
+        logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+        self.logger = logger
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self.page_workers = page_workers
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.json_decoder = json_decoder or JsonDecoder()
+        self.request_hooks: List[Callable] = list(request_hooks or [])
+        # created in the event loop, by `_get_semaphore()`
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        if authenticate:
+            if cookies:
+                self.client._set_session_cookies(cookies)
+            else:
+                self.client.authenticate(username, password)
+                if session_keeper is not None:
+                    session_keeper.add(self.client, username, password)
+
+        if transport is None:
+            # a ProxyPool resolves to the proxy the account sticks to
+            proxies = self.client.proxies
+            transport = self.client.transport_config.build_httpx_transport(
+                max_connections=max_concurrency,
+                proxy=proxies.get("https") or proxies.get("http"),
+            )
+        self.session = httpx.AsyncClient(
+            headers=dict(self.client.session.headers),
+            cookies=self.client.session.cookies,
+            transport=transport,
+            timeout=self.client.transport_config.httpx_timeout(),
+        )
+        # cookies of the client the httpx client was last given
+        self._client_cookies = self.client.session.cookies
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        await self.session.aclose()
+
+    async def _evade(self, uri: str, evade=default_evade):
+        """Delay a request to [uri], either through the rate limiter or [evade]"""
+        if self.rate_limiter is not None and evade is default_evade:
+            wait = self.rate_limiter.reserve(get_endpoint_family(uri))
+            if wait > 0:
+                await asyncio.sleep(wait)
+        else:
+            await evade()
+
+    def add_request_hook(self, hook: Callable):
+        """Call [hook] with a `RequestEvent` after each request sent"""
+        self.request_hooks.append(hook)
+
+    def _sync_session(self):
+        """Use the cookies of `client` again, if they were refreshed since"""
+        cookies = self.client.session.cookies
+        if cookies is self._client_cookies:
+            return
+        # runs in the event loop, so no other request sees half of the change
+        self.session.cookies = cookies
+        self.session.headers["csrf-token"] = self.client.session.headers["csrf-token"]
+        self._client_cookies = cookies
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding the requests in flight, creating it on first use
+        so that it's bound to the running event loop rather than the one at construction
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _json(self, res):
+        """Return the decoded body of [res], decoded only once however often it is asked for"""
+        return self.json_decoder.decode(res)
+
+    async def _fetch(self, uri: str, evade=default_evade, base_request=False, **kwargs):
+        """GET request to Linkedin API, retried according to the retry policy
+
+        :raises RateLimitedException: if the request is still throttled after all retries,
+            and the retry policy raises on throttling
+        :raises httpx.TransportError: if the request still can't be sent after all retries
+        """
+        httpx = _import_httpx()
+        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
+        family = get_endpoint_family(uri)
+        paced = self.rate_limiter is not None and evade is default_evade
+        attempt = 0
+        # backoff slept before the current attempt
+        slept = 0.0
+        while True:
+            start = perf_counter()
+            await self._evade(uri, evade)
+            self._sync_session()
+            sent = start
+            try:
+                async with self._get_semaphore():
+                    # waiting for a slot counts as waiting too
+                    sent = perf_counter()
+                    res = await self.session.get(url, **kwargs)
+                error = None
+            except httpx.TransportError as e:
+                res, error = None, e
+            latency = perf_counter() - sent
+
+            if self.request_hooks:
+                event = build_event(
+                    "GET",
+                    uri,
+                    res,
+                    error,
+                    attempt=attempt,
+                    latency=latency,
+                    wait=sent - start + slept,
+                    decoder=self.json_decoder,
+                )
+                emit(self.request_hooks, event)
+            outcome = self.retry_policy.classify(res, error)
+            retry = self.retry_policy.should_retry("GET", outcome, attempt)
+            delay = self.retry_policy.get_delay(attempt, res) if retry else 0.0
+            if self.rate_limiter is not None and outcome == OK:
+                self.rate_limiter.reward(family)
+            elif self.rate_limiter is not None and outcome == THROTTLED:
+                self.rate_limiter.penalize(family, retry_after=delay if paced else 0.0)
+
+            if not retry:
+                if error is not None:
+                    raise error
+                if outcome == THROTTLED and self.retry_policy.raise_on_throttled:
+                    raise RateLimitedException(
+                        res.status_code,
+                        parse_retry_after(res.headers.get("Retry-After")),
+                    )
+                return res
+
+            self.logger.warning(
+                f"GET {uri} {outcome} ({error or res.status_code}), "
+                f"retrying in {delay:.1f}s"
+            )
+            slept = 0.0
+            if not (paced and outcome == THROTTLED):
+                await asyncio.sleep(delay)
+                slept = delay
+            attempt += 1
+
+    def _iter_search(
+        self, params: Dict, limit=-1, offset=0, parse_item=None
+    ) -> AsyncPageIterator:
+        """Return a lazy iterator over search results, see Linkedin.iter_search()"""
+
+        async def fetch_page(cursor, count):
+            res = await self._fetch(
+                Linkedin._search_uri(params, start=cursor.start, count=count)
+            )
+            data = self._json(res)
+            return Page(parse_search_clusters(data), total=parse_paging_total(data))
+
+        return AsyncPageIterator(
+            fetch_page,
+            offset=offset,
+            limit=limit,
+            page_size=Linkedin._MAX_SEARCH_COUNT,
+            max_requests=Linkedin._MAX_REPEATED_REQUESTS,
+            parse_item=parse_item,
+            workers=self.page_workers,
+        )
+
+    def iter_search(self, params: Dict, limit=-1, offset=0) -> AsyncPageIterator:
+        """Perform a LinkedIn search, yielding results as each page arrives.
+
+        Use with `async for`. See Linkedin.iter_search()
+
+        :return: Asynchronous iterator of search results
+        :rtype: AsyncPageIterator
+        """
+        return self._iter_search(params, limit=limit, offset=offset)
+
+    async def search(self, params: Dict, limit=-1, offset=0) -> List:
+        """Perform a LinkedIn search. See Linkedin.search()
+
+        :return: List of search results
+        :rtype: list
+        """
+        return [item async for item in self.iter_search(params, limit, offset)]
+
+    def iter_search_people(
+        self,
+        keywords: Optional[str] = None,
+        *,
+        include_private_profiles=False,
+        limit=-1,
+        offset=0,
+        typed=False,
+        **filters,
+    ) -> AsyncPageIterator:
+        """Perform a LinkedIn search for people, yielding profiles as each page arrives.
+
+        Use with `async for`. Accepts the same filters as Linkedin.search_people(),
+        by keyword past [keywords]
+
+        :return: Asynchronous iterator of profiles (minimal data only)
+        :rtype: AsyncPageIterator
+        """
+        parse_item = partial(
+            parse_search_people_item, include_private_profiles=include_private_profiles
+        )
+        if typed:
+            parse_item = typed_parser(parse_item, PeopleSearchHit)
+        return self._iter_search(
+            Linkedin._search_people_params(keywords=keywords, **filters),
+            limit=limit,
+            offset=offset,
+            parse_item=parse_item,
+        )
+
+    async def search_people(
+        self,
+        keywords: Optional[str] = None,
+        *,
+        include_private_profiles=False,
+        limit=-1,
+        offset=0,
+        typed=False,
+        **filters,
+    ) -> List[Dict]:
+        """Perform a LinkedIn search for people.
+
+        Accepts the same filters as Linkedin.search_people(), by keyword past [keywords]
+
+        :return: List of profiles (minimal data only)
+        :rtype: list
+        """
+        iterator = self.iter_search_people(
+            keywords,
+            include_private_profiles=include_private_profiles,
+            limit=limit,
+            offset=offset,
+            typed=typed,
+            **filters,
+        )
+        return [item async for item in iterator]
+
+    def iter_search_companies(
+        self, keywords: Optional[List[str]] = None, limit=-1, offset=0, typed=False
+    ) -> AsyncPageIterator:
+        """Perform a LinkedIn search for companies, yielding companies as each page arrives.
+
+        Use with `async for`. See Linkedin.iter_search_companies()
+
+        :return: Asynchronous iterator of companies
+        :rtype: AsyncPageIterator
+        """
+        return self._iter_search(
+            Linkedin._search_companies_params(keywords),
+            limit=limit,
+            offset=offset,
+            parse_item=(
+                typed_parser(parse_search_companies_item, Company)
+                if typed
+                else parse_search_companies_item
+            ),
+        )
+
+    async def search_companies(
+        self, keywords: Optional[List[str]] = None, typed=False, **kwargs
+    ) -> List:
+        """Perform a LinkedIn search for companies. See Linkedin.search_companies()
+
+        :return: List of companies
+        :rtype: list
+        """
+        iterator = self.iter_search_companies(keywords, typed=typed, **kwargs)
+        return [item async for item in iterator]
+
+    async def search_jobs(
+        self,
+        keywords: Optional[str] = None,
+        *,
+        limit=-1,
+        offset=0,
+        typed=False,
+        **filters,
+    ) -> List[Dict]:
+        """Perform a LinkedIn search for jobs.
+
+        Accepts the same filters as Linkedin.search_jobs(), by keyword past [keywords]
+
+        :return: List of jobs
+        :rtype: list
+        """
+        iterator = self.iter_search_jobs(
+            keywords, limit=limit, offset=offset, typed=typed, **filters
+        )
+        return [item async for item in iterator]
+
+    def iter_search_jobs(
+        self,
+        keywords: Optional[str] = None,
+        *,
+        limit=-1,
+        offset=0,
+        typed=False,
+        **filters,
+    ) -> AsyncPageIterator:
+        """Perform a LinkedIn search for jobs, yielding results as each page arrives.
+
+        Accepts the same filters as Linkedin.search_jobs(), by keyword past [keywords]
+
+        :return: Iterator of jobs
+        :rtype: AsyncPageIterator
+        """
+        query_string = Linkedin._search_jobs_query(keywords=keywords, **filters)
+
+        async def fetch_page(cursor, count):
+            res = await self._fetch(
+                Linkedin._search_jobs_uri(
+                    query_string, start=cursor.start, count=count
+                ),
+                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            )
+            data = self._json(res)
+            return Page(parse_job_postings(data), total=parse_paging_total(data))
+
+        return AsyncPageIterator(
+            fetch_page,
+            offset=offset,
+            limit=limit,
+            page_size=Linkedin._MAX_SEARCH_COUNT,
+            max_requests=Linkedin._MAX_REPEATED_REQUESTS,
+            parse_item=JobPosting.from_dict if typed else None,
+            workers=self.page_workers,
+        )
+
+    async def get_profile(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        typed=False,
+    ) -> Dict:
+        """Fetch data for a given LinkedIn profile. See Linkedin.get_profile()
+
+        :return: Profile data
+        :rtype: dict
+        """
+        res = await self._fetch(f"/identity/profiles/{public_id or urn_id}/profileView")
+        if res.status_code != 200:
+            self.logger.info("request failed [status={}]".format(res.status_code))
+            raise Exception(
+                "Request failed: get_profile. Try refreshing cookies or solving challenge in a browser."
+            )
+
+        data = self._json(res)
+        if is_error_payload(data):
+            self.logger.info("request failed: {}".format(data["message"]))
+            return None if typed else {}
+
+        profile = parse_profile(data)
+        return Profile.from_dict(profile) if typed else profile
+
+    async def get_profiles(
+        self,
+        ids: Iterable[str],
+        workers: int = 4,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> AsyncIterator[Tuple[str, Union[Dict, Exception]]]:
+        """Fetch many LinkedIn profiles concurrently, yielding them as they complete.
+        See Linkedin.get_profiles()
+
+        At most [workers] profiles are in flight at once.
+
+        :return: Async iterator of (id, profile data), or (id, exception) if the profile failed
+        :rtype: async iterator
+        """
+        ids = iter(ids)
+        end = object()
+        seen = set()
+        pending = {}
+        completed = failed = 0
+
+        try:
+            while True:
+                while ids is not None and len(pending) < workers:
+                    profile_id = next(ids, end)
+                    if profile_id is end:
+                        ids = None
+                        break
+                    public_id, urn_id = split_profile_id(profile_id)
+                    key = public_id or urn_id
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    task = asyncio.ensure_future(self.get_profile(public_id, urn_id))
+                    pending[task] = profile_id
+                if not pending:
+                    break
+
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    profile_id = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        self.logger.info(f"failed to fetch profile {profile_id}: {e!r}")
+                        result = e
+                        failed += 1
+                    completed += 1
+                    if progress is not None:
+                        progress(completed, failed)
+                    yield profile_id, result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_profile_contact_info(
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+    ) -> Dict:
+        """Fetch contact information for a given LinkedIn profile.
+
+        :return: Contact data
+        :rtype: dict
+        """
+        res = await self._fetch(
+            f"/identity/profiles/{public_id or urn_id}/profileContactInfo"
+        )
+        return parse_profile_contact_info(self._json(res))
+
+    async def get_profile_skills(
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+    ) -> List:
+        """Fetch the skills listed on a given LinkedIn profile.
+
+        :return: List of skill objects
+        :rtype: list
+        """
+        params = {"count": 100, "start": 0}
+        res = await self._fetch(
+            f"/identity/profiles/{public_id or urn_id}/skills", params=params
+        )
+        return parse_profile_skills(self._json(res))
+
+    async def get_profile_experiences(self, urn_id: str, typed=False) -> List:
+        """Fetch experiences for a given LinkedIn profile.
+
+        :return: List of experiences
+        :rtype: list
+        """
+        res = await self._fetch(
+            Linkedin._profile_experiences_uri(urn_id),
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        )
+        experiences = parse_profile_experiences(self._json(res))
+        if typed:
+            return [Experience.from_dict(e) for e in experiences]
+        return experiences
+
+    async def get_profile_connections(self, urn_id: str, **kwargs) -> List:
+        """Fetch connections for a given LinkedIn profile.
+
+        :return: List of search results
+        :rtype: list
+        """
+        return await self.search_people(connection_of=urn_id, **kwargs)
+
+    async def _get_profile_normalized(self, public_profile_id: str, path: str):
+        res = await self._fetch(
+            f"/identity/profiles/{public_profile_id}/{path}",
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        )
+        if res.status_code != 200:
+            return {}
+
+        return self._json(res).get("data", {})
+
+    async def get_profile_privacy_settings(self, public_profile_id: str):
+        """Fetch privacy settings for a given LinkedIn profile.
+
+        :return: Privacy settings data
+        :rtype: dict
+        """
+        return await self._get_profile_normalized(public_profile_id, "privacySettings")
+
+    async def get_profile_member_badges(self, public_profile_id: str):
+        """Fetch badges for a given LinkedIn profile.
+
+        :return: Badges data
+        :rtype: dict
+        """
+        return await self._get_profile_normalized(public_profile_id, "memberBadges")
+
+    async def get_profile_network_info(self, public_profile_id: str):
+        """Fetch network information for a given LinkedIn profile.
+
+        :return: Network data
+        :rtype: dict
+        """
+        return await self._get_profile_normalized(public_profile_id, "networkinfo")
+
+    async def get_current_profile_views(self):
+        """Get profile view statistics, including chart data.
+
+        :return: Profile view data
+        :rtype: dict
+        """
+        res = await self._fetch(f"/identity/wvmpCards")
+        return parse_current_profile_views(self._json(res))
+
+    async def get_school(self, public_id):
+        """Fetch data about a given LinkedIn school.
+
+        :return: School data
+        :rtype: dict
+        """
+        params = {
+            "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12",
+            "q": "universalName",
+            "universalName": public_id,
+        }
+
+        res = await self._fetch(f"/organization/companies?{urlencode(params)}")
+        data = self._json(res)
+
+        if is_error_payload(data):
+            self.logger.info("request failed: {}".format(data))
+            return {}
+
+        return data["elements"][0]
+
+    async def get_company(self, public_id, typed=False):
+        """Fetch data about a given LinkedIn company.
+
+        :return: Company data
+        :rtype: dict
+        """
+        params = {
+            "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12",
+            "q": "universalName",
+            "universalName": public_id,
+        }
+
+        res = await self._fetch(f"/organization/companies", params=params)
+        data = self._json(res)
+
+        if is_error_payload(data):
+            self.logger.info("request failed: {}".format(data["message"]))
+            return None if typed else {}
+
+        company = data["elements"][0]
+        return Company.from_element(company) if typed else company
+
+    async def get_conversation_details(self, profile_urn_id):
+        """Fetch conversation (message thread) details for a given LinkedIn profile.
+
+        :return: Conversation data
+        :rtype: dict
+        """
+        res = await self._fetch(
+            f"/messaging/conversations?\
+            keyVersion=LEGACY_INBOX&q=participants&recipients=List({profile_urn_id})"
+        )
+        return parse_conversation_details(self._json(res))
+
+    async def get_conversations(self):
+        """Fetch list of conversations the user is in.
+
+        :return: List of conversations
+        :rtype: list
+        """
+        params = {"keyVersion": "LEGACY_INBOX"}
+        res = await self._fetch(f"/messaging/conversations", params=params)
+        return self._json(res)
+
+    async def get_conversation(self, conversation_urn_id: str):
+        """Fetch data about a given conversation.
+
+        :return: Conversation data
+        :rtype: dict
+        """
+        res = await self._fetch(
+            f"/messaging/conversations/{conversation_urn_id}/events"
+        )
+        return self._json(res)
+
+    async def get_user_profile(self, use_cache=True) -> Dict:
+        """Get the current user profile. If not cached, a network request will be fired.
+
+        :return: Profile data for currently logged in user
+        :rtype: dict
+        """
+        me_profile = self.client.metadata.get("me", {})
+        if not self.client.metadata.get("me") or not use_cache:
+            res = await self._fetch(f"/me")
+            me_profile = self._json(res)
+            # cache profile
+            self.client.metadata["me"] = me_profile
+
+        return me_profile
+
+    async def get_job(self, job_id: str) -> Dict:
+        """Fetch data about a given job.
+
+        :return: Job data
+        :rtype: dict
+        """
+        params = {
+            "decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebLightJobPosting-23",
+        }
+        res = await self._fetch(f"/jobs/jobPostings/{job_id}", params=params)
+        data = self._json(res)
+
+        if is_error_payload(data):
+            self.logger.info("request failed: {}".format(data["message"]))
+            return {}
+
+        return data
@@ -1,12 +1,18 @@
 import requests
 import logging
-from linkedin_api.cookie_repository import CookieRepository
-from bs4 import BeautifulSoup, Tag
+import time
+from linkedin_api.cookie_repository import CookieRepository, CookieStorage
+from linkedin_api.proxy_pool import ProxyPool
+from linkedin_api.transport import TransportConfig
 from requests.cookies import RequestsCookieJar
+from typing import Callable, Dict, Optional, Union
 import json
 
 logger = logging.getLogger(__name__)
 
+# the metadata is read from the <head> of the homepage, don't download more than this
+MAX_HEAD_BYTES = 2 * 1024 * 1024
+
 
 class ChallengeException(Exception):
     pass
@@ -16,9 +22,132 @@ class UnauthorizedException(Exception):
     pass
 
 
+class RateLimitedException(Exception):
+    """
+    Raised when Linkedin keeps throttling a request after all its retries.
+
+    :param status_code: Status of the last response, typically 429 or 999
+    :type status_code: int
+    :param retry_after: Seconds the server asked to wait, if it did
+    :type retry_after: float, optional
+    """
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(
+            f"Request throttled [status={status_code}, retry_after={retry_after}]"
+        )
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class LazyMetadata(dict):
+    """
+    Metadata of the client, which only fetches the keys scraped from the homepage
+    (see `METADATA_KEYS`) the first time one of them is looked up.
+
+    Iterating over it doesn't trigger the fetch, call `load()` first to get
+    everything.
+
+    :param loader: Called once to fetch the metadata, expected to store it in the dict
+    :type loader: callable, optional
+    """
+
+    METADATA_KEYS = ("clientApplicationInstance", "clientPageInstanceId")
+
+    def __init__(self, loader: Optional[Callable] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._loader = loader
+
+    @property
+    def loaded(self) -> bool:
+        return self._loader is None
+
+    def load(self):
+        """Fetch the metadata, unless it already is"""
+        loader, self._loader = self._loader, None
+        if loader is None:
+            return
+        try:
+            loader()
+        except BaseException:
+            self._loader = loader
+            raise
+
+    def __getitem__(self, key):
+        if key in self.METADATA_KEYS:
+            self.load()
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        if key in self.METADATA_KEYS:
+            self.load()
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        if key in self.METADATA_KEYS:
+            self.load()
+        return super().__contains__(key)
+
+
+def _read_head(res: requests.Response, max_bytes: int = MAX_HEAD_BYTES) -> str:
+    """
+    Return the page of a streamed response [res] up to the end of its <head>,
+    closing the response without downloading the rest of the body.
+    """
+    end_tag = b"</head>"
+    head = bytearray()
+    try:
+        for chunk in res.iter_content(chunk_size=16 * 1024):
+            # the closing tag may straddle two chunks
+            start = max(0, len(head) - len(end_tag))
+            head += chunk
+            end = bytes(head[start:]).lower().find(end_tag)
+            if end != -1:
+                del head[start + end + len(end_tag) :]
+                break
+            if len(head) >= max_bytes:
+                break
+    finally:
+        res.close()
+    return head.decode(res.encoding or "utf-8", errors="replace")
+
+
+def parse_metadata(html: str) -> Dict:
+    """Return the application instance metadata in the <meta> tags of [html]"""
+    # only needed when the metadata isn't cached, keep it out of `import linkedin_api`
+    from bs4 import BeautifulSoup, Tag
+
+    metadata = {}
+    soup = BeautifulSoup(html, "lxml")
+
+    clientApplicationInstanceRaw = soup.find(
+        "meta", attrs={"name": "applicationInstance"}
+    )
+    if clientApplicationInstanceRaw and isinstance(clientApplicationInstanceRaw, Tag):
+        clientApplicationInstanceRaw = clientApplicationInstanceRaw.attrs.get(
+            "content", {}
+        )
+        clientApplicationInstance = json.loads(clientApplicationInstanceRaw)
+        metadata["clientApplicationInstance"] = clientApplicationInstance
+
+    clientPageInstanceIdRaw = soup.find("meta", attrs={"name": "clientPageInstanceId"})
+    if clientPageInstanceIdRaw and isinstance(clientPageInstanceIdRaw, Tag):
+        clientPageInstanceId = clientPageInstanceIdRaw.attrs.get("content", {})
+        metadata["clientPageInstanceId"] = clientPageInstanceId
+
+    return metadata
+
+
 class Client(object):
     """
     Class to act as a client for the Linkedin API.
+
+    :param proxies: Proxies of the session, either a static `proxies` dict or a
+        `ProxyPool` rotating between proxies
+    :type proxies: dict or ProxyPool, optional
+    :param transport_config: Connection pool, keep-alive and timeout settings, shared by the
+        API and the authentication requests
+    :type transport_config: TransportConfig, optional
     """
 
     # Settings for general Linkedin API calls
@@ -49,29 +178,52 @@ class Client(object):
     }
 
     def __init__(
-        self, *, debug=False, refresh_cookies=False, proxies={}, cookies_dir: str = ""
+        self,
+        *,
+        debug=False,
+        refresh_cookies=False,
+        proxies={},
+        cookies_dir: str = "",
+        transport_config: Optional[TransportConfig] = None,
+        cookie_storage: Optional[CookieStorage] = None,
     ):
-        self.session = requests.session()
-        self.session.proxies.update(proxies)
-        self.session.headers.update(Client.REQUEST_HEADERS)
+        self.transport_config = transport_config or TransportConfig()
+        self._adapter = self.transport_config.build_adapter()
+        self.session = self._build_session()
+        self.proxy_pool: Optional[ProxyPool] = None
+        # key the proxy pool sticks a proxy to, replaced by the username on authentication
+        self._proxy_key = f"client-{id(self)}"
         self.proxies = proxies
+        self.session.headers.update(Client.REQUEST_HEADERS)
         self.logger = logger
-        self.metadata = {}
+        self.metadata = LazyMetadata()
+        self._username: Optional[str] = None
         self._use_cookie_cache = not refresh_cookies
-        self._cookie_repository = CookieRepository(cookies_dir=cookies_dir)
+        self._cookie_repository = CookieRepository(
+            cookies_dir=cookies_dir, storage=cookie_storage
+        )
 
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
 
+    def _build_session(self) -> requests.Session:
+        """Return a new session using the connection pool of the client"""
+        session = requests.session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        if not self.transport_config.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
     def _request_session_cookies(self):
         """
         Return a new set of session cookies as given by Linkedin.
         """
         self.logger.debug("Requesting new cookies.")
 
-        res = requests.get(
+        res = self._auth_request(
+            "GET",
             f"{Client.LINKEDIN_BASE_URL}/uas/authenticate",
             headers=Client.AUTH_REQUEST_HEADERS,
-            proxies=self.proxies,
         )
         return res.cookies
 
@@ -88,52 +240,123 @@ class Client(object):
     def cookies(self):
         return self.session.cookies
 
+    @property
+    def proxies(self) -> Dict[str, str]:
+        """Return the proxies to send the next request through"""
+        if self.proxy_pool is not None:
+            return self.proxy_pool.get_proxies(self._proxy_key)
+        return self._proxies
+
+    @proxies.setter
+    def proxies(self, proxies: Union[Dict[str, str], ProxyPool]):
+        """Send the next requests through [proxies], a `proxies` dict or a `ProxyPool`"""
+        if isinstance(proxies, ProxyPool):
+            self.proxy_pool = proxies
+            proxies = {}
+        else:
+            self.proxy_pool = None
+        self._proxies = dict(proxies)
+        self.session.proxies.clear()
+        self.session.proxies.update(self._proxies)
+
+    def _auth_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send an authentication request, which doesn't share the session's cookies"""
+        # authentication requests carry their own cookies and headers, so each goes
+        # through a session of its own, which other threads authenticating at the
+        # same time can't touch, sharing the connection pool of the client
+        session = self._build_session()
+        if self.proxy_pool is None:
+            kwargs.setdefault("proxies", self._proxies)
+        return self._send(session, method, url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with the session, through the proxy pool if any"""
+        return self._send(self.session, method, url, **kwargs)
+
+    def _send(
+        self, session: requests.Session, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Send a request with [session], reporting its outcome to the proxy pool if any"""
+        kwargs.setdefault("timeout", self.transport_config.timeout)
+        if self.proxy_pool is None:
+            return session.request(method, url, **kwargs)
+
+        proxy = self.proxy_pool.get(self._proxy_key)
+        kwargs.setdefault("proxies", {"http": proxy, "https": proxy})
+        start = time.monotonic()
+        try:
+            res = session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            self.proxy_pool.report(proxy, error=e)
+            raise
+        self.proxy_pool.report(
+            proxy, latency=time.monotonic() - start, status_code=res.status_code
+        )
+        return res
+
     def authenticate(self, username: str, password: str):
+        if self.proxy_pool is not None:
+            # stick to one proxy from the first authentication request onwards
+            self._proxy_key = username
+        self._username = username
         if self._use_cookie_cache:
             self.logger.debug("Attempting to use cached cookies")
             cookies = self._cookie_repository.get(username)
             if cookies:
                 self.logger.debug("Using cached cookies")
                 self._set_session_cookies(cookies)
-                self._fetch_metadata()
+                metadata = self._cookie_repository.get_metadata(username)
+                if metadata:
+                    self.logger.debug("Using cached metadata")
+                    self.metadata = LazyMetadata(**metadata)
+                else:
+                    self.metadata = LazyMetadata(self._fetch_metadata)
                 return
 
         self._do_authentication_request(username, password)
-        self._fetch_metadata()
+        # new cookies, the metadata is fetched when it is first needed
+        self.metadata = LazyMetadata(self._fetch_metadata)
 
     def _fetch_metadata(self):
         """
         Get metadata about the "instance" of the LinkedIn application for the signed in user.
 
-        Store this data in self.metadata
+        Store this data in self.metadata, and along with the cookies of the user.
+        Only the <head> of the homepage, where the metadata is, gets downloaded.
         """
-        res = requests.get(
+        res = self._auth_request(
+            "GET",
             f"{Client.LINKEDIN_BASE_URL}",
             cookies=self.session.cookies,
             headers=Client.AUTH_REQUEST_HEADERS,
-            proxies=self.proxies,
+            stream=True,
         )
 
-        soup = BeautifulSoup(res.text, "lxml")
+        metadata = parse_metadata(_read_head(res))
+        self.metadata.update(metadata)
+        if metadata and self._username:
+            self._cookie_repository.save_metadata(metadata, self._username)
 
-        clientApplicationInstanceRaw = soup.find(
-            "meta", attrs={"name": "applicationInstance"}
-        )
-        if clientApplicationInstanceRaw and isinstance(
-            clientApplicationInstanceRaw, Tag
-        ):
-            clientApplicationInstanceRaw = clientApplicationInstanceRaw.attrs.get(
-                "content", {}
-            )
-            clientApplicationInstance = json.loads(clientApplicationInstanceRaw)
-            self.metadata["clientApplicationInstance"] = clientApplicationInstance
-
-        clientPageInstanceIdRaw = soup.find(
-            "meta", attrs={"name": "clientPageInstanceId"}
-        )
-        if clientPageInstanceIdRaw and isinstance(clientPageInstanceIdRaw, Tag):
-            clientPageInstanceId = clientPageInstanceIdRaw.attrs.get("content", {})
-            self.metadata["clientPageInstanceId"] = clientPageInstanceId
+    def refresh_session(self, username: str, password: str):
+        """
+        Authenticate [username] again, even if its cookies are still valid.
+
+        The new cookies are requested without touching `session`, which is then
+        replaced by a new session all at once: requests in flight finish with the
+        previous cookies, the next ones are sent with the new cookies.
+        """
+        cookies = self._request_authenticated_cookies(username, password)
+        session = self._build_session()
+        session.headers.update(self.session.headers)
+        session.proxies.update(self.session.proxies)
+        session.cookies = cookies
+        session.headers["csrf-token"] = cookies["JSESSIONID"].strip('"')
+        me = self.metadata.get("me")
+        self._username = username
+        self.session = session
+        self.metadata = LazyMetadata(self._fetch_metadata)
+        if me is not None:
+            self.metadata["me"] = me
 
     def _do_authentication_request(self, username: str, password: str):
         """
@@ -141,20 +364,34 @@ class Client(object):
 
         Return a session object that is authenticated.
         """
-        self._set_session_cookies(self._request_session_cookies())
+        self._set_session_cookies(
+            self._request_authenticated_cookies(username, password)
+        )
+
+    def _request_authenticated_cookies(
+        self, username: str, password: str
+    ) -> RequestsCookieJar:
+        """
+        Sign in with [username] and [password], and save the cookies of the
+        authenticated session.
+
+        :return: The cookies of the authenticated session
+        :rtype: RequestsCookieJar
+        """
+        cookies = self._request_session_cookies()
 
         payload = {
             "session_key": username,
             "session_password": password,
-            "JSESSIONID": self.session.cookies["JSESSIONID"],
+            "JSESSIONID": cookies["JSESSIONID"],
         }
 
-        res = requests.post(
+        res = self._auth_request(
+            "POST",
             f"{Client.LINKEDIN_BASE_URL}/uas/authenticate",
             data=payload,
-            cookies=self.session.cookies,
+            cookies=cookies,
             headers=Client.AUTH_REQUEST_HEADERS,
-            proxies=self.proxies,
         )
 
         data = res.json()
@@ -168,5 +405,5 @@ class Client(object):
         if res.status_code != 200:
             raise Exception()
 
-        self._set_session_cookies(res.cookies)
         self._cookie_repository.save(res.cookies, username)
+        return res.cookies
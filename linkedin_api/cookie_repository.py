@@ -1,9 +1,13 @@
+import json
 import os
 import pickle
+import sqlite3
+import tempfile
+import threading
 import time
 import linkedin_api.settings as settings
 from requests.cookies import RequestsCookieJar
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class Error(Exception):
@@ -16,32 +20,59 @@ class LinkedinSessionExpired(Error):
     pass
 
 
-class CookieRepository(object):
+def get_jsessionid_expiry(cookiejar: RequestsCookieJar) -> float:
+    """Return the expiry timestamp of the JSESSIONID cookie of [cookiejar], 0 if none"""
+    for cookie in cookiejar:
+        if cookie.name == "JSESSIONID" and cookie.value:
+            return float(cookie.expires or 0)
+    return 0.0
+
+
+class CookieStorage(object):
     """
-    Class to act as a repository for the cookies.
+    Interface of the storage backends of `CookieRepository`.
 
-    TODO: refactor to use http.cookiejar.FileCookieJar
+    Backends store one cookie jar per username, along with the expiry of its
+    JSESSIONID cookie so that validity can be checked without going through the jar,
+    and the client metadata fetched with these cookies. Saving new cookies drops
+    the metadata of the previous ones.
     """
 
-    def __init__(self, cookies_dir=settings.COOKIE_PATH):
-        self.cookies_dir = cookies_dir or settings.COOKIE_PATH
+    def save(self, username: str, cookies: RequestsCookieJar, expires: float):
+        raise NotImplementedError
 
-    def save(self, cookies, username):
-        self._ensure_cookies_dir()
-        cookiejar_filepath = self._get_cookies_filepath(username)
-        with open(cookiejar_filepath, "wb") as f:
-            pickle.dump(cookies, f)
+    def load(self, username: str) -> Optional[Tuple[RequestsCookieJar, float]]:
+        """Return the cookie jar of [username] and its JSESSIONID expiry, if stored"""
+        raise NotImplementedError
 
-    def get(self, username: str) -> Optional[RequestsCookieJar]:
-        cookies = self._load_cookies_from_cache(username)
-        if cookies and not CookieRepository._is_token_still_valid(cookies):
-            raise LinkedinSessionExpired
+    def save_metadata(self, username: str, metadata: Dict):
+        """Store the metadata of the current cookies of [username]"""
+        raise NotImplementedError
 
-        return cookies
+    def load_metadata(self, username: str) -> Optional[Dict]:
+        """Return the metadata of the current cookies of [username], if stored"""
+        raise NotImplementedError
 
-    def _ensure_cookies_dir(self):
-        if not os.path.exists(self.cookies_dir):
-            os.makedirs(self.cookies_dir)
+    def get_expiry(self, username: str) -> Optional[float]:
+        """Return the JSESSIONID expiry of [username], if stored
+
+        Backends storing the expiry apart from the jar should return it without
+        loading the jar.
+        """
+        stored = self.load(username)
+        return stored[1] if stored is not None else None
+
+
+class FileCookieStorage(CookieStorage):
+    """
+    Stores each cookie jar in its own pickle file, `<cookies_dir><username>.jr`.
+
+    Files are written to a temporary file first and then renamed, so concurrent
+    writers can't leave a partially written jar behind.
+    """
+
+    def __init__(self, cookies_dir: str = settings.COOKIE_PATH):
+        self.cookies_dir = cookies_dir or settings.COOKIE_PATH
 
     def _get_cookies_filepath(self, username) -> str:
         """
@@ -49,22 +80,202 @@ class CookieRepository(object):
         """
         return "{}{}.jr".format(self.cookies_dir, username)
 
-    def _load_cookies_from_cache(self, username: str) -> Optional[RequestsCookieJar]:
-        cookiejar_filepath = self._get_cookies_filepath(username)
+    def _get_metadata_filepath(self, username) -> str:
+        return "{}{}.json".format(self.cookies_dir, username)
+
+    def _write(self, filepath: str, content: bytes):
+        """Write [filepath] through a temporary file, replacing it in one go"""
+        if not os.path.exists(self.cookies_dir):
+            os.makedirs(self.cookies_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cookies_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def save(self, username: str, cookies: RequestsCookieJar, expires: float):
+        self._write(self._get_cookies_filepath(username), pickle.dumps(cookies))
+        try:
+            os.unlink(self._get_metadata_filepath(username))
+        except FileNotFoundError:
+            pass
+
+    def save_metadata(self, username: str, metadata: Dict):
+        self._write(
+            self._get_metadata_filepath(username), json.dumps(metadata).encode()
+        )
+
+    def load_metadata(self, username: str) -> Optional[Dict]:
+        try:
+            with open(self._get_metadata_filepath(username), "rb") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def load(self, username: str) -> Optional[Tuple[RequestsCookieJar, float]]:
         try:
-            with open(cookiejar_filepath, "rb") as f:
+            with open(self._get_cookies_filepath(username), "rb") as f:
                 cookies = pickle.load(f)
-                return cookies
         except FileNotFoundError:
             return None
+        return cookies, get_jsessionid_expiry(cookies)
+
+
+class SQLiteCookieStorage(CookieStorage):
+    """
+    Stores the cookie jars in a SQLite database, one row per username with its
+    JSESSIONID expiry in its own column.
+
+    SQLite locks the database file while writing, so any number of processes can
+    share it. Jars read from it are kept in a cache shared by every instance of
+    the same database in the process, for [cache_ttl] seconds; copies of the
+    cached jars are handed out. An in-memory database (":memory:") belongs to its
+    instance alone, and so does its cache.
+
+    :param path: Path of the SQLite database, defaults to ~/.linkedin_api/cookies.sqlite3
+    :type path: str, optional
+    :param cache_ttl: Number of seconds a jar read from the database is reused
+    :type cache_ttl: float, optional
+    """
+
+    # (path, username) -> (read_at, cookies, expires), shared by all instances
+    # but those of in-memory databases
+    _cache: Dict[Tuple[str, str], Tuple[float, RequestsCookieJar, float]] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, path: str = "", cache_ttl: float = 60, clock=time.monotonic):
+        self.path = path or os.path.join(
+            settings.LINKEDIN_API_USER_DIR, "cookies.sqlite3"
+        )
+        if self.path == ":memory:":
+            # each connection to ":memory:" opens a database of its own
+            self._cache = {}
+        else:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # wait for writers of other processes rather than failing
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cookies ("
+                "username TEXT PRIMARY KEY, jar BLOB NOT NULL, "
+                "jsessionid_expires REAL NOT NULL, updated_at REAL NOT NULL, "
+                "metadata TEXT)"
+            )
+            columns = [
+                row[1] for row in self._conn.execute("PRAGMA table_info(cookies)")
+            ]
+            if "metadata" not in columns:
+                self._conn.execute("ALTER TABLE cookies ADD COLUMN metadata TEXT")
+
+    def save(self, username: str, cookies: RequestsCookieJar, expires: float):
+        blob = pickle.dumps(cookies)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cookies "
+                "(username, jar, jsessionid_expires, updated_at) VALUES (?, ?, ?, ?)",
+                (username, blob, expires, time.time()),
+            )
+        with SQLiteCookieStorage._cache_lock:
+            self._cache[(self.path, username)] = (
+                self._clock(),
+                cookies.copy(),
+                expires,
+            )
+
+    def load(self, username: str) -> Optional[Tuple[RequestsCookieJar, float]]:
+        key = (self.path, username)
+        with SQLiteCookieStorage._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and self._clock() - entry[0] <= self.cache_ttl:
+            return entry[1].copy(), entry[2]
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT jar, jsessionid_expires FROM cookies WHERE username = ?",
+                (username,),
+            ).fetchone()
+        if row is None:
+            return None
+        cookies, expires = pickle.loads(row[0]), row[1]
+        with SQLiteCookieStorage._cache_lock:
+            self._cache[key] = (self._clock(), cookies, expires)
+        return cookies.copy(), expires
+
+    def save_metadata(self, username: str, metadata: Dict):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE cookies SET metadata = ? WHERE username = ?",
+                (json.dumps(metadata), username),
+            )
+
+    def load_metadata(self, username: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata FROM cookies WHERE username = ?", (username,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def get_expiry(self, username: str) -> Optional[float]:
+        """Return the JSESSIONID expiry of [username], without loading its jar"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT jsessionid_expires FROM cookies WHERE username = ?",
+                (username,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, username: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cookies WHERE username = ?", (username,))
+        with SQLiteCookieStorage._cache_lock:
+            self._cache.pop((self.path, username), None)
+
+
+class CookieRepository(object):
+    """
+    Class to act as a repository for the cookies.
+
+    :param cookies_dir: Directory of the cookie files, when using the default storage
+    :type cookies_dir: str, optional
+    :param storage: Storage backend, defaults to `FileCookieStorage(cookies_dir)`.
+        Use `SQLiteCookieStorage()` to share cookies between many processes.
+    :type storage: CookieStorage, optional
+    """
+
+    def __init__(
+        self,
+        cookies_dir=settings.COOKIE_PATH,
+        storage: Optional[CookieStorage] = None,
+    ):
+        self.cookies_dir = cookies_dir or settings.COOKIE_PATH
+        self.storage = storage or FileCookieStorage(self.cookies_dir)
+
+    def save(self, cookies, username):
+        self.storage.save(username, cookies, get_jsessionid_expiry(cookies))
+
+    def save_metadata(self, metadata: Dict, username: str):
+        self.storage.save_metadata(username, metadata)
+
+    def get_metadata(self, username: str) -> Optional[Dict]:
+        """Return the client metadata saved along with the cookies of [username]"""
+        return self.storage.load_metadata(username)
+
+    def get(self, username: str) -> Optional[RequestsCookieJar]:
+        stored = self.storage.load(username)
+        if stored is None:
+            return None
+        cookies, expires = stored
+        if cookies and not expires > time.time():
+            raise LinkedinSessionExpired
+
+        return cookies
 
     @staticmethod
     def _is_token_still_valid(cookiejar: RequestsCookieJar):
-        _now = time.time()
-        for cookie in cookiejar:
-            if cookie.name == "JSESSIONID" and cookie.value:
-                if cookie.expires and cookie.expires > _now:
-                    return True
-                break
-
-        return False
+        return get_jsessionid_expiry(cookiejar) > time.time()
@@ -0,0 +1,102 @@
+"""
+In-process cache of parsed Linkedin entities
+"""
+
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EntityCache(object):
+    """
+    Thread-safe LRU cache of parsed entities (profiles, companies, schools), bounded
+    in age and in total size.
+
+    Values are deep-copied on the way in and on the way out, so callers may freely
+    mutate what they get back.
+
+    :param ttl: Number of seconds an entry stays fresh
+    :type ttl: float, optional
+    :param max_bytes: Maximum total size of the entries, measured as JSON
+    :type max_bytes: int, optional
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60 * 60,
+        max_bytes: int = 16 * 1024 * 1024,
+        clock=time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (stored_at, size, value), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the entry [key], or None if it is missing or stale"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] > self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[2]
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any):
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self._clock(), size, value)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict:
+        """Return the number of entries, their size, and hit/miss/eviction counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,85 @@
+"""
+Persistent index of Linkedin profile identifiers
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+import linkedin_api.settings as settings
+
+logger = logging.getLogger(__name__)
+
+
+class IdentityIndex(object):
+    """
+    SQLite-backed, bidirectional index between profile public IDs (the `/in/<id>`
+    part of a profile URL) and profile URN IDs (`ACoAA...`).
+
+    `Linkedin` fills it in passively from every response carrying both identifiers,
+    and consults it before fetching a profile just to resolve one from the other.
+
+    :param path: Path of the SQLite database, defaults to ~/.linkedin_api/identities.sqlite3
+    :type path: str, optional
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = path or os.path.join(
+            settings.LINKEDIN_API_USER_DIR, "identities.sqlite3"
+        )
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS identities ("
+                "urn_id TEXT PRIMARY KEY, public_id TEXT NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS identities_public_id "
+                "ON identities (public_id)"
+            )
+
+    def add(self, public_id: str, urn_id: str):
+        self.add_many([(public_id, urn_id)])
+
+    def add_many(self, identities: Iterable[Tuple[str, str]]):
+        """Record (public_id, urn_id) pairs, replacing the public ID of known URN IDs"""
+        now = time.time()
+        rows = [(urn_id, public_id, now) for public_id, urn_id in identities]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO identities (urn_id, public_id, updated_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+        logger.debug(f"indexed {len(rows)} identities")
+
+    def get_urn_id(self, public_id: str) -> Optional[str]:
+        """Return the URN ID of the profile [public_id], if known"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT urn_id FROM identities WHERE public_id = ? "
+                "ORDER BY updated_at DESC LIMIT 1",
+                (public_id,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_public_id(self, urn_id: str) -> Optional[str]:
+        """Return the public ID of the profile [urn_id], if known"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT public_id FROM identities WHERE urn_id = ?", (urn_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM identities").fetchone()[0]
@@ -0,0 +1,432 @@
+"""
+Per-request instrumentation: the events sent to request hooks, an in-process
+aggregator of them, and exporters to Prometheus and OpenTelemetry
+"""
+
+import bisect
+import logging
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from linkedin_api.utils.helpers import get_endpoint_family, get_endpoint_template
+
+logger = logging.getLogger(__name__)
+
+
+class RequestEvent(object):
+    """
+    One request sent to Linkedin, as passed to the request hooks of `Linkedin`.
+
+    Each attempt of a retried request is an event of its own. Durations are in
+    seconds, sizes in bytes.
+
+    :param method: HTTP method
+    :param uri: URI of the request, relative to the API base URL
+    :param family: Endpoint family of the URI, see `get_endpoint_family()`
+    :param endpoint: Template of the URI, with its IDs left out, see `get_endpoint_template()`
+    :param status: Status of the response, None if the request failed
+    :param error: The error the request failed with, if any
+    :param attempt: Number of the attempt, 0 for the first one
+    :param latency: Time spent sending the request and receiving the response
+    :param wait: Time spent waiting before sending the request, for the rate
+        limiter, the random evade sleep or the backoff of a retry
+    :param decode: Time spent decoding the JSON body, None if it wasn't decoded.
+        Unless given, the body is only decoded when a hook first reads it.
+    :param bytes_in: Size of the response body
+    :param bytes_out: Size of the request body
+    """
+
+    __slots__ = (
+        "method",
+        "uri",
+        "family",
+        "endpoint",
+        "status",
+        "error",
+        "attempt",
+        "latency",
+        "wait",
+        "_decode",
+        "bytes_in",
+        "bytes_out",
+        "_response",
+        "_decoder",
+    )
+    _FIELDS = (
+        "method",
+        "uri",
+        "family",
+        "endpoint",
+        "status",
+        "error",
+        "attempt",
+        "latency",
+        "wait",
+        "decode",
+        "bytes_in",
+        "bytes_out",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        uri: str,
+        family: str,
+        endpoint: str,
+        status: Optional[int] = None,
+        error: Optional[Exception] = None,
+        attempt: int = 0,
+        latency: float = 0.0,
+        wait: float = 0.0,
+        decode: Optional[float] = None,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+    ):
+        self.method = method
+        self.uri = uri
+        self.family = family
+        self.endpoint = endpoint
+        self.status = status
+        self.error = error
+        self.attempt = attempt
+        self.latency = latency
+        self.wait = wait
+        self._decode = decode
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self._response = None
+        self._decoder = None
+
+    @property
+    def decode(self) -> Optional[float]:
+        # decoding is left to the first hook reading it, so hooks which only look at
+        # statuses and latencies don't have every body decoded for them
+        if self._decoder is not None:
+            response, decoder = self._response, self._decoder
+            self._response = self._decoder = None
+            start = perf_counter()
+            try:
+                decoder.decode(response)
+            except ValueError:
+                pass
+            self._decode = perf_counter() - start
+        return self._decode
+
+    @decode.setter
+    def decode(self, value: Optional[float]):
+        self._response = self._decoder = None
+        self._decode = value
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"RequestEvent({fields})"
+
+
+def build_event(
+    method: str,
+    uri: str,
+    res=None,
+    error: Optional[Exception] = None,
+    attempt: int = 0,
+    latency: float = 0.0,
+    wait: float = 0.0,
+    decoder=None,
+) -> RequestEvent:
+    """
+    Return the event of a request to [uri]. The response [res] is decoded with
+    [decoder], which caches the decoded body for its later use, and timed only
+    once a hook reads the `decode` of the event.
+
+    :param res: A requests or httpx response, None if the request failed
+    :param decoder: `JsonDecoder` of the client, the body isn't decoded without one
+    """
+    event = RequestEvent(
+        method,
+        uri,
+        get_endpoint_family(uri),
+        get_endpoint_template(uri),
+        error=error,
+        attempt=attempt,
+        latency=latency,
+        wait=wait,
+    )
+    if res is None:
+        return event
+
+    event.status = res.status_code
+    body = getattr(res.request, "body", None)
+    if body is None:
+        body = getattr(res.request, "content", None)
+    event.bytes_out = len(body) if body else 0
+    content = res.content
+    event.bytes_in = len(content)
+    if decoder is not None and content:
+        event._response = res
+        event._decoder = decoder
+    return event
+
+
+def emit(hooks: Iterable, event: RequestEvent):
+    """Pass [event] to each of [hooks], logging rather than raising their errors"""
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception(f"request hook {hook!r} failed")
+
+
+class _Histogram(object):
+    """Prometheus-style cumulative buckets, plus a window of the latest samples"""
+
+    def __init__(self, buckets: Tuple[float, ...], window: int):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.samples: deque = deque(maxlen=window)
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.samples.append(value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the [q]th percentile of the window, by nearest rank"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    def cumulative_counts(self) -> List[Tuple[str, int]]:
+        total = 0
+        counts = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            counts.append((_format_number(bound), total))
+        counts.append(("+Inf", self.count))
+        return counts
+
+
+class _FamilyMetrics(object):
+    def __init__(self, buckets: Tuple[float, ...], window: int):
+        # (method, status) -> number of requests, status is "error" for failures
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = _Histogram(buckets, window)
+        self.wait = _Histogram(buckets, window)
+        self.decode = _Histogram(buckets, window)
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class RequestMetrics(object):
+    """
+    Request hook aggregating the requests per endpoint family, in process.
+
+    Keeps the request counts per method and status, the bytes sent and received,
+    and histograms of the network latency, the rate limit wait and the decode
+    time. Percentiles are computed over the latest [window] samples of each
+    histogram. Pass it to `Linkedin(request_hooks=[...])`.
+
+    :param buckets: Upper bounds of the histogram buckets, in seconds
+    :type buckets: tuple, optional
+    :param window: Number of samples percentiles are computed over, per histogram
+    :type window: int, optional
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    HISTOGRAMS = ("latency", "wait", "decode")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window=1024):
+        self.buckets = tuple(sorted(buckets))
+        self.window = window
+        self._lock = threading.Lock()
+        self._families: Dict[str, _FamilyMetrics] = {}
+
+    def __call__(self, event: RequestEvent):
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            metrics = self._families.get(event.family)
+            if metrics is None:
+                metrics = _FamilyMetrics(self.buckets, self.window)
+                self._families[event.family] = metrics
+            key = (event.method, status)
+            metrics.requests[key] = metrics.requests.get(key, 0) + 1
+            metrics.bytes_in += event.bytes_in
+            metrics.bytes_out += event.bytes_out
+            if event.status is not None:
+                metrics.latency.observe(event.latency)
+            metrics.wait.observe(event.wait)
+            if event.decode is not None:
+                metrics.decode.observe(event.decode)
+
+    def percentiles(
+        self, family: str, metric: str = "latency", q: Iterable[float] = (50, 90, 99)
+    ) -> Dict[float, Optional[float]]:
+        """Return the percentiles [q] of [metric] ("latency", "wait" or "decode") for [family]"""
+        if metric not in RequestMetrics.HISTOGRAMS:
+            raise ValueError(f"Invalid metric: {metric}")
+        with self._lock:
+            metrics = self._families.get(family)
+            if metrics is None:
+                return {p: None for p in q}
+            histogram = getattr(metrics, metric)
+            return {p: histogram.percentile(p) for p in q}
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return the counters and the p50, p90 and p99 of each endpoint family"""
+        with self._lock:
+            stats = {}
+            for family, metrics in sorted(self._families.items()):
+                data = {
+                    "requests": sum(metrics.requests.values()),
+                    "errors": sum(
+                        n
+                        for (_, status), n in metrics.requests.items()
+                        if status == "error"
+                    ),
+                    "statuses": {
+                        f"{method} {status}": n
+                        for (method, status), n in sorted(metrics.requests.items())
+                    },
+                    "bytes_in": metrics.bytes_in,
+                    "bytes_out": metrics.bytes_out,
+                }
+                for name in RequestMetrics.HISTOGRAMS:
+                    histogram = getattr(metrics, name)
+                    data[name] = {
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "p50": histogram.percentile(50),
+                        "p90": histogram.percentile(90),
+                        "p99": histogram.percentile(99),
+                    }
+                stats[family] = data
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self._families.clear()
+
+    def to_prometheus(self, prefix: str = "linkedin_api") -> str:
+        """Return the metrics in the Prometheus text exposition format"""
+        lines = []
+
+        def header(name, kind, help):
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        with self._lock:
+            families = sorted(self._families.items())
+
+            header("requests_total", "counter", "Requests sent to the Linkedin API")
+            for family, metrics in families:
+                for (method, status), n in sorted(metrics.requests.items()):
+                    lines.append(
+                        f'{prefix}_requests_total{{family="{_escape(family)}",'
+                        f'method="{method}",status="{status}"}} {n}'
+                    )
+
+            for name, attr, help in (
+                ("response_bytes_total", "bytes_in", "Bytes of the response bodies"),
+                ("request_bytes_total", "bytes_out", "Bytes of the request bodies"),
+            ):
+                header(name, "counter", help)
+                for family, metrics in families:
+                    lines.append(
+                        f'{prefix}_{name}{{family="{_escape(family)}"}} '
+                        f"{getattr(metrics, attr)}"
+                    )
+
+            for name, attr, help in (
+                ("request_duration_seconds", "latency", "Network latency of requests"),
+                ("wait_seconds", "wait", "Time waited before sending requests"),
+                ("decode_seconds", "decode", "Time spent decoding response bodies"),
+            ):
+                header(name, "histogram", help)
+                for family, metrics in families:
+                    histogram = getattr(metrics, attr)
+                    label = f'family="{_escape(family)}"'
+                    for bound, count in histogram.cumulative_counts():
+                        lines.append(
+                            f'{prefix}_{name}_bucket{{{label},le="{bound}"}} {count}'
+                        )
+                    lines.append(f"{prefix}_{name}_sum{{{label}}} {histogram.sum}")
+                    lines.append(f"{prefix}_{name}_count{{{label}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _import_opentelemetry_metrics():
+    try:
+        from opentelemetry import metrics
+    except ImportError as e:
+        raise ImportError(
+            "OpenTelemetryHook requires opentelemetry-api. "
+            "Install it with `pip install opentelemetry-api`"
+        ) from e
+    return metrics
+
+
+class OpenTelemetryHook(object):
+    """
+    Request hook recording the requests with OpenTelemetry instruments, attributed
+    with their endpoint family, method and status.
+
+    Requires opentelemetry-api to be installed: `pip install opentelemetry-api`
+
+    :param meter: Meter to create the instruments with, defaults to the `linkedin_api`
+        meter of the global meter provider
+    :type meter: opentelemetry.metrics.Meter, optional
+    """
+
+    def __init__(self, meter=None):
+        if meter is None:
+            meter = _import_opentelemetry_metrics().get_meter("linkedin_api")
+        self.requests = meter.create_counter(
+            "linkedin_api.requests", description="Requests sent to the Linkedin API"
+        )
+        self.bytes_in = meter.create_counter(
+            "linkedin_api.response.size", unit="By", description="Bytes received"
+        )
+        self.bytes_out = meter.create_counter(
+            "linkedin_api.request.size", unit="By", description="Bytes sent"
+        )
+        self.latency = meter.create_histogram(
+            "linkedin_api.request.duration", unit="s", description="Network latency"
+        )
+        self.wait = meter.create_histogram(
+            "linkedin_api.request.wait",
+            unit="s",
+            description="Time waited before sending",
+        )
+        self.decode = meter.create_histogram(
+            "linkedin_api.response.decode", unit="s", description="Decode time"
+        )
+
+    def __call__(self, event: RequestEvent):
+        attributes = {
+            "family": event.family,
+            "endpoint": event.endpoint,
+            "method": event.method,
+            "status": str(event.status) if event.status is not None else "error",
+        }
+        self.requests.add(1, attributes)
+        self.bytes_in.add(event.bytes_in, attributes)
+        self.bytes_out.add(event.bytes_out, attributes)
+        if event.status is not None:
+            self.latency.record(event.latency, attributes)
+        self.wait.record(event.wait, attributes)
+        if event.decode is not None:
+            self.decode.record(event.decode, attributes)
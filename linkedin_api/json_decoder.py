@@ -0,0 +1,132 @@
+"""
+Decoding of JSON response bodies, with an optional faster backend
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# attribute of a response its decoded body is cached in
+_CACHE_ATTR = "_linkedin_api_json"
+
+
+def _orjson_loads():
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_loads():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(content):
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as e:
+            # callers expect the ValueError raised by json and orjson
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+BACKENDS = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": lambda: json.loads,
+}
+
+
+def get_backend(name: Optional[str] = None):
+    """Return (name, loads) of the JSON backend [name], or of the fastest one installed
+
+    :param name: One of "orjson", "msgspec" or "json"
+    :type name: str, optional
+    """
+    if name is not None:
+        return name, BACKENDS[name]()
+    for name in ("orjson", "msgspec"):
+        try:
+            return name, BACKENDS[name]()
+        except ImportError:
+            pass
+    return "json", json.loads
+
+
+class JsonDecoder(object):
+    """
+    Decodes response bodies once, caching the result on the response itself.
+
+    Uses orjson, or else msgspec, when installed (`pip install orjson`), and the
+    standard json module otherwise. Decoded data is shared by all the callers
+    decoding the same response: don't mutate it if the response is decoded again.
+
+    :param backend: JSON backend to use: "orjson", "msgspec" or "json".
+        Defaults to the fastest one installed
+    :type backend: str, optional
+    :param loads: Custom function decoding bytes, overriding [backend]
+    :type loads: function, optional
+    """
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        loads: Optional[Callable[[bytes], Any]] = None,
+    ):
+        if loads is not None:
+            self.backend = "custom"
+            self._loads = loads
+        else:
+            self.backend, self._loads = get_backend(backend)
+        self._lock = threading.Lock()
+        self.decodes = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def loads(self, content: bytes) -> Any:
+        """Decode [content], recording the time it took"""
+        start = time.perf_counter()
+        data = self._loads(content)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.decodes += 1
+            self.bytes += len(content)
+            self.seconds += elapsed
+        return data
+
+    def decode(self, response) -> Any:
+        """Return the decoded body of [response], decoding it on first use
+
+        :param response: A requests or httpx response
+        :raises ValueError: if the body isn't valid JSON
+        """
+        data = getattr(response, _CACHE_ATTR, _CACHE_ATTR)
+        if data is not _CACHE_ATTR:
+            with self._lock:
+                self.cache_hits += 1
+            return data
+        data = self.loads(response.content)
+        setattr(response, _CACHE_ATTR, data)
+        return data
+
+    @staticmethod
+    def forget(response):
+        """Drop the decoded body cached on [response], if any"""
+        response.__dict__.pop(_CACHE_ATTR, None)
+
+    def stats(self) -> Dict:
+        """Return the backend, and the number, size and total time of decodes"""
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "decodes": self.decodes,
+                "cache_hits": self.cache_hits,
+                "bytes": self.bytes,
+                "seconds": self.seconds,
+            }
@@ -2,26 +2,82 @@
 Provides linkedin api-related code
 """
 
+import copy
 import json
 import logging
 import random
-import uuid
-import re
-from operator import itemgetter
-from time import sleep
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from time import perf_counter, sleep
 from urllib.parse import urlencode, quote
-from typing import Dict, Union, Optional, List, Literal
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Union,
+    Optional,
+    List,
+    Literal,
+    Tuple,
+)
 
-from linkedin_api.client import Client
+import requests
+
+from linkedin_api.cookie_repository import CookieStorage
+from linkedin_api.client import Client, RateLimitedException
+from linkedin_api.entity_cache import EntityCache
+from linkedin_api.identity_index import IdentityIndex
+from linkedin_api.instrumentation import build_event, emit
+from linkedin_api.json_decoder import JsonDecoder
+from linkedin_api.models import (
+    Company,
+    Experience,
+    JobPosting,
+    PeopleSearchHit,
+    Profile,
+    typed_parser,
+)
+from linkedin_api.pagination import Page, PageIterator
+from linkedin_api.rate_limiter import RateLimiter
+from linkedin_api.retry import OK, THROTTLED, RetryPolicy, parse_retry_after
+from linkedin_api.transport import TransportConfig
+from linkedin_api.response_cache import (
+    CACHE_MODES,
+    CacheMissError,
+    ResponseCache,
+    build_response,
+)
+from linkedin_api.session_keeper import SessionKeeper
+from linkedin_api.session_pool import SessionPool
+from linkedin_api.single_flight import SingleFlight
+from linkedin_api.utils.normalized import NormalizedResponse
 from linkedin_api.utils.helpers import (
+    get_endpoint_family,
+    get_endpoint_template,
     get_id_from_urn,
-    get_urn_from_raw_update,
-    get_list_posts_sorted_without_promoted,
+    iter_posts_sorted_without_promoted,
     parse_list_raw_posts,
     parse_list_raw_urns,
+    split_profile_id,
     generate_trackingId,
     generate_trackingId_as_charString,
 )
+from linkedin_api.utils.parsers import (
+    is_error_payload,
+    parse_conversation_details,
+    parse_current_profile_views,
+    parse_identities,
+    parse_job_postings,
+    parse_paging_total,
+    parse_profile,
+    parse_profile_contact_info,
+    parse_profile_experiences,
+    parse_profile_skills,
+    parse_search_clusters,
+    parse_search_companies_item,
+    parse_search_people_item,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +90,13 @@ def default_evade():
     sleep(random.randint(2, 5))  # sleep a random duration to try and evade suspention
 
 
+def _share_response(res: requests.Response) -> requests.Response:
+    """Return a copy of [res] for another caller, with a body of its own to decode"""
+    res = copy.copy(res)
+    JsonDecoder.forget(res)
+    return res
+
+
 class Linkedin(object):
     """
     Class for accessing the LinkedIn API.
@@ -42,14 +105,69 @@ class Linkedin(object):
     :type username: str
     :param password: Password of LinkedIn account.
     :type password: str
+    :param transport_config: Connection pool, keep-alive and timeout settings
+    :type transport_config: TransportConfig, optional
+    :param cookie_storage: Where cached cookies are kept, defaults to one pickle file
+        per username in [cookies_dir]. See `SQLiteCookieStorage`.
+    :type cookie_storage: CookieStorage, optional
+    :param rate_limiter: Rate limiter used to pace requests instead of the default
+        random sleep. Use `RateLimiter.shared(username)` to share a budget between instances.
+    :type rate_limiter: RateLimiter, optional
+    :param response_cache: Cache of GET responses, with a TTL per endpoint family.
+        Cache hits skip the rate limiter (and the random sleep) entirely. Methods
+        called with cache="only" raise `CacheMissError` when nothing fresh is cached.
+    :type response_cache: ResponseCache, optional
+    :param entity_cache: In-memory cache of the profiles, companies and schools
+        returned by `get_profile`, `get_company` and `get_school`
+    :type entity_cache: EntityCache, optional
+    :param identity_index: Persistent index of profile public IDs and URN IDs, filled
+        in from responses and used to skip profile fetches made only to resolve one
+    :type identity_index: IdentityIndex, optional
+    :param session_pool: Pool of accounts to spread requests over, instead of this
+        instance's own account. Pass authenticate=False when using one. Better suited
+        to read-only workloads, since each request may be sent by a different account.
+    :type session_pool: SessionPool, optional
+    :param page_workers: Number of pages of a paginated collection to fetch concurrently,
+        once the first page has reported its total. Defaults to 1 (one page at a time).
+    :type page_workers: int, optional
+    :param retry_policy: How throttled (429, 999) and transient (5xx) responses are
+        retried. Throttling also slows down the rate limiter, if any. Retries are on
+        by default (`RetryPolicy()`, up to 3 retries), so a throttled request may take
+        a while to return; pass `RetryPolicy(max_retries=0)` to disable them. The last
+        response is returned once retries are exhausted, unless the policy is built
+        with raise_on_throttled=True.
+    :type retry_policy: RetryPolicy, optional
+    :param single_flight: Coalesces identical GET requests sent concurrently (by
+        several threads) into one. Defaults to `SingleFlight()`; pass False to disable it.
+    :type single_flight: SingleFlight, optional
+    :param json_decoder: Decoder of response bodies, which decodes each body once.
+        Defaults to `JsonDecoder()`, which uses orjson when it is installed.
+    :type json_decoder: JsonDecoder, optional
+    :param session_keeper: Refreshes the cookies of this instance in the background
+        before they expire, once authenticated with [username] and [password].
+        Call `session_keeper.start()` to run it.
+    :type session_keeper: SessionKeeper, optional
+    :param request_hooks: Called with a `RequestEvent` after each request sent, with
+        its endpoint family, status, latency, sizes, decode time and wait. See
+        `RequestMetrics` to aggregate them. Hooks can be added later with `add_request_hook()`.
+    :type request_hooks: list, optional
     """
 
     _MAX_POST_COUNT = 100  # max seems to be 100 posts per page
     _MAX_UPDATE_COUNT = 100  # max seems to be 100
+    _MAX_REACTION_COUNT = 100  # max seems to be 100
     _MAX_SEARCH_COUNT = 49  # max seems to be 49, and min seems to be 2
     _MAX_REPEATED_REQUESTS = (
         200  # VERY conservative max requests count to avoid rate-limit
     )
+    _PROFILE_BUNDLE_PARTS = (
+        "profile",
+        "contact_info",
+        "skills",
+        "network_info",
+        "member_badges",
+        "experiences",
+    )
 
     def __init__(
         self,
@@ -62,6 +180,19 @@ class Linkedin(object):
         proxies={},
         cookies=None,
         cookies_dir: str = "",
+        transport_config: Optional[TransportConfig] = None,
+        cookie_storage: Optional[CookieStorage] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        entity_cache: Optional[EntityCache] = None,
+        identity_index: Optional[IdentityIndex] = None,
+        session_pool: Optional[SessionPool] = None,
+        page_workers: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        single_flight: Optional[SingleFlight] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        session_keeper: Optional[SessionKeeper] = None,
+        request_hooks: Optional[List[Callable]] = None,
     ):
         """Constructor method"""
         self.client = Client(
@@ -69,9 +200,23 @@ class Linkedin(object):
             debug=debug,
             proxies=proxies,
             cookies_dir=cookies_dir,
+            transport_config=transport_config,
+            cookie_storage=cookie_storage,
         )
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
         self.logger = logger
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.entity_cache = entity_cache
+        self.identity_index = identity_index
+        self.session_pool = session_pool
+        self.page_workers = page_workers
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.single_flight = (
+            SingleFlight() if single_flight is None else single_flight or None
+        )
+        self.json_decoder = json_decoder or JsonDecoder()
+        self.request_hooks: List[Callable] = list(request_hooks or [])
 
         if authenticate:
             if cookies:
@@ -80,13 +225,193 @@ class Linkedin(object):
                 self.client._set_session_cookies(cookies)
             else:
                 self.client.authenticate(username, password)
+                if session_keeper is not None:
+                    session_keeper.add(self.client, username, password)
+
+    def add_request_hook(self, hook: Callable):
+        """Call [hook] with a `RequestEvent` after each request sent"""
+        self.request_hooks.append(hook)
+
+    def _evade(self, uri: str, evade=default_evade, rate_limiter=None):
+        """Delay a request to [uri], either through the rate limiter or [evade]"""
+        rate_limiter = rate_limiter or self.rate_limiter
+        if rate_limiter is not None and evade is default_evade:
+            rate_limiter.acquire(get_endpoint_family(uri))
+        else:
+            evade()
+
+    def _send(self, method: str, uri: str, url: str, evade=default_evade, **kwargs):
+        """Send a request to [url], retrying it according to the retry policy
+
+        :raises RateLimitedException: if the request is still throttled after all retries,
+            and the retry policy raises on throttling
+        """
+        family = get_endpoint_family(uri)
+        attempt = 0
+        # backoff slept before the current attempt
+        slept = 0.0
+        while True:
+            res, error, rate_limiter, waited, latency = self._send_once(
+                method, uri, url, evade, **kwargs
+            )
+            if self.request_hooks:
+                event = build_event(
+                    method,
+                    uri,
+                    res,
+                    error,
+                    attempt,
+                    latency,
+                    waited + slept,
+                    # streamed bodies are left for the caller to read
+                    None if kwargs.get("stream") else self.json_decoder,
+                )
+                emit(self.request_hooks, event)
+            outcome = self.retry_policy.classify(res, error)
+            retry = self.retry_policy.should_retry(method, outcome, attempt)
+            delay = self.retry_policy.get_delay(attempt, res) if retry else 0.0
+            # the rate limiter only paces requests sent with the default evade
+            paced = rate_limiter is not None and evade is default_evade
+            if rate_limiter is not None and outcome == OK:
+                rate_limiter.reward(family)
+            elif rate_limiter is not None and outcome == THROTTLED:
+                # also holds back every request sharing this budget, not just this one
+                rate_limiter.penalize(family, retry_after=delay if paced else 0.0)
+
+            if not retry:
+                if error is not None:
+                    raise error
+                if outcome == THROTTLED and self.retry_policy.raise_on_throttled:
+                    raise RateLimitedException(
+                        res.status_code,
+                        parse_retry_after(res.headers.get("Retry-After")),
+                    )
+                return res
+
+            self.logger.warning(
+                f"{method} {uri} {outcome} ({error or res.status_code}), "
+                f"retrying in {delay:.1f}s"
+            )
+            slept = 0.0
+            if not (paced and outcome == THROTTLED):
+                self.retry_policy.sleep(delay)
+                slept = delay
+            attempt += 1
+
+    def _send_once(self, method: str, uri: str, url: str, evade, **kwargs):
+        """Send a request to [url], through an account of the session pool if any
+
+        :return: The response or the transient error, the rate limiter used, and
+            the seconds spent waiting to send the request and then sending it
+        """
+        rate_limiter = self.rate_limiter
+        start = sent = perf_counter()
+        try:
+            if self.session_pool is None:
+                self._evade(uri, evade)
+                sent = perf_counter()
+                res = self.client.request(method, url, **kwargs)
+            else:
+                with self.session_pool.lease() as lease:
+                    rate_limiter = lease.account.rate_limiter
+                    self._evade(uri, evade, rate_limiter)
+                    sent = perf_counter()
+                    res = lease.account.client.request(method, url, **kwargs)
+                    lease.status_code = res.status_code
+            error = None
+        except RetryPolicy.TRANSIENT_EXCEPTIONS as e:
+            res, error = None, e
+        return res, error, rate_limiter, sent - start, perf_counter() - sent
+
+    def _fetch(
+        self, uri: str, evade=default_evade, base_request=False, cache=None, **kwargs
+    ):
+        """GET request to Linkedin API
 
-    def _fetch(self, uri: str, evade=default_evade, base_request=False, **kwargs):
-        """GET request to Linkedin API"""
-        evade()
+        :param cache: How to use the response cache: None to read and fill it,
+            "bypass" to ignore it, "refresh" to fetch and overwrite it,
+            "only" to never hit the network
+        :type cache: str, optional
+
+        :raises CacheMissError: with cache="only", if no fresh response is cached
+        """
+        if cache not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode: {cache}")
 
         url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.get(url, **kwargs)
+        ttl = 0
+        if self.response_cache is not None and cache != "bypass":
+            ttl = self.response_cache.get_ttl(
+                get_endpoint_family(uri), get_endpoint_template(uri)
+            )
+        if not ttl and cache == "only":
+            raise CacheMissError(f"GET {url} isn't cached")
+        if not ttl and (self.single_flight is None or kwargs.get("stream")):
+            return self._send("GET", uri, url, evade, **kwargs)
+
+        full_url = (
+            requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        )
+        accept = (kwargs.get("headers") or {}).get(
+            "accept", self.client.session.headers.get("accept")
+        )
+        key = ResponseCache.make_key(full_url, accept)
+
+        if ttl and cache != "refresh":
+            hit = self.response_cache.get(key, ttl)
+            if hit is not None:
+                # cache hits don't count against the rate limit
+                return build_response(full_url, *hit)
+        if cache == "only":
+            raise CacheMissError(f"GET {full_url} isn't cached")
+
+        def fetch():
+            res = self._send("GET", uri, url, evade, **kwargs)
+            if ttl and res.status_code == 200:
+                self._store_response(key, full_url, res)
+            return res
+
+        if self.single_flight is None or kwargs.get("stream"):
+            return fetch()
+        # identical requests already in flight are waited for instead of sent again
+        return self.single_flight.do(key, fetch, share=_share_response)
+
+    def _store_response(self, key: str, full_url: str, res: requests.Response):
+        """Store a successful response in the response cache, unless it is an error"""
+        try:
+            cacheable = not is_error_payload(self._json(res))
+        except ValueError:
+            cacheable = True
+        if cacheable:
+            self.response_cache.set(
+                key,
+                full_url,
+                res.status_code,
+                {"content-type": res.headers.get("content-type", "")},
+                res.content,
+            )
+
+    def _json(self, res):
+        """Return the decoded body of [res], decoded only once however often it is asked for"""
+        return self.json_decoder.decode(res)
+
+    def _get_entity(self, key, fetch, cache=None):
+        """Return the entity [key] from the entity cache, or [fetch] and cache it"""
+        if self.entity_cache is None or cache == "bypass":
+            return fetch()
+        if cache != "refresh":
+            entity = self.entity_cache.get(key)
+            if entity is not None:
+                return entity
+        entity = fetch()
+        if entity:
+            self.entity_cache.set(key, entity)
+        return entity
+
+    def _index_identities(self, data):
+        """Record the profile identifiers found in [data] in the identity index"""
+        if self.identity_index is not None:
+            self.identity_index.add_many(parse_identities(data))
 
     def _cookies(self):
         """Return client cookies"""
@@ -98,10 +423,65 @@ class Linkedin(object):
 
     def _post(self, uri: str, evade=default_evade, base_request=False, **kwargs):
         """POST request to Linkedin API"""
-        evade()
-
         url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.post(url, **kwargs)
+        return self._send("POST", uri, url, evade, **kwargs)
+
+    def iter_profile_posts(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        limit=-1,
+    ) -> PageIterator:
+        """Get profile posts, yielding them as each page arrives.
+
+        :param public_id: LinkedIn public ID for a profile
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a profile
+        :type urn_id: str, optional
+        :param limit: Maximum number of posts, defaults to -1 (no limit)
+        :type limit: int, optional
+        :return: Iterator of posts
+        :rtype: PageIterator
+        """
+        if not urn_id and self.identity_index is not None:
+            urn_id = self.identity_index.get_urn_id(public_id)
+        if urn_id:
+            profile_urn = f"urn:li:fsd_profile:{urn_id}"
+        else:
+            profile = self.get_profile(public_id=public_id)
+            profile_urn = profile["profile_urn"].replace(
+                "fs_miniProfile", "fsd_profile"
+            )
+
+        def fetch_page(cursor, count):
+            url_params = {
+                "count": count,
+                "start": cursor.start,
+                "q": "memberShareFeed",
+                "moduleKey": "member-shares:phone",
+                "includeLongTermHistory": True,
+                "profileUrn": profile_urn,
+            }
+            if cursor.pagination_token:
+                url_params["paginationToken"] = cursor.pagination_token
+            res = self._fetch(f"/identity/profileUpdatesV2", params=url_params)
+            data = self._json(res)
+            if is_error_payload(data):
+                self.logger.info("request failed: {}".format(data["message"]))
+                return Page([], failed=True)
+            pagination_token = data["metadata"].get("paginationToken")
+            return Page(
+                data["elements"],
+                pagination_token=pagination_token,
+                last=not pagination_token,
+            )
+
+        return PageIterator(
+            fetch_page,
+            limit=limit,
+            page_size=self._MAX_POST_COUNT,
+            max_requests=self._MAX_REPEATED_REQUESTS,
+        )
 
     def get_profile_posts(
         self,
@@ -121,42 +501,53 @@ class Linkedin(object):
         :return: List of posts
         :rtype: list
         """
-        url_params = {
-            "count": min(post_count, self._MAX_POST_COUNT),
-            "start": 0,
-            "q": "memberShareFeed",
-            "moduleKey": "member-shares:phone",
-            "includeLongTermHistory": True,
-        }
-        if urn_id:
-            profile_urn = f"urn:li:fsd_profile:{urn_id}"
-        else:
-            profile = self.get_profile(public_id=public_id)
-            profile_urn = profile["profile_urn"].replace(
-                "fs_miniProfile", "fsd_profile"
-            )
-        url_params["profileUrn"] = profile_urn
-        url = f"/identity/profileUpdatesV2"
-        res = self._fetch(url, params=url_params)
-        data = res.json()
-        if data and "status" in data and data["status"] != 200:
-            self.logger.info("request failed: {}".format(data["message"]))
+        posts = self.iter_profile_posts(public_id, urn_id, limit=post_count)
+        results = list(posts)
+        if posts.failed and not results:
             return [{}]
-        while (
-            data
-            and "paginationToken" in data["metadata"]
-            and data["metadata"]["paginationToken"] != ""
-        ):
-            if len(data["elements"]) >= post_count:
-                break
-            pagination_token = data["metadata"]["paginationToken"]
-            url_params["start"] = url_params["start"] + self._MAX_POST_COUNT
-            url_params["paginationToken"] = pagination_token
-            res = self._fetch(url, params=url_params)
-            data["metadata"] = res.json()["metadata"]
-            data["elements"] = data["elements"] + res.json()["elements"]
-            data["paging"] = res.json()["paging"]
-        return data["elements"]
+        return results
+
+    def iter_post_comments(self, post_urn: str, limit=-1) -> PageIterator:
+        """Get post comments, yielding them as each page arrives.
+
+        :param post_urn: Post URN
+        :type post_urn: str
+        :param limit: Maximum number of comments, defaults to -1 (no limit)
+        :type limit: int, optional
+        :return: Iterator of post comments
+        :rtype: PageIterator
+        """
+
+        def fetch_page(cursor, count):
+            url_params = {
+                "count": count,
+                "start": cursor.start,
+                "q": "comments",
+                "sortOrder": "RELEVANCE",
+                "updateId": "activity:" + post_urn,
+            }
+            if cursor.pagination_token:
+                url_params["paginationToken"] = cursor.pagination_token
+            res = self._fetch(f"/feed/comments", params=url_params)
+            data = self._json(res)
+            if is_error_payload(data):
+                self.logger.info("request failed: {}".format(data["status"]))
+                return Page([], failed=True)
+            # When the number of comments exceed total available
+            # comments, the api starts returning an empty list of elements
+            pagination_token = data["metadata"].get("paginationToken")
+            return Page(
+                data["elements"],
+                pagination_token=pagination_token,
+                last=not pagination_token,
+            )
+
+        return PageIterator(
+            fetch_page,
+            limit=limit,
+            page_size=self._MAX_POST_COUNT,
+            max_requests=self._MAX_REPEATED_REQUESTS,
+        )
 
     def get_post_comments(self, post_urn: str, comment_count=100) -> List:
         """
@@ -169,44 +560,80 @@ class Linkedin(object):
         :return: List of post comments
         :rtype: list
         """
-        url_params = {
-            "count": min(comment_count, self._MAX_POST_COUNT),
-            "start": 0,
-            "q": "comments",
-            "sortOrder": "RELEVANCE",
-        }
-        url = f"/feed/comments"
-        url_params["updateId"] = "activity:" + post_urn
-        res = self._fetch(url, params=url_params)
-        data = res.json()
-        if data and "status" in data and data["status"] != 200:
-            self.logger.info("request failed: {}".format(data["status"]))
+        comments = self.iter_post_comments(post_urn, limit=comment_count)
+        results = list(comments)
+        if comments.failed and not results:
             return [{}]
-        while (
-            data
-            and "paginationToken" in data["metadata"]
-            and data["metadata"]["paginationToken"] != ""
-        ):
-            if len(data["elements"]) >= comment_count:
-                break
-            pagination_token = data["metadata"]["paginationToken"]
-            url_params["start"] = url_params["start"] + self._MAX_POST_COUNT
-            url_params["count"] = self._MAX_POST_COUNT
-            url_params["paginationToken"] = pagination_token
-            res = self._fetch(url, params=url_params)
-            if res.json() and "status" in res.json() and res.json()["status"] != 200:
-                self.logger.info("request failed: {}".format(data["status"]))
-                return [{}]
-            data["metadata"] = res.json()["metadata"]
-            """ When the number of comments exceed total available 
-            comments, the api starts returning an empty list of elements"""
-            if res.json()["elements"] and len(res.json()["elements"]) == 0:
-                break
-            if data["elements"] and len(res.json()["elements"]) == 0:
-                break
-            data["elements"] = data["elements"] + res.json()["elements"]
-            data["paging"] = res.json()["paging"]
-        return data["elements"]
+        return results
+
+    @staticmethod
+    def _search_uri(params: Dict, start: int, count: int) -> str:
+        """Return the URI of one page of a LinkedIn search"""
+        default_params = {
+            "count": str(count),
+            "filters": "List()",
+            "origin": "GLOBAL_SEARCH_HEADER",
+            "q": "all",
+            "start": start,
+            "queryContext": "List(spellCorrectionEnabled->true,relatedSearchesEnabled->true,kcardTypes->PROFILE|COMPANY)",
+            "includeWebMetadata": "true",
+        }
+        default_params.update(params)
+
+        keywords = (
+            f"keywords:{default_params['keywords']},"
+            if "keywords" in default_params
+            else ""
+        )
+
+        return (
+            f"/graphql?variables=(start:{default_params['start']},origin:{default_params['origin']},"
+            f"query:("
+            f"{keywords}"
+            f"flagshipSearchIntent:SEARCH_SRP,"
+            f"queryParameters:{default_params['filters']},"
+            f"includeFiltersInResponse:false))&queryId=voyagerSearchDashClusters"
+            f".b0928897b71bd00a5a7291755dcd64f0"
+        )
+
+    def _iter_search(
+        self, params: Dict, limit=-1, offset=0, parse_item=None
+    ) -> PageIterator:
+        """Return a lazy iterator over search results, see Linkedin.iter_search()"""
+
+        def fetch_page(cursor, count):
+            res = self._fetch(self._search_uri(params, start=cursor.start, count=count))
+            data = self._json(res)
+            self._index_identities(data)
+            return Page(parse_search_clusters(data), total=parse_paging_total(data))
+
+        return PageIterator(
+            fetch_page,
+            offset=offset,
+            limit=limit,
+            page_size=Linkedin._MAX_SEARCH_COUNT,
+            max_requests=Linkedin._MAX_REPEATED_REQUESTS,
+            parse_item=parse_item,
+            workers=self.page_workers,
+        )
+
+    def iter_search(self, params: Dict, limit=-1, offset=0) -> PageIterator:
+        """Perform a LinkedIn search, yielding results as each page arrives.
+
+        Pages are only fetched as the results are consumed. The iterator's `cursor`
+        can be passed to its `resume()` method to continue the search later.
+
+        :param params: Search parameters (see code)
+        :type params: dict
+        :param limit: Maximum number of results, defaults to -1 (no limit)
+        :type limit: int, optional
+        :param offset: Index to start searching from
+        :type offset: int, optional
+
+        :return: Iterator of search results
+        :rtype: PageIterator
+        """
+        return self._iter_search(params, limit=limit, offset=offset)
 
     def search(self, params: Dict, limit=-1, offset=0) -> List:
         """Perform a LinkedIn search.
@@ -222,93 +649,84 @@ class Linkedin(object):
         :return: List of search results
         :rtype: list
         """
-        count = Linkedin._MAX_SEARCH_COUNT
-        if limit is None:
-            limit = -1
+        return list(self.iter_search(params, limit=limit, offset=offset))
 
-        results = []
-        while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "count": str(count),
-                "filters": "List()",
-                "origin": "GLOBAL_SEARCH_HEADER",
-                "q": "all",
-                "start": len(results) + offset,
-                "queryContext": "List(spellCorrectionEnabled->true,relatedSearchesEnabled->true,kcardTypes->PROFILE|COMPANY)",
-                "includeWebMetadata": "true",
-            }
-            default_params.update(params)
+    @staticmethod
+    def _search_people_params(
+        keywords: Optional[str] = None,
+        connection_of: Optional[str] = None,
+        network_depths: Optional[
+            List[Union[Literal["F"], Literal["S"], Literal["O"]]]
+        ] = None,
+        current_company: Optional[List[str]] = None,
+        past_companies: Optional[List[str]] = None,
+        nonprofit_interests: Optional[List[str]] = None,
+        profile_languages: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        schools: Optional[List[str]] = None,
+        contact_interests: Optional[List[str]] = None,
+        service_categories: Optional[List[str]] = None,
+        keyword_first_name: Optional[str] = None,
+        keyword_last_name: Optional[str] = None,
+        keyword_title: Optional[str] = None,
+        keyword_company: Optional[str] = None,
+        keyword_school: Optional[str] = None,
+        network_depth: Optional[Union[Literal["F"], Literal["S"], Literal["O"]]] = None,
+        title: Optional[str] = None,
+    ) -> Dict:
+        """Return the search parameters of a people search. See Linkedin.search_people()"""
+        filters = ["(key:resultType,value:List(PEOPLE))"]
+        if connection_of:
+            filters.append(f"(key:connectionOf,value:List({connection_of}))")
+        if network_depths:
+            stringify = " | ".join(network_depths)
+            filters.append(f"(key:network,value:List({stringify}))")
+        elif network_depth:
+            filters.append(f"(key:network,value:List({network_depth}))")
+        if regions:
+            stringify = " | ".join(regions)
+            filters.append(f"(key:geoUrn,value:List({stringify}))")
+        if industries:
+            stringify = " | ".join(industries)
+            filters.append(f"(key:industry,value:List({stringify}))")
+        if current_company:
+            stringify = " | ".join(current_company)
+            filters.append(f"(key:currentCompany,value:List({stringify}))")
+        if past_companies:
+            stringify = " | ".join(past_companies)
+            filters.append(f"(key:pastCompany,value:List({stringify}))")
+        if profile_languages:
+            stringify = " | ".join(profile_languages)
+            filters.append(f"(key:profileLanguage,value:List({stringify}))")
+        if nonprofit_interests:
+            stringify = " | ".join(nonprofit_interests)
+            filters.append(f"(key:nonprofitInterest,value:List({stringify}))")
+        if schools:
+            stringify = " | ".join(schools)
+            filters.append(f"(key:schools,value:List({stringify}))")
+        if service_categories:
+            stringify = " | ".join(service_categories)
+            filters.append(f"(key:serviceCategory,value:List({stringify}))")
+        # `Keywords` filter
+        keyword_title = keyword_title if keyword_title else title
+        if keyword_first_name:
+            filters.append(f"(key:firstName,value:List({keyword_first_name}))")
+        if keyword_last_name:
+            filters.append(f"(key:lastName,value:List({keyword_last_name}))")
+        if keyword_title:
+            filters.append(f"(key:title,value:List({keyword_title}))")
+        if keyword_company:
+            filters.append(f"(key:company,value:List({keyword_company}))")
+        if keyword_school:
+            filters.append(f"(key:school,value:List({keyword_school}))")
 
-            keywords = (
-                f"keywords:{default_params['keywords']},"
-                if "keywords" in default_params
-                else ""
-            )
+        params = {"filters": "List({})".format(",".join(filters))}
 
-            res = self._fetch(
-                f"/graphql?variables=(start:{default_params['start']},origin:{default_params['origin']},"
-                f"query:("
-                f"{keywords}"
-                f"flagshipSearchIntent:SEARCH_SRP,"
-                f"queryParameters:{default_params['filters']},"
-                f"includeFiltersInResponse:false))&queryId=voyagerSearchDashClusters"
-                f".b0928897b71bd00a5a7291755dcd64f0"
-            )
-            data = res.json()
-
-            data_clusters = data.get("data", {}).get("searchDashClustersByAll", [])
-
-            if not data_clusters:
-                return []
-
-            if (
-                not data_clusters.get("_type", [])
-                == "com.linkedin.restli.common.CollectionResponse"
-            ):
-                return []
-
-            new_elements = []
-            for it in data_clusters.get("elements", []):
-                if (
-                    not it.get("_type", [])
-                    == "com.linkedin.voyager.dash.search.SearchClusterViewModel"
-                ):
-                    continue
-
-                for el in it.get("items", []):
-                    if (
-                        not el.get("_type", [])
-                        == "com.linkedin.voyager.dash.search.SearchItem"
-                    ):
-                        continue
-
-                    e = el.get("item", {}).get("entityResult", [])
-                    if not e:
-                        continue
-                    if (
-                        not e.get("_type", [])
-                        == "com.linkedin.voyager.dash.search.EntityResultViewModel"
-                    ):
-                        continue
-                    new_elements.append(e)
-
-            results.extend(new_elements)
-
-            # break the loop if we're done searching
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
-            if (
-                (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(new_elements) == 0:
-                break
-
-            self.logger.debug(f"results grew to {len(results)}")
+        if keywords:
+            params["keywords"] = keywords
 
-        return results
+        return params
 
     def search_people(
         self,
@@ -338,6 +756,7 @@ class Linkedin(object):
             Union[Literal["F"], Literal["S"], Literal["O"]]
         ] = None,  # DEPRECATED - use network_depths
         title: Optional[str] = None,  # DEPRECATED - use keyword_title
+        typed=False,
         **kwargs,
     ) -> List[Dict]:
         """Perform a LinkedIn search for people.
@@ -380,123 +799,204 @@ class Linkedin(object):
         :type connection_of: str, optional
         :param limit: Maximum length of the returned list, defaults to -1 (no limit)
         :type limit: int, optional
+        :param typed: Return `PeopleSearchHit` records instead of dicts
+        :type typed: boolean, optional
 
         :return: List of profiles (minimal data only)
         :rtype: list
         """
-        filters = ["(key:resultType,value:List(PEOPLE))"]
-        if connection_of:
-            filters.append(f"(key:connectionOf,value:List({connection_of}))")
-        if network_depths:
-            stringify = " | ".join(network_depths)
-            filters.append(f"(key:network,value:List({stringify}))")
-        elif network_depth:
-            filters.append(f"(key:network,value:List({network_depth}))")
-        if regions:
-            stringify = " | ".join(regions)
-            filters.append(f"(key:geoUrn,value:List({stringify}))")
-        if industries:
-            stringify = " | ".join(industries)
-            filters.append(f"(key:industry,value:List({stringify}))")
-        if current_company:
-            stringify = " | ".join(current_company)
-            filters.append(f"(key:currentCompany,value:List({stringify}))")
-        if past_companies:
-            stringify = " | ".join(past_companies)
-            filters.append(f"(key:pastCompany,value:List({stringify}))")
-        if profile_languages:
-            stringify = " | ".join(profile_languages)
-            filters.append(f"(key:profileLanguage,value:List({stringify}))")
-        if nonprofit_interests:
-            stringify = " | ".join(nonprofit_interests)
-            filters.append(f"(key:nonprofitInterest,value:List({stringify}))")
-        if schools:
-            stringify = " | ".join(schools)
-            filters.append(f"(key:schools,value:List({stringify}))")
-        if service_categories:
-            stringify = " | ".join(service_categories)
-            filters.append(f"(key:serviceCategory,value:List({stringify}))")
-        # `Keywords` filter
-        keyword_title = keyword_title if keyword_title else title
-        if keyword_first_name:
-            filters.append(f"(key:firstName,value:List({keyword_first_name}))")
-        if keyword_last_name:
-            filters.append(f"(key:lastName,value:List({keyword_last_name}))")
-        if keyword_title:
-            filters.append(f"(key:title,value:List({keyword_title}))")
-        if keyword_company:
-            filters.append(f"(key:company,value:List({keyword_company}))")
-        if keyword_school:
-            filters.append(f"(key:school,value:List({keyword_school}))")
+        params = self._search_people_params(
+            keywords=keywords,
+            connection_of=connection_of,
+            network_depths=network_depths,
+            current_company=current_company,
+            past_companies=past_companies,
+            nonprofit_interests=nonprofit_interests,
+            profile_languages=profile_languages,
+            regions=regions,
+            industries=industries,
+            schools=schools,
+            contact_interests=contact_interests,
+            service_categories=service_categories,
+            keyword_first_name=keyword_first_name,
+            keyword_last_name=keyword_last_name,
+            keyword_title=keyword_title,
+            keyword_company=keyword_company,
+            keyword_school=keyword_school,
+            network_depth=network_depth,
+            title=title,
+        )
 
-        params = {"filters": "List({})".format(",".join(filters))}
+        parse_item = partial(
+            parse_search_people_item, include_private_profiles=include_private_profiles
+        )
+        if typed:
+            parse_item = typed_parser(parse_item, PeopleSearchHit)
+        return list(self._iter_search(params, parse_item=parse_item, **kwargs))
 
-        if keywords:
-            params["keywords"] = keywords
+    def iter_search_people(
+        self,
+        keywords: Optional[str] = None,
+        *,
+        include_private_profiles=False,
+        limit=-1,
+        offset=0,
+        typed=False,
+        **filters,
+    ) -> PageIterator:
+        """Perform a LinkedIn search for people, yielding profiles as each page arrives.
 
-        data = self.search(params, **kwargs)
+        Accepts the same filters as Linkedin.search_people(), by keyword past [keywords].
+        See Linkedin.iter_search() for resuming.
 
-        results = []
-        for item in data:
-            if (
-                not include_private_profiles
-                and (item.get("entityCustomTrackingInfo") or {}).get(
-                    "memberDistance", None
-                )
-                == "OUT_OF_NETWORK"
-            ):
-                continue
-            results.append(
-                {
-                    "urn_id": get_id_from_urn(
-                        get_urn_from_raw_update(item.get("entityUrn", None))
-                    ),
-                    "distance": (item.get("entityCustomTrackingInfo") or {}).get(
-                        "memberDistance", None
-                    ),
-                    "jobtitle": (item.get("primarySubtitle") or {}).get("text", None),
-                    "location": (item.get("secondarySubtitle") or {}).get("text", None),
-                    "name": (item.get("title") or {}).get("text", None),
-                }
-            )
+        :return: Iterator of profiles (minimal data only)
+        :rtype: PageIterator
+        """
+        parse_item = partial(
+            parse_search_people_item, include_private_profiles=include_private_profiles
+        )
+        if typed:
+            parse_item = typed_parser(parse_item, PeopleSearchHit)
+        return self._iter_search(
+            self._search_people_params(keywords=keywords, **filters),
+            limit=limit,
+            offset=offset,
+            parse_item=parse_item,
+        )
 
-        return results
+    @staticmethod
+    def _search_companies_params(keywords: Optional[List[str]] = None) -> Dict:
+        """Return the search parameters of a company search. See Linkedin.search_companies()"""
+        filters = ["(key:resultType,value:List(COMPANIES))"]
+
+        params: Dict[str, Union[str, List[str]]] = {
+            "filters": "List({})".format(",".join(filters)),
+            "queryContext": "List(spellCorrectionEnabled->true)",
+        }
+
+        if keywords:
+            params["keywords"] = keywords
+
+        return params
 
-    def search_companies(self, keywords: Optional[List[str]] = None, **kwargs) -> List:
+    def search_companies(
+        self, keywords: Optional[List[str]] = None, typed=False, **kwargs
+    ) -> List:
         """Perform a LinkedIn search for companies.
 
         :param keywords: A list of search keywords (str)
         :type keywords: list, optional
+        :param typed: Return `Company` records instead of dicts
+        :type typed: boolean, optional
 
         :return: List of companies
         :rtype: list
         """
-        filters = ["(key:resultType,value:List(COMPANIES))"]
+        return list(self.iter_search_companies(keywords, typed=typed, **kwargs))
 
-        params: Dict[str, Union[str, List[str]]] = {
-            "filters": "List({})".format(",".join(filters)),
-            "queryContext": "List(spellCorrectionEnabled->true)",
-        }
+    def iter_search_companies(
+        self, keywords: Optional[List[str]] = None, limit=-1, offset=0, typed=False
+    ) -> PageIterator:
+        """Perform a LinkedIn search for companies, yielding companies as each page arrives.
+
+        See Linkedin.iter_search() for resuming.
+
+        :param keywords: A list of search keywords (str)
+        :type keywords: list, optional
+
+        :return: Iterator of companies
+        :rtype: PageIterator
+        """
+        return self._iter_search(
+            self._search_companies_params(keywords),
+            limit=limit,
+            offset=offset,
+            parse_item=(
+                typed_parser(parse_search_companies_item, Company)
+                if typed
+                else parse_search_companies_item
+            ),
+        )
 
+    @staticmethod
+    def _search_jobs_query(
+        keywords: Optional[str] = None,
+        companies: Optional[List[str]] = None,
+        experience: Optional[List[str]] = None,
+        job_type: Optional[List[str]] = None,
+        job_title: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        location_name: Optional[str] = None,
+        remote: Optional[List[str]] = None,
+        listed_at=24 * 60 * 60,
+        distance: Optional[int] = None,
+    ) -> str:
+        """Return the `query` parameter of a job search. See Linkedin.search_jobs()"""
+        query: Dict[str, Union[str, Dict[str, str]]] = {
+            "origin": "JOB_SEARCH_PAGE_QUERY_EXPANSION"
+        }
         if keywords:
-            params["keywords"] = keywords
+            query["keywords"] = "KEYWORD_PLACEHOLDER"
+        if location_name:
+            query["locationFallback"] = "LOCATION_PLACEHOLDER"
 
-        data = self.search(params, **kwargs)
-
-        results = []
-        for item in data:
-            if "company" not in item.get("trackingUrn"):
-                continue
-            results.append(
-                {
-                    "urn_id": get_id_from_urn(item.get("trackingUrn", None)),
-                    "name": (item.get("title") or {}).get("text", None),
-                    "headline": (item.get("primarySubtitle") or {}).get("text", None),
-                    "subline": (item.get("secondarySubtitle") or {}).get("text", None),
-                }
-            )
+        # In selectedFilters()
+        query["selectedFilters"] = {}
+        if companies:
+            query["selectedFilters"]["company"] = f"List({','.join(companies)})"
+        if experience:
+            query["selectedFilters"]["experience"] = f"List({','.join(experience)})"
+        if job_type:
+            query["selectedFilters"]["jobType"] = f"List({','.join(job_type)})"
+        if job_title:
+            query["selectedFilters"]["title"] = f"List({','.join(job_title)})"
+        if industries:
+            query["selectedFilters"]["industry"] = f"List({','.join(industries)})"
+        if distance:
+            query["selectedFilters"]["distance"] = f"List({distance})"
+        if remote:
+            query["selectedFilters"]["workplaceType"] = f"List({','.join(remote)})"
 
-        return results
+        query["selectedFilters"]["timePostedRange"] = f"List(r{listed_at})"
+        query["spellCorrectionEnabled"] = "true"
+
+        # Query structure:
+        # "(
+        #    origin:JOB_SEARCH_PAGE_QUERY_EXPANSION,
+        #    keywords:marketing%20manager,
+        #    locationFallback:germany,
+        #    selectedFilters:(
+        #        distance:List(25),
+        #        company:List(163253),
+        #        salaryBucketV2:List(5),
+        #        timePostedRange:List(r2592000),
+        #        workplaceType:List(1)
+        #    ),
+        #    spellCorrectionEnabled:true
+        #  )"
+
+        query_string = (
+            str(query)
+            .replace(" ", "")
+            .replace("'", "")
+            .replace("KEYWORD_PLACEHOLDER", keywords or "")
+            .replace("LOCATION_PLACEHOLDER", location_name or "")
+            .replace("{", "(")
+            .replace("}", ")")
+        )
+        return query_string
+
+    @staticmethod
+    def _search_jobs_uri(query_string: str, start: int, count: int) -> str:
+        """Return the URI of one page of a job search"""
+        default_params = {
+            "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
+            "count": count,
+            "q": "jobSearch",
+            "query": query_string,
+            "start": start,
+        }
+        return f"/voyagerJobsDashJobCards?{urlencode(default_params, safe='(),:')}"
 
     def search_jobs(
         self,
@@ -535,6 +1035,7 @@ class Linkedin(object):
         distance: Optional[int] = None,
         limit=-1,
         offset=0,
+        typed=False,
         **kwargs,
     ) -> List[Dict]:
         """Perform a LinkedIn search for jobs.
@@ -558,113 +1059,73 @@ class Linkedin(object):
         :param listed_at: maximum number of seconds passed since job posting. 86400 will filter job postings posted in last 24 hours.
         :type listed_at: int/str, optional. Default value is equal to 24 hours.
         :param distance: maximum distance from location in miles
-        :type distance: int/str, optional. If not specified, None or 0, the default value of 25 miles applied.
-        :param limit: maximum number of results obtained from API queries. -1 means maximum which is defined by constants and is equal to 1000 now.
-        :type limit: int, optional, default -1
-        :param offset: indicates how many search results shall be skipped
-        :type offset: int, optional
-        :return: List of jobs
-        :rtype: list
-        """
-        count = Linkedin._MAX_SEARCH_COUNT
-        if limit is None:
-            limit = -1
-
-        query: Dict[str, Union[str, Dict[str, str]]] = {
-            "origin": "JOB_SEARCH_PAGE_QUERY_EXPANSION"
-        }
-        if keywords:
-            query["keywords"] = "KEYWORD_PLACEHOLDER"
-        if location_name:
-            query["locationFallback"] = "LOCATION_PLACEHOLDER"
-
-        # In selectedFilters()
-        query["selectedFilters"] = {}
-        if companies:
-            query["selectedFilters"]["company"] = f"List({','.join(companies)})"
-        if experience:
-            query["selectedFilters"]["experience"] = f"List({','.join(experience)})"
-        if job_type:
-            query["selectedFilters"]["jobType"] = f"List({','.join(job_type)})"
-        if job_title:
-            query["selectedFilters"]["title"] = f"List({','.join(job_title)})"
-        if industries:
-            query["selectedFilters"]["industry"] = f"List({','.join(industries)})"
-        if distance:
-            query["selectedFilters"]["distance"] = f"List({distance})"
-        if remote:
-            query["selectedFilters"]["workplaceType"] = f"List({','.join(remote)})"
+        :type distance: int/str, optional. If not specified, None or 0, the default value of 25 miles applied.
+        :param limit: maximum number of results obtained from API queries. -1 means maximum which is defined by constants and is equal to 1000 now.
+        :type limit: int, optional, default -1
+        :param offset: indicates how many search results shall be skipped
+        :type offset: int, optional
+        :param typed: Return `JobPosting` records instead of dicts
+        :type typed: boolean, optional
+        :return: List of jobs
+        :rtype: list
+        """
+        return list(
+            self.iter_search_jobs(
+                keywords=keywords,
+                companies=companies,
+                experience=experience,
+                job_type=job_type,
+                job_title=job_title,
+                industries=industries,
+                location_name=location_name,
+                remote=remote,
+                listed_at=listed_at,
+                distance=distance,
+                limit=limit,
+                offset=offset,
+                typed=typed,
+            )
+        )
 
-        query["selectedFilters"]["timePostedRange"] = f"List(r{listed_at})"
-        query["spellCorrectionEnabled"] = "true"
+    def iter_search_jobs(
+        self,
+        keywords: Optional[str] = None,
+        *,
+        limit=-1,
+        offset=0,
+        typed=False,
+        **filters,
+    ) -> PageIterator:
+        """Perform a LinkedIn search for jobs, yielding results as each page arrives.
 
-        # Query structure:
-        # "(
-        #    origin:JOB_SEARCH_PAGE_QUERY_EXPANSION,
-        #    keywords:marketing%20manager,
-        #    locationFallback:germany,
-        #    selectedFilters:(
-        #        distance:List(25),
-        #        company:List(163253),
-        #        salaryBucketV2:List(5),
-        #        timePostedRange:List(r2592000),
-        #        workplaceType:List(1)
-        #    ),
-        #    spellCorrectionEnabled:true
-        #  )"
+        Accepts the same filters as Linkedin.search_jobs(), by keyword past [keywords].
+        See Linkedin.iter_search() for resuming.
 
-        query_string = (
-            str(query)
-            .replace(" ", "")
-            .replace("'", "")
-            .replace("KEYWORD_PLACEHOLDER", keywords or "")
-            .replace("LOCATION_PLACEHOLDER", location_name or "")
-            .replace("{", "(")
-            .replace("}", ")")
-        )
-        results = []
-        while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
-                "count": count,
-                "q": "jobSearch",
-                "query": query_string,
-                "start": len(results) + offset,
-            }
+        :return: Iterator of jobs
+        :rtype: PageIterator
+        """
+        query_string = self._search_jobs_query(keywords=keywords, **filters)
 
+        def fetch_page(cursor, count):
             res = self._fetch(
-                f"/voyagerJobsDashJobCards?{urlencode(default_params, safe='(),:')}",
+                self._search_jobs_uri(query_string, start=cursor.start, count=count),
                 headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
             )
-            data = res.json()
-
-            elements = data.get("included", [])
-            new_data = [
-                i
-                for i in elements
-                if i["$type"] == "com.linkedin.voyager.dash.jobs.JobPosting"
-            ]
-            # break the loop if we're done searching or no results returned
-            if not new_data:
-                break
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
-            results.extend(new_data)
-            if (
-                (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(elements) == 0:
-                break
-
-            self.logger.debug(f"results grew to {len(results)}")
-
-        return results
+            data = self._json(res)
+            return Page(parse_job_postings(data), total=parse_paging_total(data))
+
+        return PageIterator(
+            fetch_page,
+            offset=offset,
+            limit=limit,
+            page_size=Linkedin._MAX_SEARCH_COUNT,
+            max_requests=Linkedin._MAX_REPEATED_REQUESTS,
+            parse_item=JobPosting.from_dict if typed else None,
+            workers=self.page_workers,
+        )
 
     def get_profile_contact_info(
-        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None, cache=None
     ) -> Dict:
         """Fetch contact information for a given LinkedIn profile. Pass a [public_id] or a [urn_id].
 
@@ -672,43 +1133,19 @@ class Linkedin(object):
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a profile
         :type urn_id: str, optional
+        :param cache: Cache mode, one of "bypass", "refresh" or "only". See Linkedin._fetch()
+        :type cache: str, optional
 
         :return: Contact data
         :rtype: dict
         """
         res = self._fetch(
-            f"/identity/profiles/{public_id or urn_id}/profileContactInfo"
+            f"/identity/profiles/{public_id or urn_id}/profileContactInfo", cache=cache
         )
-        data = res.json()
-
-        contact_info = {
-            "email_address": data.get("emailAddress"),
-            "websites": [],
-            "twitter": data.get("twitterHandles"),
-            "birthdate": data.get("birthDateOn"),
-            "ims": data.get("ims"),
-            "phone_numbers": data.get("phoneNumbers", []),
-        }
-
-        websites = data.get("websites", [])
-        for item in websites:
-            if "com.linkedin.voyager.identity.profile.StandardWebsite" in item["type"]:
-                item["label"] = item["type"][
-                    "com.linkedin.voyager.identity.profile.StandardWebsite"
-                ]["category"]
-            elif "" in item["type"]:
-                item["label"] = item["type"][
-                    "com.linkedin.voyager.identity.profile.CustomWebsite"
-                ]["label"]
-
-            del item["type"]
-
-        contact_info["websites"] = websites
-
-        return contact_info
+        return parse_profile_contact_info(self._json(res))
 
     def get_profile_skills(
-        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None, cache=None
     ) -> List:
         """Fetch the skills listed on a given LinkedIn profile.
 
@@ -716,6 +1153,8 @@ class Linkedin(object):
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a profile
         :type urn_id: str, optional
+        :param cache: Cache mode, one of "bypass", "refresh" or "only". See Linkedin._fetch()
+        :type cache: str, optional
 
 
         :return: List of skill objects
@@ -723,18 +1162,18 @@ class Linkedin(object):
         """
         params = {"count": 100, "start": 0}
         res = self._fetch(
-            f"/identity/profiles/{public_id or urn_id}/skills", params=params
+            f"/identity/profiles/{public_id or urn_id}/skills",
+            params=params,
+            cache=cache,
         )
-        data = res.json()
-
-        skills = data.get("elements", [])
-        for item in skills:
-            del item["entityUrn"]
-
-        return skills
+        return parse_profile_skills(self._json(res))
 
     def get_profile(
-        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        cache=None,
+        typed=False,
     ) -> Dict:
         """Fetch data for a given LinkedIn profile.
 
@@ -742,125 +1181,42 @@ class Linkedin(object):
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a profile
         :type urn_id: str, optional
+        :param cache: Cache mode, one of "bypass", "refresh" or "only". See Linkedin._fetch()
+        :type cache: str, optional
+        :param typed: Return a `Profile` record (None if not found) instead of a dict
+        :type typed: boolean, optional
 
         :return: Profile data
         :rtype: dict
         """
+        profile = self._get_entity(
+            ("profile", public_id or urn_id),
+            partial(self._fetch_profile, public_id, urn_id, cache),
+            cache,
+        )
+        return Profile.from_dict(profile) if typed else profile
+
+    def _fetch_profile(
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None, cache=None
+    ) -> Dict:
         # NOTE this still works for now, but will probably eventually have to be converted to
         # https://www.linkedin.com/voyager/api/identity/profiles/ACoAAAKT9JQBsH7LwKaE9Myay9WcX8OVGuDq9Uw
-        res = self._fetch(f"/identity/profiles/{public_id or urn_id}/profileView")
+        res = self._fetch(
+            f"/identity/profiles/{public_id or urn_id}/profileView", cache=cache
+        )
         if res.status_code != 200:
             self.logger.info("request failed [status={}]".format(res.status_code))
             raise Exception(
                 "Request failed: get_profile. Try refreshing cookies or solving challenge in a browser."
             )
 
-        data = res.json()
-        if data and "status" in data and data["status"] != 200:
+        data = self._json(res)
+        if is_error_payload(data):
             self.logger.info("request failed: {}".format(data["message"]))
             return {}
 
-        # massage [profile] data
-        profile = data["profile"]
-        if "miniProfile" in profile:
-            if "picture" in profile["miniProfile"]:
-                profile["displayPictureUrl"] = profile["miniProfile"]["picture"][
-                    "com.linkedin.common.VectorImage"
-                ]["rootUrl"]
-
-                images_data = profile["miniProfile"]["picture"][
-                    "com.linkedin.common.VectorImage"
-                ]["artifacts"]
-                for img in images_data:
-                    w, h, url_segment = itemgetter(
-                        "width", "height", "fileIdentifyingUrlPathSegment"
-                    )(img)
-                    profile[f"img_{w}_{h}"] = url_segment
-
-            profile["profile_id"] = get_id_from_urn(profile["miniProfile"]["entityUrn"])
-            profile["profile_urn"] = profile["miniProfile"]["entityUrn"]
-            profile["member_urn"] = profile["miniProfile"]["objectUrn"]
-            profile["public_id"] = profile["miniProfile"]["publicIdentifier"]
-
-            del profile["miniProfile"]
-
-        del profile["defaultLocale"]
-        del profile["supportedLocales"]
-        del profile["versionTag"]
-        del profile["showEducationOnProfileTopCard"]
-
-        # massage [experience] data
-        experience = data["positionView"]["elements"]
-        for item in experience:
-            if "company" in item and "miniCompany" in item["company"]:
-                if "logo" in item["company"]["miniCompany"]:
-                    logo = item["company"]["miniCompany"]["logo"].get(
-                        "com.linkedin.common.VectorImage"
-                    )
-                    if logo:
-                        item["companyLogoUrl"] = logo["rootUrl"]
-                del item["company"]["miniCompany"]
-
-        profile["experience"] = experience
-
-        # massage [education] data
-        education = data["educationView"]["elements"]
-        for item in education:
-            if "school" in item:
-                if "logo" in item["school"]:
-                    item["school"]["logoUrl"] = item["school"]["logo"][
-                        "com.linkedin.common.VectorImage"
-                    ]["rootUrl"]
-                    del item["school"]["logo"]
-
-        profile["education"] = education
-
-        # massage [languages] data
-        languages = data["languageView"]["elements"]
-        for item in languages:
-            del item["entityUrn"]
-        profile["languages"] = languages
-
-        # massage [publications] data
-        publications = data["publicationView"]["elements"]
-        for item in publications:
-            del item["entityUrn"]
-            for author in item.get("authors", []):
-                del author["entityUrn"]
-        profile["publications"] = publications
-
-        # massage [certifications] data
-        certifications = data["certificationView"]["elements"]
-        for item in certifications:
-            del item["entityUrn"]
-        profile["certifications"] = certifications
-
-        # massage [volunteer] data
-        volunteer = data["volunteerExperienceView"]["elements"]
-        for item in volunteer:
-            del item["entityUrn"]
-        profile["volunteer"] = volunteer
-
-        # massage [honors] data
-        honors = data["honorView"]["elements"]
-        for item in honors:
-            del item["entityUrn"]
-        profile["honors"] = honors
-
-        # massage [projects] data
-        projects = data["projectView"]["elements"]
-        for item in projects:
-            del item["entityUrn"]
-        profile["projects"] = projects
-        # massage [skills] data
-        skills = data["skillView"]["elements"]
-        for item in skills:
-            del item["entityUrn"]
-        profile["skills"] = skills
-
-        profile["urn_id"] = profile["entityUrn"].replace("urn:li:fs_profile:", "")
-
-        return profile
+        self._index_identities(data)
+        return parse_profile(data)
 
     def get_profile_connections(self, urn_id: str, **kwargs) -> List:
         """Fetch connections for a given LinkedIn profile.
@@ -875,166 +1231,104 @@ class Linkedin(object):
         """
         return self.search_people(connection_of=urn_id, **kwargs)
 
-    def get_profile_experiences(self, urn_id: str) -> List:
+    @staticmethod
+    def _profile_experiences_uri(urn_id: str) -> str:
+        """Return the URI of the experience section of a given profile"""
+        profile_urn = f"urn:li:fsd_profile:{urn_id}"
+        variables = ",".join(
+            [f"profileUrn:{quote(profile_urn)}", "sectionType:experience"]
+        )
+        query_id = (
+            "voyagerIdentityDashProfileComponents.7af5d6f176f11583b382e37e5639e69e"
+        )
+        return f"/graphql?variables=({variables})&queryId={query_id}&includeWebMetadata=true"
+
+    def get_profile_experiences(self, urn_id: str, typed=False) -> List:
         """Fetch experiences for a given LinkedIn profile.
 
         NOTE: data structure differs slightly from  Linkedin.get_profile() experiences.
 
         :param urn_id: LinkedIn URN ID for a profile
         :type urn_id: str
+        :param typed: Return `Experience` records instead of dicts
+        :type typed: boolean, optional
 
         :return: List of experiences
         :rtype: list
         """
-        profile_urn = f"urn:li:fsd_profile:{urn_id}"
-        variables = ",".join(
-            [f"profileUrn:{quote(profile_urn)}", "sectionType:experience"]
-        )
-        query_id = (
-            "voyagerIdentityDashProfileComponents.7af5d6f176f11583b382e37e5639e69e"
-        )
-
         res = self._fetch(
-            f"/graphql?variables=({variables})&queryId={query_id}&includeWebMetadata=true",
+            self._profile_experiences_uri(urn_id),
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
         )
 
-        def parse_item(item, is_group_item=False):
-            """
-            Parse a single experience item.
-
-            Items as part of an 'experience group' (e.g. a company with multiple positions) have different data structures.
-            Therefore, some exceptions need to be made when parsing these items.
-            """
-            component = item["components"]["entityComponent"]
-            title = component["titleV2"]["text"]["text"]
-            subtitle = component["subtitle"]
-            company = subtitle["text"].split(" · ")[0] if subtitle else None
-            employment_type_parts = subtitle["text"].split(" · ") if subtitle else None
-            employment_type = (
-                employment_type_parts[1]
-                if employment_type_parts and len(employment_type_parts) > 1
-                else None
-            )
-            metadata = component.get("metadata", {}) or {}
-            location = metadata.get("text")
-
-            duration_text = component["caption"]["text"]
-            duration_parts = duration_text.split(" · ")
-            date_parts = duration_parts[0].split(" - ")
-
-            duration = (
-                duration_parts[1]
-                if duration_parts and len(duration_parts) > 1
-                else None
-            )
-            start_date = date_parts[0] if date_parts else None
-            end_date = date_parts[1] if date_parts and len(date_parts) > 1 else None
-
-            sub_components = component["subComponents"]
-            fixed_list_component = (
-                sub_components["components"][0]["components"]["fixedListComponent"]
-                if sub_components
-                else None
-            )
-
-            fixed_list_text_component = (
-                fixed_list_component["components"][0]["components"]["textComponent"]
-                if fixed_list_component
-                else None
-            )
-
-            # Extract additional description
-            description = (
-                fixed_list_text_component["text"]["text"]
-                if fixed_list_text_component
-                else None
-            )
-
-            # Create a dictionary with the extracted information
-            parsed_data = {
-                "title": title,
-                "companyName": company if not is_group_item else None,
-                "employmentType": company if is_group_item else employment_type,
-                "locationName": location,
-                "duration": duration,
-                "startDate": start_date,
-                "endDate": end_date,
-                "description": description,
-            }
+        experiences = parse_profile_experiences(self._json(res))
+        if typed:
+            return [Experience.from_dict(e) for e in experiences]
+        return experiences
 
-            return parsed_data
+    def _iter_collection(
+        self, uri: str, params: Dict, page_size: int, limit=-1, offset=0
+    ) -> PageIterator:
+        """Return a lazy iterator over the `elements` of a start/count paginated
+        collection, stopping at the `paging.total` reported by the server.
+        """
 
-        def get_grouped_item_id(item):
-            sub_components = item["components"]["entityComponent"]["subComponents"]
-            sub_components_components = (
-                sub_components["components"][0]["components"]
-                if sub_components
-                else None
-            )
-            paged_list_component_id = (
-                sub_components_components.get("*pagedListComponent", "")
-                if sub_components_components
-                else None
-            )
-            if (
-                paged_list_component_id
-                and "fsd_profilePositionGroup" in paged_list_component_id
-            ):
-                pattern = r"urn:li:fsd_profilePositionGroup:\([^)]+\)"
-                match = re.search(pattern, paged_list_component_id)
-                return match.group(0) if match else None
-
-        data = res.json()
-
-        items = []
-
-        # Find the index with the most items
-        # When dealing with grouped experiences (e.g. multiple positions at the same company),
-        # the API response will contain multiple indexes in data["included"].
-        # The index with the most elements will contain all experiences, both grouped and individual,
-        # while other indexes may only contain partial data for the grouped experiences.
-        # Therefore, we want to use the index with the most items to ensure we process all experiences.
-        max_items_index = max(
-            range(len(data["included"])),
-            key=lambda i: len(
-                data["included"][i].get("components", {}).get("elements", [])
-            ),
+        def fetch_page(cursor, count):
+            res = self._fetch(uri, params=dict(params, count=count, start=cursor.start))
+            data = self._json(res)
+            return Page(data.get("elements", []), total=parse_paging_total(data))
+
+        return PageIterator(
+            fetch_page,
+            offset=offset,
+            limit=limit,
+            page_size=page_size,
+            max_requests=Linkedin._MAX_REPEATED_REQUESTS,
+            workers=self.page_workers,
         )
 
-        for item in data["included"][max_items_index]["components"]["elements"]:
-            grouped_item_id = get_grouped_item_id(item)
-            # if the item is part of a group (e.g. a company with multiple positions),
-            # find the group items and parse them.
-            if grouped_item_id:
-                component = item["components"]["entityComponent"]
-                # use the company and location from the main item
-                company = component["titleV2"]["text"]["text"]
-
-                location = (
-                    component["caption"]["text"] if component["caption"] else None
-                )
+    @staticmethod
+    def _continue_results(results: Optional[List], max_results: Optional[int]):
+        """Return the results list, offset and limit to continue [results] up to [max_results]"""
+        if results is None:
+            results = []
+        if max_results is None:
+            return results, len(results), -1
+        return results, len(results), max(0, max_results - len(results))
 
-                # find the group
-                group = [
-                    i
-                    for i in data["included"]
-                    if grouped_item_id in i.get("entityUrn", "")
-                ]
-                if not group:
-                    continue
-                for group_item in group[0]["components"]["elements"]:
-                    parsed_data = parse_item(group_item, is_group_item=True)
-                    parsed_data["companyName"] = company
-                    parsed_data["locationName"] = location
-                    items.append(parsed_data)
-                continue
+    def iter_company_updates(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        limit=-1,
+        offset=0,
+    ) -> PageIterator:
+        """Fetch company updates, yielding them as each page arrives.
 
-            # else, parse the regular item
-            parsed_data = parse_item(item)
-            items.append(parsed_data)
+        :param public_id: LinkedIn public ID for a company
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a company
+        :type urn_id: str, optional
+        :param limit: Maximum number of updates, defaults to -1 (no limit)
+        :type limit: int, optional
+        :param offset: Index of the first update, defaults to 0
+        :type offset: int, optional
 
-        return items
+        :return: Iterator of company update objects
+        :rtype: PageIterator
+        """
+        params = {
+            "companyUniversalName": {public_id or urn_id},
+            "q": "companyFeedByUniversalName",
+            "moduleKey": "member-share",
+        }
+        return self._iter_collection(
+            f"/feed/updates",
+            params,
+            page_size=Linkedin._MAX_UPDATE_COUNT,
+            limit=limit,
+            offset=offset,
+        )
 
     def get_company_updates(
         self,
@@ -1049,44 +1343,49 @@ class Linkedin(object):
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a company
         :type urn_id: str, optional
+        :param max_results: Maximum number of updates, [results] included
+        :type max_results: int, optional
+        :param results: Updates already fetched, which are continued from
+        :type results: list, optional
 
         :return: List of company update objects
         :rtype: list
         """
+        results, offset, limit = self._continue_results(results, max_results)
+        updates = self.iter_company_updates(
+            public_id=public_id, urn_id=urn_id, limit=limit, offset=offset
+        )
+        results.extend(updates)
+        return results
 
-        if results is None:
-            results = []
+    def iter_profile_updates(
+        self, public_id=None, urn_id=None, limit=-1, offset=0
+    ) -> PageIterator:
+        """Fetch profile updates, yielding them as each page arrives.
+
+        :param public_id: LinkedIn public ID for a profile
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a profile
+        :type urn_id: str, optional
+        :param limit: Maximum number of updates, defaults to -1 (no limit)
+        :type limit: int, optional
+        :param offset: Index of the first update, defaults to 0
+        :type offset: int, optional
 
+        :return: Iterator of profile update objects
+        :rtype: PageIterator
+        """
         params = {
-            "companyUniversalName": {public_id or urn_id},
-            "q": "companyFeedByUniversalName",
+            "profileId": {public_id or urn_id},
+            "q": "memberShareFeed",
             "moduleKey": "member-share",
-            "count": Linkedin._MAX_UPDATE_COUNT,
-            "start": len(results),
         }
-
-        res = self._fetch(f"/feed/updates", params=params)
-
-        data = res.json()
-
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-            )
-        ):
-            return results
-
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
-
-        return self.get_company_updates(
-            public_id=public_id,
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
+        return self._iter_collection(
+            f"/feed/updates",
+            params,
+            page_size=Linkedin._MAX_UPDATE_COUNT,
+            limit=limit,
+            offset=offset,
         )
 
     def get_profile_updates(
@@ -1098,45 +1397,20 @@ class Linkedin(object):
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a profile
         :type urn_id: str, optional
+        :param max_results: Maximum number of updates, [results] included
+        :type max_results: int, optional
+        :param results: Updates already fetched, which are continued from
+        :type results: list, optional
 
         :return: List of profile update objects
         :rtype: list
         """
-
-        if results is None:
-            results = []
-
-        params = {
-            "profileId": {public_id or urn_id},
-            "q": "memberShareFeed",
-            "moduleKey": "member-share",
-            "count": Linkedin._MAX_UPDATE_COUNT,
-            "start": len(results),
-        }
-
-        res = self._fetch(f"/feed/updates", params=params)
-
-        data = res.json()
-
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-            )
-        ):
-            return results
-
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
-
-        return self.get_profile_updates(
-            public_id=public_id,
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
+        results, offset, limit = self._continue_results(results, max_results)
+        updates = self.iter_profile_updates(
+            public_id=public_id, urn_id=urn_id, limit=limit, offset=offset
         )
+        results.extend(updates)
+        return results
 
     def get_current_profile_views(self):
         """Get profile view statistics, including chart data.
@@ -1146,34 +1420,33 @@ class Linkedin(object):
         """
         res = self._fetch(f"/identity/wvmpCards")
 
-        data = res.json()
+        return parse_current_profile_views(self._json(res))
 
-        return data["elements"][0]["value"][
-            "com.linkedin.voyager.identity.me.wvmpOverview.WvmpViewersCard"
-        ]["insightCards"][0]["value"][
-            "com.linkedin.voyager.identity.me.wvmpOverview.WvmpSummaryInsightCard"
-        ][
-            "numViews"
-        ]
-
-    def get_school(self, public_id):
+    def get_school(self, public_id, cache=None):
         """Fetch data about a given LinkedIn school.
 
         :param public_id: LinkedIn public ID for a school
         :type public_id: str
+        :param cache: Cache mode, one of "bypass", "refresh" or "only". See Linkedin._fetch()
+        :type cache: str, optional
 
         :return: School data
         :rtype: dict
         """
+        return self._get_entity(
+            ("school", public_id), partial(self._fetch_school, public_id, cache), cache
+        )
+
+    def _fetch_school(self, public_id, cache=None):
         params = {
             "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12",
             "q": "universalName",
             "universalName": public_id,
         }
 
-        res = self._fetch(f"/organization/companies?{urlencode(params)}")
+        res = self._fetch(f"/organization/companies?{urlencode(params)}", cache=cache)
 
-        data = res.json()
+        data = self._json(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data))
@@ -1183,24 +1456,36 @@ class Linkedin(object):
 
         return school
 
-    def get_company(self, public_id):
+    def get_company(self, public_id, cache=None, typed=False):
         """Fetch data about a given LinkedIn company.
 
         :param public_id: LinkedIn public ID for a company
         :type public_id: str
+        :param cache: Cache mode, one of "bypass", "refresh" or "only". See Linkedin._fetch()
+        :type cache: str, optional
+        :param typed: Return a `Company` record (None if not found) instead of a dict
+        :type typed: boolean, optional
 
         :return: Company data
         :rtype: dict
         """
+        company = self._get_entity(
+            ("company", public_id),
+            partial(self._fetch_company, public_id, cache),
+            cache,
+        )
+        return Company.from_element(company) if typed else company
+
+    def _fetch_company(self, public_id, cache=None):
         params = {
             "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12",
             "q": "universalName",
             "universalName": public_id,
         }
 
-        res = self._fetch(f"/organization/companies", params=params)
+        res = self._fetch(f"/organization/companies", params=params, cache=cache)
 
-        data = res.json()
+        data = self._json(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
@@ -1245,15 +1530,7 @@ class Linkedin(object):
             keyVersion=LEGACY_INBOX&q=participants&recipients=List({profile_urn_id})"
         )
 
-        data = res.json()
-
-        if data["elements"] == []:
-            return {}
-
-        item = data["elements"][0]
-        item["id"] = get_id_from_urn(item["entityUrn"])
-
-        return item
+        return parse_conversation_details(self._json(res))
 
     def get_conversations(self):
         """Fetch list of conversations the user is in.
@@ -1265,7 +1542,7 @@ class Linkedin(object):
 
         res = self._fetch(f"/messaging/conversations", params=params)
 
-        return res.json()
+        return self._json(res)
 
     def get_conversation(self, conversation_urn_id: str):
         """Fetch data about a given conversation.
@@ -1278,7 +1555,7 @@ class Linkedin(object):
         """
         res = self._fetch(f"/messaging/conversations/{conversation_urn_id}/events")
 
-        return res.json()
+        return self._json(res)
 
     def send_message(
         self,
@@ -1304,6 +1581,8 @@ class Linkedin(object):
             self.logger.debug("Must provide [conversation_urn_id] or [recipients].")
             return True
 
+        import uuid
+
         message_event = {
             "eventCreate": {
                 "originToken": str(uuid.uuid4()),
@@ -1368,7 +1647,8 @@ class Linkedin(object):
         me_profile = self.client.metadata.get("me", {})
         if not self.client.metadata.get("me") or not use_cache:
             res = self._fetch(f"/me")
-            me_profile = res.json()
+            me_profile = self._json(res)
+            self._index_identities(me_profile)
             # cache profile
             self.client.metadata["me"] = me_profile
 
@@ -1400,7 +1680,7 @@ class Linkedin(object):
         if res.status_code != 200:
             return []
 
-        response_payload = res.json()
+        response_payload = self._json(res)
         return [element["invitation"] for element in response_payload["elements"]]
 
     def reply_invitation(
@@ -1455,6 +1735,8 @@ class Linkedin(object):
             self.logger.info("Message too long. Max size is 300 characters")
             return False
 
+        if not profile_urn and self.identity_index is not None:
+            profile_urn = self.identity_index.get_urn_id(profile_public_id)
         if not profile_urn:
             profile_urn_string = self.get_profile(public_id=profile_public_id)[
                 "profile_urn"
@@ -1533,7 +1815,7 @@ class Linkedin(object):
         if res.status_code != 200:
             return {}
 
-        data = res.json()
+        data = self._json(res)
         return data.get("data", {})
 
     def get_profile_member_badges(self, public_profile_id: str):
@@ -1552,7 +1834,7 @@ class Linkedin(object):
         if res.status_code != 200:
             return {}
 
-        data = res.json()
+        data = self._json(res)
         return data.get("data", {})
 
     def get_profile_network_info(self, public_profile_id: str):
@@ -1578,9 +1860,154 @@ class Linkedin(object):
         if res.status_code != 200:
             return {}
 
-        data = res.json()
+        data = self._json(res)
         return data.get("data", {})
 
+    def get_profile_bundle(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        parts: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict:
+        """Fetch several parts of a given LinkedIn profile concurrently. Pass a [public_id] or a [urn_id].
+
+        Parts are fetched in parallel threads, still paced by the rate limiter. A part
+        which fails is reported under "errors" without failing the others.
+
+        :param public_id: LinkedIn public ID for a profile
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a profile
+        :type urn_id: str, optional
+        :param parts: Parts to fetch, any of "profile", "contact_info", "skills",
+            "network_info", "member_badges" and "experiences". Defaults to all of them.
+        :type parts: list, optional
+        :param max_workers: Maximum number of parts fetched at once, defaults to all of them
+        :type max_workers: int, optional
+
+        :return: Dict of part name to part data, plus "errors", a dict of part name to exception
+        :rtype: dict
+        """
+        parts = list(parts or Linkedin._PROFILE_BUNDLE_PARTS)
+        unknown = set(parts) - set(Linkedin._PROFILE_BUNDLE_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown profile parts: {sorted(unknown)}")
+
+        profile_id = public_id or urn_id
+        if not urn_id and self.identity_index is not None:
+            urn_id = self.identity_index.get_urn_id(public_id)
+        fetchers = {
+            "profile": partial(self.get_profile, public_id=public_id, urn_id=urn_id),
+            "contact_info": partial(self.get_profile_contact_info, urn_id=profile_id),
+            "skills": partial(self.get_profile_skills, urn_id=profile_id),
+            "network_info": partial(self.get_profile_network_info, profile_id),
+            "member_badges": partial(self.get_profile_member_badges, profile_id),
+        }
+
+        bundle = {"errors": {}}
+        with ThreadPoolExecutor(max_workers=max_workers or len(parts)) as executor:
+            # "profile" is submitted first: experiences may wait on it for the URN ID
+            futures = {
+                part: executor.submit(fetchers[part])
+                for part in sorted(parts, key=lambda part: part != "profile")
+                if part != "experiences"
+            }
+            if "experiences" in parts:
+
+                def get_experiences():
+                    profile_urn_id = urn_id
+                    if not profile_urn_id:
+                        profile = (
+                            futures["profile"].result()
+                            if "profile" in futures
+                            else self.get_profile(public_id)
+                        )
+                        profile_urn_id = profile["urn_id"]
+                    return self.get_profile_experiences(profile_urn_id)
+
+                futures["experiences"] = executor.submit(get_experiences)
+
+            for part in parts:
+                try:
+                    bundle[part] = futures[part].result()
+                except Exception as e:
+                    self.logger.info(f"failed to fetch profile part {part}: {e!r}")
+                    bundle[part] = None
+                    bundle["errors"][part] = e
+
+        return bundle
+
+    def get_profiles(
+        self,
+        ids: Iterable[str],
+        workers: int = 4,
+        max_in_flight: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[Tuple[str, Union[Dict, Exception]]]:
+        """Fetch many LinkedIn profiles concurrently, yielding them as they complete.
+
+        [ids] is consumed lazily, so that only [max_in_flight] profiles are held in
+        memory at once, however long it is. Duplicate ids are only fetched once.
+        Requests are paced by the rate limiter.
+
+        :param ids: Public IDs, URN IDs or profile URNs
+        :type ids: iterable
+        :param workers: Number of worker threads
+        :type workers: int, optional
+        :param max_in_flight: Maximum number of profiles submitted but not yet yielded,
+            defaults to twice [workers]
+        :type max_in_flight: int, optional
+        :param progress: Callable receiving the number of profiles completed and failed so far
+        :type progress: callable, optional
+
+        :return: Iterator of (id, profile data), or (id, exception) if the profile failed
+        :rtype: iterator
+        """
+        max_in_flight = max(max_in_flight or workers * 2, 1)
+        ids = iter(ids)
+        end = object()
+        seen = set()
+        pending = {}
+        completed = failed = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                while True:
+                    while ids is not None and len(pending) < max_in_flight:
+                        profile_id = next(ids, end)
+                        if profile_id is end:
+                            ids = None
+                            break
+                        public_id, urn_id = split_profile_id(profile_id)
+                        key = public_id or urn_id
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        future = executor.submit(self.get_profile, public_id, urn_id)
+                        pending[future] = profile_id
+                    if not pending:
+                        break
+
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        profile_id = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.logger.info(
+                                f"failed to fetch profile {profile_id}: {e!r}"
+                            )
+                            result = e
+                            failed += 1
+                        completed += 1
+                        if progress is not None:
+                            progress(completed, failed)
+                        yield profile_id, result
+            finally:
+                # the caller stopped iterating: drop what hasn't started yet
+                for future in pending:
+                    future.cancel()
+
     def unfollow_entity(self, urn_id: str):
         """Unfollow a given entity.
 
@@ -1603,6 +2030,53 @@ class Linkedin(object):
 
         return err
 
+    def _fetch_feed_page(self, start: int, count: int):
+        """Fetch one page of the feed sorted by 'Recent'
+
+        :return: List of yet unsorted posts, list of URNs and total size of the feed
+        :rtype: (list, list, int)
+        """
+        params = {
+            "count": str(count),
+            "q": "chronFeed",
+            "start": start,
+        }
+        res = self._fetch(
+            f"/feed/updatesV2",
+            params=params,
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        )
+        """
+        Response includes two keya:
+        - ['Data']['*elements']. It includes the posts URNs always
+        properly sorted as 'Recent', including yet sponsored posts. The
+        downside is that fetching one by one the posts is slower. We will
+        save the URNs to later on build a sorted list of posts purging
+        promotions
+        - ['included']. List with all the posts attributes, but not sorted as
+        'Recent' and including promoted posts
+        """
+        data = self._json(res)
+        response = NormalizedResponse(data)
+        l_raw_urns = response.data.get("*elements", [])
+
+        l_posts = parse_list_raw_posts(response.included, self.client.LINKEDIN_BASE_URL)
+        return l_posts, parse_list_raw_urns(l_raw_urns), parse_paging_total(data)
+
+    def _iter_feed_pages(self, fetch_page, limit=-1, offset=0) -> PageIterator:
+        # If count>100 API will return HTTP 400
+        if limit == -1:
+            limit = Linkedin._MAX_UPDATE_COUNT
+
+        return PageIterator(
+            fetch_page,
+            offset=offset,
+            limit=limit,
+            page_size=Linkedin._MAX_UPDATE_COUNT,
+            max_requests=Linkedin._MAX_REPEATED_REQUESTS,
+            workers=self.page_workers,
+        )
+
     def _get_list_feed_posts_and_list_feed_urns(
         self, limit=-1, offset=0, exclude_promoted_posts=True
     ):
@@ -1619,66 +2093,39 @@ class Linkedin(object):
         :return: List of posts and list of URNs
         :rtype: (list, list)
         """
-        _PROMOTED_STRING = "Promoted"
-        _PROFILE_URL = f"{self.client.LINKEDIN_BASE_URL}/in/"
-
         l_posts = []
-        l_urns = []
 
-        # If count>100 API will return HTTP 400
-        count = Linkedin._MAX_UPDATE_COUNT
-        if limit == -1:
-            limit = Linkedin._MAX_UPDATE_COUNT
+        def fetch_page(cursor, count):
+            l_new_posts, l_new_urns, total = self._fetch_feed_page(cursor.start, count)
+            l_posts.extend(l_new_posts)
+            return Page(l_new_urns, total=total)
 
-        # 'l_urns' equivalent to other functions 'results' variable
-        l_urns = []
+        l_urns = list(self._iter_feed_pages(fetch_page, limit=limit, offset=offset))
+        return l_posts, l_urns
 
-        while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(l_urns) < count:
-                count = limit - len(l_urns)
-            params = {
-                "count": str(count),
-                "q": "chronFeed",
-                "start": len(l_urns) + offset,
-            }
-            res = self._fetch(
-                f"/feed/updatesV2",
-                params=params,
-                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
-            )
-            """
-            Response includes two keya:
-            - ['Data']['*elements']. It includes the posts URNs always
-            properly sorted as 'Recent', including yet sponsored posts. The
-            downside is that fetching one by one the posts is slower. We will
-            save the URNs to later on build a sorted list of posts purging
-            promotions
-            - ['included']. List with all the posts attributes, but not sorted as
-            'Recent' and including promoted posts
-            """
-            l_raw_posts = res.json().get("included", {})
-            l_raw_urns = res.json().get("data", {}).get("*elements", [])
-
-            l_new_posts = parse_list_raw_posts(
-                l_raw_posts, self.client.LINKEDIN_BASE_URL
-            )
-            l_posts.extend(l_new_posts)
+    def iter_feed_posts(self, limit=-1, offset=0) -> PageIterator:
+        """Get posts from feed sorted by 'Recent', yielding them as each page arrives.
 
-            l_urns.extend(parse_list_raw_urns(l_raw_urns))
+        Promoted posts are excluded.
+
+        :param limit: Maximum number of feed updates to go through, defaults to -1 (no limit)
+        :type limit: int, optional
+        :param offset: Index to start searching from
+        :type offset: int, optional
 
-            # break the loop if we're done searching
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
-            if (
-                (limit > -1 and len(l_urns) >= limit)  # if our results exceed set limit
-                or len(l_urns) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(l_raw_urns) == 0:
-                break
+        :return: Iterator of posts
+        :rtype: PageIterator
+        """
 
-            self.logger.debug(f"results grew to {len(l_urns)}")
+        def fetch_page(cursor, count):
+            l_posts, l_urns, total = self._fetch_feed_page(cursor.start, count)
+            return Page(
+                list(iter_posts_sorted_without_promoted(l_urns, l_posts)),
+                size=len(l_urns),
+                total=total,
+            )
 
-        return l_posts, l_urns
+        return self._iter_feed_pages(fetch_page, limit=limit, offset=offset)
 
     def get_feed_posts(self, limit=-1, offset=0, exclude_promoted_posts=True):
         """Get a list of URNs from feed sorted by 'Recent'
@@ -1696,12 +2143,14 @@ class Linkedin(object):
         l_posts, l_urns = self._get_list_feed_posts_and_list_feed_urns(
             limit, offset, exclude_promoted_posts
         )
-        return get_list_posts_sorted_without_promoted(l_urns, l_posts)
+        return list(iter_posts_sorted_without_promoted(l_urns, l_posts))
 
-    def get_job(self, job_id: str) -> Dict:
+    def get_job(self, job_id: str, cache=None) -> Dict:
         """Fetch data about a given job.
         :param job_id: LinkedIn job ID
         :type job_id: str
+        :param cache: Cache mode, one of "bypass", "refresh" or "only". See Linkedin._fetch()
+        :type cache: str, optional
 
         :return: Job data
         :rtype: dict
@@ -1710,9 +2159,9 @@ class Linkedin(object):
             "decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebLightJobPosting-23",
         }
 
-        res = self._fetch(f"/jobs/jobPostings/{job_id}", params=params)
+        res = self._fetch(f"/jobs/jobPostings/{job_id}", params=params, cache=cache)
 
-        data = res.json()
+        data = self._json(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
@@ -1720,53 +2169,52 @@ class Linkedin(object):
 
         return data
 
-    def get_post_reactions(self, urn_id, max_results=None, results=None):
-        """Fetch social reactions for a given LinkedIn post.
+    def iter_post_reactions(self, urn_id, limit=-1, offset=0) -> PageIterator:
+        """Fetch social reactions for a given LinkedIn post, yielding them as each page arrives.
 
         :param urn_id: LinkedIn URN ID for a post
         :type urn_id: str
-        :param max_results: Maximum results to return
-        :type max_results: int, optional
-
-        :return: List of social reactions
-        :rtype: list
+        :param limit: Maximum number of reactions, defaults to -1 (no limit)
+        :type limit: int, optional
+        :param offset: Index of the first reaction, defaults to 0
+        :type offset: int, optional
 
-        # Note: This may need to be updated to GraphQL in the future, see https://github.com/tomquirk/linkedin-api/pull/309
+        :return: Iterator of social reactions
+        :rtype: PageIterator
         """
 
-        if results is None:
-            results = []
-
         params = {
             "decorationId": "com.linkedin.voyager.dash.deco.social.ReactionsByTypeWithProfileActions-13",
-            "count": 10,
             "q": "reactionType",
-            "start": len(results),
             "threadUrn": f"urn:li:activity:{urn_id}",
         }
+        return self._iter_collection(
+            "/voyagerSocialDashReactions",
+            params,
+            page_size=Linkedin._MAX_REACTION_COUNT,
+            limit=limit,
+            offset=offset,
+        )
 
-        res = self._fetch("/voyagerSocialDashReactions", params=params)
-
-        data = res.json()
+    def get_post_reactions(self, urn_id, max_results=None, results=None):
+        """Fetch social reactions for a given LinkedIn post.
 
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-            )
-        ):
-            return results
+        :param urn_id: LinkedIn URN ID for a post
+        :type urn_id: str
+        :param max_results: Maximum results to return, [results] included
+        :type max_results: int, optional
+        :param results: Reactions already fetched, which are continued from
+        :type results: list, optional
 
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
+        :return: List of social reactions
+        :rtype: list
 
-        return self.get_post_reactions(
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
-        )
+        # Note: This may need to be updated to GraphQL in the future, see https://github.com/tomquirk/linkedin-api/pull/309
+        """
+        results, offset, limit = self._continue_results(results, max_results)
+        reactions = self.iter_post_reactions(urn_id, limit=limit, offset=offset)
+        results.extend(reactions)
+        return results
 
     def react_to_post(self, post_urn_id, reaction_type="LIKE"):
         """React to a given post.
@@ -1805,7 +2253,7 @@ class Linkedin(object):
             f"/voyagerAssessmentsDashJobSkillMatchInsight/urn%3Ali%3Afsd_jobSkillMatchInsight%3A{job_id}",
             params=params,
         )
-        data = res.json()
+        data = self._json(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data.get("message")))
@@ -0,0 +1,219 @@
+"""
+Compact typed records, returned instead of dicts when passing typed=True
+"""
+
+from typing import Any, Dict, Optional
+
+from linkedin_api.utils.helpers import get_id_from_urn
+
+
+class Record(object):
+    """
+    Base class of the typed records: fixed `__slots__`, no per-instance dict.
+
+    Subclasses list their fields in `_keys`, mapping each attribute to the key of
+    the parsed dict it is read from. Keys of the dict which aren't listed are
+    dropped, which is where the memory savings come from.
+    """
+
+    __slots__ = ()
+    _keys: Dict[str, str] = {}
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {sorted(fields)}")
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]):
+        """Return a record of the fields of [data] listed in `_keys`, or None if [data] is empty"""
+        if not data:
+            return None
+        return cls(**{name: data.get(key) for name, key in cls._keys.items()})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields of the record as a dict, nested records included"""
+        return {name: _to_plain(getattr(self, name)) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def _to_plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+def _format_date(date: Optional[Dict]) -> Optional[str]:
+    """Return a `{"year": 2020, "month": 3}` date as "2020-03" (or "2020")"""
+    if not date or "year" not in date:
+        return None
+    if "month" in date:
+        return f"{date['year']}-{date['month']:02d}"
+    return str(date["year"])
+
+
+class Experience(Record):
+    """One position, as returned by `Linkedin.get_profile_experiences(typed=True)`"""
+
+    __slots__ = (
+        "title",
+        "company_name",
+        "employment_type",
+        "location_name",
+        "duration",
+        "start_date",
+        "end_date",
+        "description",
+    )
+    _keys = {
+        "title": "title",
+        "company_name": "companyName",
+        "employment_type": "employmentType",
+        "location_name": "locationName",
+        "duration": "duration",
+        "start_date": "startDate",
+        "end_date": "endDate",
+        "description": "description",
+    }
+
+    @classmethod
+    def from_position(cls, position: Dict) -> "Experience":
+        """Return the experience of a `profileView` position"""
+        time_period = position.get("timePeriod") or {}
+        return cls(
+            title=position.get("title"),
+            company_name=position.get("companyName"),
+            location_name=position.get("locationName"),
+            start_date=_format_date(time_period.get("startDate")),
+            end_date=_format_date(time_period.get("endDate")),
+            description=position.get("description"),
+        )
+
+
+class Profile(Record):
+    """A profile, as returned by `Linkedin.get_profile(typed=True)`"""
+
+    __slots__ = (
+        "urn_id",
+        "public_id",
+        "member_urn",
+        "first_name",
+        "last_name",
+        "headline",
+        "summary",
+        "location_name",
+        "industry_name",
+        "display_picture_url",
+        "experience",
+        "skills",
+    )
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["Profile"]:
+        """Return the profile of a dict returned by `Linkedin.get_profile()`"""
+        if not data:
+            return None
+        return cls(
+            urn_id=data.get("urn_id"),
+            public_id=data.get("public_id"),
+            member_urn=data.get("member_urn"),
+            first_name=data.get("firstName"),
+            last_name=data.get("lastName"),
+            headline=data.get("headline"),
+            summary=data.get("summary"),
+            location_name=data.get("locationName"),
+            industry_name=data.get("industryName"),
+            display_picture_url=data.get("displayPictureUrl"),
+            experience=tuple(
+                Experience.from_position(p) for p in data.get("experience", [])
+            ),
+            skills=tuple(s.get("name") for s in data.get("skills", [])),
+        )
+
+
+class PeopleSearchHit(Record):
+    """A people search result, as returned by `Linkedin.search_people(typed=True)`"""
+
+    __slots__ = ("urn_id", "name", "jobtitle", "location", "distance")
+    _keys = {name: name for name in __slots__}
+
+
+class Company(Record):
+    """
+    A company, as returned by `Linkedin.get_company(typed=True)` and
+    `Linkedin.search_companies(typed=True)`. Search results only fill in
+    urn_id, name, headline and subline.
+    """
+
+    __slots__ = (
+        "urn_id",
+        "name",
+        "universal_name",
+        "headline",
+        "subline",
+        "description",
+        "url",
+        "staff_count",
+        "industries",
+    )
+    _keys = {
+        "urn_id": "urn_id",
+        "name": "name",
+        "headline": "headline",
+        "subline": "subline",
+    }
+
+    @classmethod
+    def from_element(cls, data: Optional[Dict]) -> Optional["Company"]:
+        """Return the company of an `/organization/companies` element"""
+        if not data:
+            return None
+        return cls(
+            urn_id=get_id_from_urn(data["entityUrn"]) if "entityUrn" in data else None,
+            name=data.get("name"),
+            universal_name=data.get("universalName"),
+            description=data.get("description"),
+            url=data.get("companyPageUrl"),
+            staff_count=data.get("staffCount"),
+            industries=tuple(
+                i.get("localizedName") for i in data.get("companyIndustries", [])
+            ),
+        )
+
+
+class JobPosting(Record):
+    """A job, as returned by `Linkedin.search_jobs(typed=True)`"""
+
+    __slots__ = ("job_id", "title", "entity_urn", "tracking_urn", "reposted")
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["JobPosting"]:
+        """Return the job of a `JobPosting` entity"""
+        if not data:
+            return None
+        entity_urn = data.get("entityUrn")
+        return cls(
+            job_id=get_id_from_urn(entity_urn) if entity_urn else None,
+            title=data.get("title"),
+            entity_urn=entity_urn,
+            tracking_urn=data.get("trackingUrn"),
+            reposted=data.get("repostedJob"),
+        )
+
+
+def typed_parser(parse_item, record_type):
+    """Return [parse_item] followed by the conversion of its result to [record_type]"""
+    if parse_item is None:
+        return record_type.from_dict
+    return lambda item: record_type.from_dict(parse_item(item))
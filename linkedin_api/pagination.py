@@ -0,0 +1,544 @@
+"""
+Lazy, resumable pagination over Linkedin API collections
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import linkedin_api.settings as settings
+
+logger = logging.getLogger(__name__)
+
+
+class Cursor(object):
+    """
+    Serializable position in a paginated collection.
+
+    :param start: Offset of the page to fetch next
+    :type start: int
+    :param pagination_token: Server-issued token of the page to fetch next, if any
+    :type pagination_token: str, optional
+    :param skip: Number of results of that page which were already consumed
+    :type skip: int
+    :param fetched: Number of results fetched before that page
+    :type fetched: int
+    :param requests: Number of requests made before that page
+    :type requests: int
+    :param done: True once the collection has been exhausted
+    :type done: bool
+    """
+
+    def __init__(
+        self,
+        start: int = 0,
+        pagination_token: Optional[str] = None,
+        skip: int = 0,
+        fetched: int = 0,
+        requests: int = 0,
+        done: bool = False,
+    ):
+        self.start = start
+        self.pagination_token = pagination_token
+        self.skip = skip
+        self.fetched = fetched
+        self.requests = requests
+        self.done = done
+
+    def to_dict(self) -> Dict:
+        return {
+            "start": self.start,
+            "pagination_token": self.pagination_token,
+            "skip": self.skip,
+            "fetched": self.fetched,
+            "requests": self.requests,
+            "done": self.done,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Cursor":
+        return cls(**data)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data: str) -> "Cursor":
+        return cls.from_dict(json.loads(data))
+
+    def __eq__(self, other):
+        return isinstance(other, Cursor) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"Cursor({self.to_dict()})"
+
+
+class Page(object):
+    """
+    One page of results, as returned by a page fetcher.
+
+    :param items: Raw results of the page
+    :type items: list
+    :param pagination_token: Token of the next page, for token-paginated endpoints
+    :type pagination_token: str, optional
+    :param size: Number of positions the page covers, if different from len(items)
+    :type size: int, optional
+    :param last: True if the server indicated there are no further pages
+    :type last: bool, optional
+    :param total: Total size of the collection, as reported by the server
+    :type total: int, optional
+    :param failed: True if the request failed
+    :type failed: bool, optional
+    """
+
+    def __init__(
+        self,
+        items: List,
+        pagination_token: Optional[str] = None,
+        size: Optional[int] = None,
+        last: bool = False,
+        total: Optional[int] = None,
+        failed: bool = False,
+    ):
+        self.items = items
+        self.pagination_token = pagination_token
+        self.size = size
+        self.last = last
+        self.total = total
+        self.failed = failed
+
+
+class CheckpointStore(object):
+    """
+    Base class for storing cursors of long-running crawls, by key.
+    """
+
+    def load(self, key: str) -> Optional[Cursor]:
+        raise NotImplementedError
+
+    def save(self, key: str, cursor: Cursor):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store keeping one JSON file per key in a local directory.
+    """
+
+    def __init__(self, checkpoints_dir: str = settings.CHECKPOINT_PATH):
+        self.checkpoints_dir = checkpoints_dir or settings.CHECKPOINT_PATH
+
+    def _get_filepath(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.checkpoints_dir, f"{digest}.json")
+
+    def load(self, key: str) -> Optional[Cursor]:
+        try:
+            with open(self._get_filepath(key)) as f:
+                return Cursor.from_dict(json.load(f)["cursor"])
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, cursor: Cursor):
+        os.makedirs(self.checkpoints_dir, exist_ok=True)
+        filepath = self._get_filepath(key)
+        tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_filepath, "w") as f:
+            json.dump({"key": key, "cursor": cursor.to_dict()}, f)
+        # atomic replace, so a crash never leaves a truncated checkpoint behind
+        os.replace(tmp_filepath, filepath)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._get_filepath(key))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store keeping all cursors in a single SQLite database.
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = path or os.path.join(
+            settings.LINKEDIN_API_USER_DIR, "checkpoints.sqlite3"
+        )
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints "
+                "(key TEXT PRIMARY KEY, cursor TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> Optional[Cursor]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cursor FROM checkpoints WHERE key = ?", (key,)
+            ).fetchone()
+        return Cursor.from_json(row[0]) if row else None
+
+    def save(self, key: str, cursor: Cursor):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO checkpoints (key, cursor, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET cursor = excluded.cursor, "
+                "updated_at = excluded.updated_at",
+                (key, cursor.to_json(), time.time()),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
+
+
+class _BasePageIterator(object):
+    def __init__(
+        self,
+        fetch_page,
+        offset: int = 0,
+        limit: int = -1,
+        page_size: int = 49,
+        max_requests: int = 200,
+        parse_item: Optional[Callable[[Any], Any]] = None,
+        workers: int = 1,
+    ):
+        self._fetch_page = fetch_page
+        self._parse_item = parse_item
+        self.workers = max(1, workers)
+        # (cursor, count) of pages planned from the collection's total, not yet requested
+        self._plan: Optional[deque] = None
+        # (cursor, count, future) of pages being fetched ahead, in order
+        self._inflight: deque = deque()
+        self._buffer: deque = deque()
+        self._checkpoint_store: Optional[CheckpointStore] = None
+        self._checkpoint_key = ""
+        self.limit = -1 if limit is None else limit
+        self.page_size = page_size
+        self.max_requests = max_requests
+        self.offset = offset
+        self.failed = False
+        # position of the next page to fetch
+        self._next = Cursor(start=offset, done=self.limit == 0)
+        # position of the page currently being consumed
+        self._page = self._next
+        self._page_consumed = 0
+
+    @property
+    def done(self) -> bool:
+        return self._next.done and not self._buffer
+
+    @property
+    def cursor(self) -> Cursor:
+        """Return the position of the next result to be yielded"""
+        if not self._buffer:
+            return Cursor(**self._next.to_dict())
+        return Cursor(**dict(self._page.to_dict(), skip=self._page_consumed))
+
+    def resume(self, cursor: Optional[Cursor]):
+        """Continue iterating from [cursor], as taken from `cursor` or `pages()`
+
+        :return: self
+        """
+        if cursor is None:
+            return self
+        if self._next.requests or self._buffer:
+            raise RuntimeError("Cannot resume an iterator which has already started")
+        self._next = Cursor(**cursor.to_dict())
+        self._page = self._next
+        self.offset = cursor.start + cursor.skip
+        return self
+
+    def checkpoint(self, store: CheckpointStore, key: str):
+        """Resume from, and keep saving progress to, the checkpoint [key] of [store]
+
+        Progress is saved whenever a page has been fully consumed, and the
+        checkpoint is deleted once the collection is exhausted.
+
+        :return: self
+        """
+        self.resume(store.load(key))
+        self._checkpoint_store = store
+        self._checkpoint_key = key
+        return self
+
+    def _save_checkpoint(self):
+        if self._checkpoint_store is None:
+            return
+        if self.done:
+            self._checkpoint_store.delete(self._checkpoint_key)
+        else:
+            self._checkpoint_store.save(self._checkpoint_key, self.cursor)
+
+    def _next_count(self) -> int:
+        # when we're close to the limit, only fetch what we need to
+        if self.limit > -1:
+            return min(self.page_size, self.limit - self._next.fetched)
+        return self.page_size
+
+    def _plan_pages(self, total: int, page_size: Optional[int] = None) -> deque:
+        """Return the (cursor, count) of every page left before [total], each
+        holding [page_size] results (defaults to the requested page size)"""
+        page_size = min(self.page_size, page_size or self.page_size)
+        plan = deque()
+        start = self._next.start
+        fetched = self._next.fetched
+        requests = self._next.requests
+        while start < total and requests < self.max_requests:
+            count = min(page_size, total - start)
+            if self.limit > -1:
+                if fetched >= self.limit:
+                    break
+                count = min(count, self.limit - fetched)
+            plan.append(
+                (Cursor(start=start, fetched=fetched, requests=requests), count)
+            )
+            start += count
+            fetched += count
+            requests += 1
+        return plan
+
+    def _should_prefetch(self, page: Page) -> bool:
+        return (
+            self.workers > 1
+            and self._plan is None
+            and page.total is not None
+            and not page.pagination_token
+            and not self._next.done
+        )
+
+    @staticmethod
+    def _get_served_size(page: Page) -> int:
+        """Return how many results the server put in [page], whatever was requested.
+
+        Some endpoints (e.g. search) ignore the requested count, so later pages are
+        planned from what the first page actually held.
+        """
+        return page.size if page.size is not None else len(page.items)
+
+    def _add_planned_page(self, count: int, page: Page):
+        # planned pages always advance by their planned size, so the following
+        # planned offsets stay valid even if the server returns a short page
+        if page.size is None and page.items and not page.failed:
+            page.size = count
+        self._add_page(page)
+
+    def _add_page(self, page: Page):
+        cursor = self._next
+        items = page.items
+        # servers ignoring the requested count may serve more than the limit needs,
+        # planned pages included, whose size only drives the offsets
+        if self.limit > -1:
+            items = items[: self.limit - cursor.fetched]
+        size = page.size if page.size is not None else len(items)
+
+        self._page = cursor
+        self._next = Cursor(
+            start=cursor.start + size,
+            pagination_token=page.pagination_token,
+            fetched=cursor.fetched + size,
+            requests=cursor.requests + 1,
+        )
+        # skip what was already consumed before the iteration was resumed
+        self._buffer.extend(items[cursor.skip :])
+        self._page_consumed = min(cursor.skip, len(items))
+
+        if page.failed:
+            self.failed = True
+
+        # stop if we're done paginating
+        if (
+            page.failed
+            or page.last
+            or not size
+            or (page.total is not None and self._next.start >= page.total)
+            or (-1 < self.limit <= self._next.fetched)
+            or self._next.requests >= self.max_requests
+        ):
+            self._next.done = True
+        else:
+            logger.debug(f"results grew to {self._next.fetched}")
+
+    def _pop(self):
+        """Return the next parsed item of the buffer, or None if it is skipped"""
+        item = self._buffer.popleft()
+        self.offset += 1
+        self._page_consumed += 1
+        if self._parse_item is not None:
+            return self._parse_item(item)
+        return item
+
+    def _pop_page(self) -> List:
+        items = []
+        while self._buffer:
+            item = self._pop()
+            if item is not None:
+                items.append(item)
+        return items
+
+
+class PageIterator(_BasePageIterator):
+    """
+    Iterator over the results of a paginated Linkedin API collection.
+
+    Pages are fetched one at a time, only when more results are needed, so breaking
+    out of a loop never fetches extra pages. The position of the next result is
+    available as a serializable `cursor`, which can be passed to `resume()` later,
+    or persisted automatically with `checkpoint()`.
+
+    :param fetch_page: Callable taking (cursor, count) and returning a Page
+    :type fetch_page: callable
+    :param offset: Index to start from
+    :type offset: int, optional
+    :param limit: Maximum number of raw results to fetch, defaults to -1 (no limit)
+    :type limit: int, optional
+    :param page_size: Number of results to request per page
+    :type page_size: int, optional
+    :param max_requests: Maximum number of pages to request
+    :type max_requests: int, optional
+    :param parse_item: Callable applied to each raw result. Results for which it returns None are skipped.
+    :type parse_item: callable, optional
+    :param workers: Number of pages to fetch concurrently once the first page has
+        reported the collection's total, defaults to 1 (one page at a time)
+    :type workers: int, optional
+
+    With [workers], stop the threads fetching ahead by calling `close()` when
+    breaking out of a loop early, or by using the iterator as a context manager.
+    They are also stopped once the iterator is garbage collected.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def _prefetch(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        while self._plan and len(self._inflight) < self.workers:
+            cursor, count = self._plan.popleft()
+            future = self._executor.submit(self._fetch_page, cursor, count)
+            self._inflight.append((cursor, count, future))
+
+    def close(self):
+        """Cancel the pages being fetched ahead, if any, and stop their threads"""
+        self._plan = deque()
+        while self._inflight:
+            self._inflight.popleft()[2].cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _fill_buffer(self) -> bool:
+        while not self._buffer:
+            if self._next.done:
+                self.close()
+                self._save_checkpoint()
+                return False
+            if self._next.requests:
+                # the previous page has been fully consumed
+                self._save_checkpoint()
+            if self._inflight:
+                _, count, future = self._inflight.popleft()
+                self._add_planned_page(count, future.result())
+                self._prefetch()
+                continue
+            page = self._fetch_page(self._next, self._next_count())
+            self._add_page(page)
+            if self._should_prefetch(page):
+                self._plan = self._plan_pages(page.total, self._get_served_size(page))
+                self._prefetch()
+        return True
+
+    def __next__(self):
+        while self._fill_buffer():
+            item = self._pop()
+            if item is not None:
+                return item
+        raise StopIteration
+
+    def pages(self):
+        """Yield (results, cursor) for each remaining page, cursor being the position after that page"""
+        while self._fill_buffer():
+            yield self._pop_page(), self.cursor
+
+
+class AsyncPageIterator(_BasePageIterator):
+    """
+    Asynchronous counterpart of `PageIterator`, for use with `async for`.
+
+    :param fetch_page: Coroutine function taking (cursor, count) and returning a Page
+    :type fetch_page: callable
+    """
+
+    def __aiter__(self):
+        return self
+
+    def _prefetch(self):
+        import asyncio
+
+        while self._plan and len(self._inflight) < self.workers:
+            cursor, count = self._plan.popleft()
+            task = asyncio.ensure_future(self._fetch_page(cursor, count))
+            self._inflight.append((cursor, count, task))
+
+    def close(self):
+        """Cancel the pages being fetched ahead, if any"""
+        self._plan = deque()
+        while self._inflight:
+            self._inflight.popleft()[2].cancel()
+
+    async def _fill_buffer(self) -> bool:
+        while not self._buffer:
+            if self._next.done:
+                self.close()
+                self._save_checkpoint()
+                return False
+            if self._next.requests:
+                # the previous page has been fully consumed
+                self._save_checkpoint()
+            if self._inflight:
+                _, count, task = self._inflight.popleft()
+                self._add_planned_page(count, await task)
+                self._prefetch()
+                continue
+            page = await self._fetch_page(self._next, self._next_count())
+            self._add_page(page)
+            if self._should_prefetch(page):
+                self._plan = self._plan_pages(page.total, self._get_served_size(page))
+                self._prefetch()
+        return True
+
+    async def __anext__(self):
+        while await self._fill_buffer():
+            item = self._pop()
+            if item is not None:
+                return item
+        raise StopAsyncIteration
+
+    async def pages(self):
+        """Yield (results, cursor) for each remaining page, cursor being the position after that page"""
+        while await self._fill_buffer():
+            yield self._pop_page(), self.cursor
@@ -0,0 +1,213 @@
+"""
+Token-bucket rate limiting for Linkedin API requests
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket, refilled continuously against wall-clock time.
+
+    :param per_minute: Number of tokens added to the bucket per minute
+    :type per_minute: float
+    :param burst: Maximum number of tokens the bucket can hold
+    :type burst: int
+    """
+
+    def __init__(self, per_minute: float, burst: int, clock=time.monotonic):
+        if per_minute <= 0:
+            raise ValueError("per_minute must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.per_minute = per_minute
+        self.burst = burst
+        # fraction of [per_minute] currently allowed, lowered while being throttled
+        self.scale = 1.0
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the refill rate, in tokens per second"""
+        return self.per_minute * self.scale / 60.0
+
+    def set_scale(self, scale: float):
+        """Change the fraction of [per_minute] the bucket is refilled at"""
+        with self._lock:
+            # tokens accrued so far are accounted for at the previous rate
+            self._refill(self._clock())
+            self.scale = scale
+
+    def block(self, seconds: float):
+        """Empty the bucket so that no token is available for [seconds]"""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def _refill(self, now: float):
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Return the number of tokens currently available"""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take [tokens] from the bucket.
+
+        The tokens are always taken, which may leave the bucket in debt. The caller
+        must then wait for the returned number of seconds before using them.
+
+        :return: Seconds to wait before the reserved tokens may be used
+        :rtype: float
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+_shared_limiters: Dict[str, "RateLimiter"] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+class RateLimiter(object):
+    """
+    Class to pace requests made to the Linkedin API.
+
+    Every request draws from an account-wide bucket, and additionally from the
+    bucket of its endpoint family (see `get_endpoint_family`) if one is configured.
+    Requests are only delayed once the relevant budget is exhausted.
+
+    :param per_minute: Sustained number of requests per minute for the account
+    :type per_minute: float, optional
+    :param burst: Number of requests that can be made back-to-back before pacing kicks in
+    :type burst: int, optional
+    :param families: Per-family budgets, as a dict of family name to (per_minute, burst)
+    :type families: dict, optional
+    :param jitter: Maximum random number of seconds added to each delay
+    :type jitter: float, optional
+    :param min_scale: Lowest fraction of the configured rates that `penalize()` may go down to
+    :type min_scale: float, optional
+    :param recovery: Fraction of the configured rates regained by each `reward()`
+    :type recovery: float, optional
+    """
+
+    DEFAULT_PER_MINUTE = 30
+    DEFAULT_BURST = 10
+
+    def __init__(
+        self,
+        per_minute: float = DEFAULT_PER_MINUTE,
+        burst: int = DEFAULT_BURST,
+        families: Optional[Dict[str, Tuple[float, int]]] = None,
+        jitter: float = 0.0,
+        min_scale: float = 1 / 16,
+        recovery: float = 0.05,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self.jitter = jitter
+        self.min_scale = min_scale
+        self.recovery = recovery
+        self.bucket = TokenBucket(per_minute, burst, clock=clock)
+        self.family_buckets = {
+            family: TokenBucket(family_per_minute, family_burst, clock=clock)
+            for family, (family_per_minute, family_burst) in (families or {}).items()
+        }
+
+    @classmethod
+    def shared(cls, account: str, **kwargs) -> "RateLimiter":
+        """Return the process-wide rate limiter for a given account, creating it if needed.
+
+        Use this to make several `Linkedin` instances for the same account draw from
+        the same budget. [kwargs] are only used when the limiter is first created.
+
+        :param account: Account identifier, typically the username
+        :type account: str
+
+        :return: Rate limiter shared by all callers for [account]
+        :rtype: RateLimiter
+        """
+        with _shared_limiters_lock:
+            limiter = _shared_limiters.get(account)
+            if limiter is None:
+                limiter = cls(**kwargs)
+                _shared_limiters[account] = limiter
+            return limiter
+
+    def reserve(self, family: Optional[str] = None) -> float:
+        """Reserve budget for one request, without blocking.
+
+        :param family: Endpoint family of the request
+        :type family: str, optional
+
+        :return: Seconds to wait before making the request
+        :rtype: float
+        """
+        wait = self.bucket.reserve()
+        family_bucket = self.family_buckets.get(family) if family else None
+        if family_bucket is not None:
+            wait = max(wait, family_bucket.reserve())
+
+        if wait > 0 and self.jitter:
+            wait += random.uniform(0, self.jitter)
+        return wait
+
+    def acquire(self, family: Optional[str] = None) -> float:
+        """Block until one request may be made.
+
+        :param family: Endpoint family of the request
+        :type family: str, optional
+
+        :return: Seconds spent waiting
+        :rtype: float
+        """
+        wait = self.reserve(family)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def _get_buckets(self, family: Optional[str] = None):
+        buckets = [self.bucket]
+        if family and family in self.family_buckets:
+            buckets.append(self.family_buckets[family])
+        return buckets
+
+    def penalize(self, family: Optional[str] = None, retry_after: float = 0.0):
+        """Slow down after a throttled request: halve the rates, and if [retry_after]
+        is given, hold back every request for that many seconds.
+
+        :param family: Endpoint family of the throttled request
+        :type family: str, optional
+        :param retry_after: Seconds the server asked to wait
+        :type retry_after: float, optional
+        """
+        for bucket in self._get_buckets(family):
+            bucket.set_scale(max(self.min_scale, bucket.scale / 2))
+            if retry_after > 0:
+                bucket.block(retry_after)
+
+    def reward(self, family: Optional[str] = None):
+        """Speed back up, by [recovery], after a successful request
+
+        :param family: Endpoint family of the successful request
+        :type family: str, optional
+        """
+        for bucket in self._get_buckets(family):
+            if bucket.scale < 1.0:
+                bucket.set_scale(min(1.0, bucket.scale + self.recovery))
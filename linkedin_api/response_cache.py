@@ -0,0 +1,191 @@
+"""
+On-disk cache of Linkedin API responses
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import linkedin_api.settings as settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = (None, "bypass", "refresh", "only")
+
+# seconds a response stays fresh, by endpoint family (see get_endpoint_family)
+DEFAULT_TTLS = {
+    "profiles": 24 * 60 * 60,
+    "companies": 7 * 24 * 60 * 60,
+    "jobs": 24 * 60 * 60,
+    "feed": 0,
+}
+
+# TTLs overriding the one of their family, by endpoint template (see get_endpoint_template)
+DEFAULT_ENDPOINT_TTLS = {
+    # these depend on who is asking, not only on the profile
+    "/identity/profiles/{id}/networkinfo": 0,
+    "/identity/profiles/{id}/privacySettings": 0,
+    "/identity/profiles/{id}/profileContactInfo": 0,
+}
+
+
+class CacheMissError(Exception):
+    """Raised when a request made with cache="only" has no fresh response in the cache"""
+
+    pass
+
+
+def build_response(url: str, status: int, headers: Dict, body: bytes):
+    """Return a `requests.Response` replaying a cached response
+
+    :rtype: requests.Response
+    """
+    res = requests.Response()
+    res.url = url
+    res.status_code = status
+    res.headers = CaseInsensitiveDict(headers)
+    res._content = body
+    res.encoding = "utf-8"
+    res.from_cache = True
+    return res
+
+
+class ResponseCache(object):
+    """
+    SQLite-backed cache of response bodies, compressed with zlib.
+
+    Entries expire according to the TTL of their endpoint, or else of their endpoint
+    family. Endpoints without a TTL (or with a TTL of 0) are never cached. Once the total size of the stored
+    bodies exceeds [max_bytes], the least recently used entries are evicted.
+
+    :param path: Path of the SQLite database, defaults to ~/.linkedin_api/responses.sqlite3
+    :type path: str, optional
+    :param ttls: TTL in seconds by endpoint family, merged over the defaults
+    :type ttls: dict, optional
+    :param default_ttl: TTL in seconds of families missing from [ttls], defaults to 0 (not cached)
+    :type default_ttl: int, optional
+    :param endpoint_ttls: TTL in seconds by endpoint template, overriding the TTL of
+        their family, merged over the defaults
+    :type endpoint_ttls: dict, optional
+    :param max_bytes: Maximum total size of the compressed bodies
+    :type max_bytes: int, optional
+    """
+
+    def __init__(
+        self,
+        path: str = "",
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0,
+        max_bytes: int = 256 * 1024 * 1024,
+        clock=time.time,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.path = path or os.path.join(
+            settings.LINKEDIN_API_USER_DIR, "responses.sqlite3"
+        )
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS, **(endpoint_ttls or {}))
+        self.max_bytes = max_bytes
+        self._clock = clock
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, status INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(url: str, accept: Optional[str] = None) -> str:
+        """Return the cache key of a GET request to [url] (including its query string)"""
+        return hashlib.sha1(f"{url}\n{accept or ''}".encode()).hexdigest()
+
+    def get_ttl(self, family: str, endpoint: Optional[str] = None) -> float:
+        """Return the TTL of the responses of [endpoint], a template of the [family]"""
+        if endpoint is not None and endpoint in self.endpoint_ttls:
+            return self.endpoint_ttls[endpoint]
+        return self.ttls.get(family, self.default_ttl)
+
+    def get(self, key: str, ttl: float) -> Optional[Tuple[int, Dict, bytes]]:
+        """Return (status, headers, body) of the entry [key] if it is fresher than [ttl]
+
+        :rtype: tuple
+        """
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[3] > ttl:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        status, headers, body, _ = row
+        return status, json.loads(headers), zlib.decompress(body)
+
+    def set(self, key: str, url: str, status: int, headers: Dict, body: bytes):
+        compressed = zlib.compress(body)
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status, headers, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    status,
+                    json.dumps(headers),
+                    compressed,
+                    len(compressed),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def _evict(self):
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.debug(f"evicted {evicted} responses from cache")
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
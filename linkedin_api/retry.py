@@ -0,0 +1,142 @@
+"""
+Retry policy of throttled and transient responses
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+OK = "ok"
+THROTTLED = "throttled"
+TRANSIENT = "transient"
+FATAL = "fatal"
+
+
+def parse_retry_after(value: Optional[str], now=None) -> Optional[float]:
+    """Return the number of seconds a `Retry-After` header asks to wait, if valid
+
+    :param value: Header value, either a number of seconds or an HTTP date
+    :type value: str
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (date - now).total_seconds())
+
+
+class RetryPolicy(object):
+    """
+    Decides which requests of a `Linkedin` instance are retried, and how long to wait
+    before each retry.
+
+    Responses are classified as throttled (429, and 999 which LinkedIn answers when
+    it suspects automation), transient (5xx gateway and availability errors, connection errors) or
+    fatal (any other error). Throttled requests are always retried; transient
+    failures only for GET requests, since a POST may have been applied already.
+
+    Delays grow exponentially from [backoff], are randomized by up to [jitter] of
+    their value, and honor the `Retry-After` header when the server sends one.
+
+    Once the retries are exhausted the last response is returned, as it would be
+    without retrying, so callers keep checking its `status_code`.
+
+    :param max_retries: Number of retries of a request, 0 to disable retrying
+    :type max_retries: int, optional
+    :param backoff: Delay before the first retry, in seconds
+    :type backoff: float, optional
+    :param max_backoff: Upper bound of a delay, in seconds
+    :type max_backoff: float, optional
+    :param jitter: Fraction of each delay which is randomized
+    :type jitter: float, optional
+    :param raise_on_throttled: Raise `RateLimitedException` instead of returning the
+        last response when a request is still throttled after all retries
+    :type raise_on_throttled: bool, optional
+    """
+
+    THROTTLED_STATUS_CODES = (429, 999)
+    TRANSIENT_STATUS_CODES = (500, 502, 503, 504)
+    TRANSIENT_EXCEPTIONS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    )
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        jitter: float = 0.5,
+        raise_on_throttled: bool = False,
+        sleep=time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.raise_on_throttled = raise_on_throttled
+        self._sleep = sleep
+
+    def classify(
+        self,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> str:
+        """Return how a request went: "ok", "throttled", "transient" or "fatal" """
+        if error is not None:
+            return TRANSIENT if self.is_transient_error(error) else FATAL
+        if response.status_code in RetryPolicy.THROTTLED_STATUS_CODES:
+            return THROTTLED
+        if response.status_code in RetryPolicy.TRANSIENT_STATUS_CODES:
+            return TRANSIENT
+        if response.status_code >= 400:
+            return FATAL
+        return OK
+
+    @staticmethod
+    def is_transient_error(error: Exception) -> bool:
+        """Return whether [error], raised while sending a request, is worth a retry"""
+        if isinstance(error, RetryPolicy.TRANSIENT_EXCEPTIONS):
+            return True
+        # httpx is only imported by AsyncLinkedin, so its errors can't be raised before
+        httpx = sys.modules.get("httpx")
+        return httpx is not None and isinstance(error, httpx.TransportError)
+
+    def should_retry(self, method: str, outcome: str, attempt: int) -> bool:
+        """Return whether the request is sent again after its [attempt]-th try failed"""
+        if attempt >= self.max_retries:
+            return False
+        if outcome == THROTTLED:
+            return True
+        return outcome == TRANSIENT and method.upper() in RetryPolicy.IDEMPOTENT_METHODS
+
+    def get_delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """Return the number of seconds to wait before retrying [attempt]"""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        return delay * (1 - self.jitter * random.random())
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self._sleep(seconds)
@@ -0,0 +1,186 @@
+"""
+Background refresh of authenticated sessions, before their cookies expire
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from linkedin_api.client import Client
+from linkedin_api.cookie_repository import get_jsessionid_expiry
+
+logger = logging.getLogger(__name__)
+
+
+class KeptSession(object):
+    """One client kept warm by a `SessionKeeper`, with its refresh counters"""
+
+    def __init__(self, name: str, client: Client, username: str, password: str):
+        self.name = name
+        self.client = client
+        self.username = username
+        self.password = password
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refresh: Optional[float] = None
+        self.last_error: Optional[str] = None
+        # no refresh is attempted before then, after a failure
+        self.retry_at = 0.0
+
+    def get_expiry(self) -> Optional[float]:
+        """Return when the cookies of the client expire, None if they don't say"""
+        return get_jsessionid_expiry(self.client.cookies) or None
+
+    def stats(self, now: float) -> Dict:
+        expires = self.get_expiry()
+        return {
+            "name": self.name,
+            "expires": expires,
+            "time_to_expiry": expires - now if expires is not None else None,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_refresh": self.last_refresh,
+            "last_error": self.last_error,
+        }
+
+
+class SessionKeeper(object):
+    """
+    Keeps the sessions of clients authenticated, by signing in again in a background
+    thread when their JSESSIONID cookie gets within [refresh_before] seconds of
+    expiring, instead of failing with `LinkedinSessionExpired` in the middle of a batch.
+
+    Refreshed cookies are saved to the cookie storage of the client, and swapped into
+    its `session` at once (see `Client.refresh_session()`).
+
+    :param refresh_before: Number of seconds before expiry a session is refreshed
+    :type refresh_before: float, optional
+    :param check_interval: Number of seconds between two checks of the background thread
+    :type check_interval: float, optional
+    :param retry_interval: Number of seconds before retrying a refresh which failed
+    :type retry_interval: float, optional
+    """
+
+    def __init__(
+        self,
+        refresh_before: float = 24 * 3600,
+        check_interval: float = 60,
+        retry_interval: float = 5 * 60,
+        clock=time.time,
+    ):
+        self.refresh_before = refresh_before
+        self.check_interval = check_interval
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.sessions: List[KeptSession] = []
+
+    def add(
+        self, client: Client, username: str, password: str, name: str = ""
+    ) -> KeptSession:
+        """Keep the session of [client], authenticated as [username], warm
+
+        :return: The kept session
+        :rtype: KeptSession
+        """
+        session = KeptSession(name or username, client, username, password)
+        with self._lock:
+            self.sessions.append(session)
+        return session
+
+    def remove(self, client: Client):
+        """Stop refreshing the session of [client]"""
+        with self._lock:
+            self.sessions = [s for s in self.sessions if s.client is not client]
+
+    def check(self) -> List[KeptSession]:
+        """Refresh the sessions which are about to expire, once
+
+        :return: The sessions refreshed
+        :rtype: list
+        """
+        now = self._clock()
+        with self._lock:
+            due = [s for s in self.sessions if self._is_due(s, now)]
+
+        refreshed = []
+        for session in due:
+            if self.refresh(session):
+                refreshed.append(session)
+        return refreshed
+
+    def _is_due(self, session: KeptSession, now: float) -> bool:
+        expires = session.get_expiry()
+        if expires is None or now < session.retry_at:
+            return False
+        return expires - now <= self.refresh_before
+
+    def refresh(self, session: KeptSession) -> bool:
+        """Authenticate [session] again, now
+
+        :return: Whether the refresh succeeded
+        :rtype: bool
+        """
+        logger.info(
+            f"refreshing session {session.name}, expiring in "
+            f"{(session.get_expiry() or 0) - self._clock():.0f}s"
+        )
+        try:
+            session.client.refresh_session(session.username, session.password)
+        except Exception as e:
+            with self._lock:
+                session.failures += 1
+                session.last_error = repr(e)
+                session.retry_at = self._clock() + self.retry_interval
+            logger.warning(f"failed to refresh session {session.name}: {e!r}")
+            return False
+        with self._lock:
+            session.refreshes += 1
+            session.last_refresh = self._clock()
+            session.last_error = None
+            session.retry_at = 0.0
+        return True
+
+    def start(self):
+        """Start checking the sessions in a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="linkedin-session-keeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background thread, waiting for a refresh in progress to finish"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception:
+                logger.exception("session check failed")
+            self._stop.wait(self.check_interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def stats(self) -> List[Dict]:
+        """Return the time to expiry and refresh counters of every session"""
+        now = self._clock()
+        with self._lock:
+            return [session.stats(now) for session in self.sessions]
+
+    def __len__(self):
+        return len(self.sessions)
@@ -0,0 +1,270 @@
+"""
+Pool of authenticated Linkedin accounts
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from linkedin_api.client import ChallengeException, Client, UnauthorizedException
+from linkedin_api.cookie_repository import CookieStorage
+from linkedin_api.rate_limiter import RateLimiter
+from linkedin_api.session_keeper import SessionKeeper
+from linkedin_api.transport import TransportConfig
+
+logger = logging.getLogger(__name__)
+
+
+class NoAvailableAccountException(Exception):
+    pass
+
+
+class PooledAccount(object):
+    """
+    One account of a `SessionPool`: an authenticated `Client`, its own rate limiter,
+    and usage counters.
+
+    An account which failed to authenticate is kept out of rotation until it
+    authenticates again, which the pool retries once its quarantine is over.
+    """
+
+    def __init__(
+        self, name: str, client: Client, rate_limiter: Optional[RateLimiter] = None
+    ):
+        self.name = name
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.quarantines = 0
+        self.quarantined_until = 0.0
+        self.last_error: Optional[str] = None
+        self.authenticated = True
+        # (username, password, session keeper) to authenticate again with
+        self._credentials: Optional[Tuple[str, str, Optional[SessionKeeper]]] = None
+        self._authenticating = False
+
+    def is_healthy(self, now: float) -> bool:
+        return self.authenticated and now >= self.quarantined_until
+
+    def is_due_for_authentication(self, now: float) -> bool:
+        return (
+            not self.authenticated
+            and not self._authenticating
+            and self._credentials is not None
+            and now >= self.quarantined_until
+        )
+
+    def _load_key(self):
+        # fewest requests in flight first, then the fullest rate budget
+        available = (
+            self.rate_limiter.bucket.available() if self.rate_limiter is not None else 0
+        )
+        return (self.in_flight, -available, self.requests)
+
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "quarantines": self.quarantines,
+            "quarantined_until": self.quarantined_until,
+            "authenticated": self.authenticated,
+            "last_error": self.last_error,
+        }
+
+
+class SessionPool(object):
+    """
+    Pool of authenticated accounts, to spread requests of a `Linkedin` instance
+    over several accounts.
+
+    Each request is dispatched to the least loaded healthy account. Accounts whose
+    requests are rejected with a 401, or which fail to authenticate with a
+    challenge, are quarantined for [quarantine_seconds]. The latter only go back
+    into rotation once they authenticate successfully, which is tried again when
+    their quarantine is over.
+
+    :param quarantine_seconds: Number of seconds an account is left out after failing
+    :type quarantine_seconds: float, optional
+    """
+
+    QUARANTINE_STATUS_CODES = (401,)
+
+    def __init__(self, quarantine_seconds: float = 30 * 60, clock=time.monotonic):
+        self.quarantine_seconds = quarantine_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.accounts: List[PooledAccount] = []
+
+    def add(
+        self, client: Client, name: str = "", rate_limiter: Optional[RateLimiter] = None
+    ) -> PooledAccount:
+        """Add an already authenticated [client] to the pool
+
+        :return: The pooled account
+        :rtype: PooledAccount
+        """
+        account = PooledAccount(
+            name or f"account-{len(self.accounts)}", client, rate_limiter
+        )
+        with self._lock:
+            self.accounts.append(account)
+        return account
+
+    def add_account(
+        self,
+        username: str,
+        password: str,
+        *,
+        proxies={},
+        cookies=None,
+        cookies_dir: str = "",
+        refresh_cookies=False,
+        transport_config: Optional[TransportConfig] = None,
+        cookie_storage: Optional[CookieStorage] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session_keeper: Optional[SessionKeeper] = None,
+    ) -> PooledAccount:
+        """Authenticate [username] and add it to the pool
+
+        An account which can't authenticate because of a challenge is still added,
+        but quarantined, and left out until it authenticates.
+
+        :param rate_limiter: Rate limiter of this account, defaults to `RateLimiter.shared(username)`
+        :type rate_limiter: RateLimiter, optional
+        :param session_keeper: Refreshes the cookies of the account before they expire
+        :type session_keeper: SessionKeeper, optional
+
+        :return: The pooled account
+        :rtype: PooledAccount
+        """
+        client = Client(
+            refresh_cookies=refresh_cookies,
+            proxies=proxies,
+            cookies_dir=cookies_dir,
+            transport_config=transport_config,
+            cookie_storage=cookie_storage,
+        )
+        account = self.add(
+            client,
+            name=username,
+            rate_limiter=rate_limiter or RateLimiter.shared(username),
+        )
+        account._credentials = (username, password, session_keeper)
+        if cookies:
+            client._set_session_cookies(cookies)
+        else:
+            self._authenticate(account, (ChallengeException, UnauthorizedException))
+        return account
+
+    def _authenticate(self, account: PooledAccount, errors) -> bool:
+        """Authenticate [account] with its credentials, quarantining it on [errors]
+
+        :return: Whether the account authenticated
+        :rtype: bool
+        """
+        username, password, session_keeper = account._credentials
+        try:
+            account.client.authenticate(username, password)
+        except errors as e:
+            with self._lock:
+                account.authenticated = False
+                account._authenticating = False
+            self.quarantine(account, e)
+            return False
+        with self._lock:
+            account.authenticated = True
+            account._authenticating = False
+        if session_keeper is not None:
+            session_keeper.remove(account.client)
+            session_keeper.add(account.client, username, password)
+        return True
+
+    def _authenticate_due(self):
+        """Authenticate again the accounts which failed to and whose quarantine is over"""
+        with self._lock:
+            now = self._clock()
+            due = [a for a in self.accounts if a.is_due_for_authentication(now)]
+            for account in due:
+                # so that other threads don't authenticate it at the same time
+                account._authenticating = True
+        for account in due:
+            logger.info(f"authenticating account {account.name} again")
+            # whatever the error, the account stays out until the next attempt
+            self._authenticate(account, Exception)
+
+    def quarantine(self, account: PooledAccount, reason=None):
+        with self._lock:
+            account.quarantines += 1
+            account.quarantined_until = self._clock() + self.quarantine_seconds
+            account.last_error = repr(reason) if reason is not None else None
+        logger.warning(f"quarantined account {account.name}: {reason!r}")
+
+    def acquire(self) -> PooledAccount:
+        """Reserve the least loaded healthy account for one request
+
+        :raises NoAvailableAccountException: if all accounts are quarantined
+        :rtype: PooledAccount
+        """
+        self._authenticate_due()
+        with self._lock:
+            now = self._clock()
+            healthy = [a for a in self.accounts if a.is_healthy(now)]
+            if not healthy:
+                raise NoAvailableAccountException(
+                    f"All {len(self.accounts)} accounts are quarantined"
+                )
+            account = min(healthy, key=PooledAccount._load_key)
+            account.in_flight += 1
+            account.requests += 1
+            return account
+
+    def release(
+        self,
+        account: PooledAccount,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+    ):
+        """Release an account reserved with `acquire()`, reporting how its request went"""
+        with self._lock:
+            account.in_flight -= 1
+            if error is not None or (status_code or 0) >= 400:
+                account.failures += 1
+        if isinstance(error, (ChallengeException, UnauthorizedException)):
+            self.quarantine(account, error)
+        elif status_code in SessionPool.QUARANTINE_STATUS_CODES:
+            self.quarantine(account, f"HTTP {status_code}")
+
+    @contextmanager
+    def lease(self):
+        """Context manager reserving an account, see `acquire()`.
+
+        Set the `status_code` attribute of the lease to report the response status.
+        """
+        account = self.acquire()
+        lease = _Lease(account)
+        try:
+            yield lease
+        except Exception as e:
+            self.release(account, error=e)
+            raise
+        self.release(account, status_code=lease.status_code)
+
+    def stats(self) -> List[Dict]:
+        """Return the usage counters of every account"""
+        with self._lock:
+            return [account.stats() for account in self.accounts]
+
+    def __len__(self):
+        return len(self.accounts)
+
+
+class _Lease(object):
+    def __init__(self, account: PooledAccount):
+        self.account = account
+        self.status_code: Optional[int] = None
@@ -0,0 +1,80 @@
+"""
+Coalescing of identical concurrent requests
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight(object):
+    """
+    Shares one call among the threads asking for the same key at the same time.
+
+    The first thread to ask for a key (the leader) runs the call; threads asking for
+    that key while it is in flight wait for it and get its result, or its exception,
+    instead of running their own. Nothing is kept once the call returns: this is not
+    a cache, see `ResponseCache` for that.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], share=copy.copy) -> Any:
+        """Return the result of [fn], or of the in-flight call for [key] if any
+
+        :param share: Function applied to the result handed to each follower
+        :type share: function, optional
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return share(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.followers:
+                logger.debug(f"shared one call among {call.followers + 1} callers")
+        return call.result
+
+    def stats(self) -> Dict:
+        """Return the number of calls, and of calls saved by sharing an in-flight one"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,87 @@
+"""
+Connection pooling, keep-alive and timeout settings of the HTTP transport
+"""
+
+from typing import Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+
+
+class TransportConfig(object):
+    """
+    Settings of the connection pool every request of a `Client` goes through,
+    authentication included.
+
+    :param pool_connections: Number of per-host connection pools to keep
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections kept alive per host
+    :type pool_maxsize: int, optional
+    :param pool_block: Wait for a free connection instead of opening an extra one
+        (which isn't kept alive) when a host's pool is exhausted
+    :type pool_block: bool, optional
+    :param connect_timeout: Seconds to wait for a connection, None to wait forever
+    :type connect_timeout: float, optional
+    :param read_timeout: Seconds to wait for a response, None to wait forever
+    :type read_timeout: float, optional
+    :param keep_alive: Reuse connections between requests
+    :type keep_alive: bool, optional
+    :param max_retries: Number of retries of failed connections (not of responses)
+    :type max_retries: int, optional
+    :param http2: Use HTTP/2. Only supported by `AsyncLinkedin`, through httpx, and
+        requires the h2 package: `pip install httpx[http2]`
+    :type http2: bool, optional
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        connect_timeout: Optional[float] = 10,
+        read_timeout: Optional[float] = 60,
+        keep_alive: bool = True,
+        max_retries: int = 0,
+        http2: bool = False,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self.http2 = http2
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """Return the (connect, read) timeout, as taken by requests"""
+        return self.connect_timeout, self.read_timeout
+
+    def build_adapter(self) -> HTTPAdapter:
+        """Return a requests transport adapter with these settings"""
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=self.max_retries,
+        )
+
+    def build_httpx_transport(self, max_connections: int, proxy=None):
+        """Return an httpx transport with these settings, for `AsyncLinkedin`"""
+        import httpx
+
+        return httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections if self.keep_alive else 0,
+            ),
+            http2=self.http2,
+            retries=self.max_retries,
+            proxy=proxy,
+        )
+
+    def httpx_timeout(self):
+        """Return the timeout of these settings, as taken by httpx"""
+        import httpx
+
+        return httpx.Timeout(None, connect=self.connect_timeout, read=self.read_timeout)
@@ -1,6 +1,28 @@
 import random
 import base64
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs, unquote
+
+# Ordered (path prefix, family) pairs. The first matching prefix wins.
+_ENDPOINT_FAMILY_PREFIXES = (
+    ("/identity/profiles/", "profiles"),
+    ("/identity/profileUpdatesV2", "feed"),
+    ("/organization/companies", "companies"),
+    ("/feed/", "feed"),
+    ("/voyagerSocialDashReactions", "feed"),
+    ("/jobs/", "jobs"),
+    ("/voyagerAssessmentsDashJobSkillMatchInsight", "jobs"),
+    ("/voyagerJobsDashJobCards", "search"),
+    ("/messaging/", "messaging"),
+    ("/relationships/", "relationships"),
+    ("/voyagerRelationshipsDashMemberRelationships", "relationships"),
+)
+
+# GraphQL endpoints are told apart by the name part of their `queryId`
+_GRAPHQL_FAMILIES = {
+    "voyagerSearchDashClusters": "search",
+    "voyagerIdentityDashProfileComponents": "profiles",
+}
 
 
 def get_id_from_urn(urn: str):
@@ -12,6 +34,100 @@ def get_id_from_urn(urn: str):
     return urn.split(":")[3]
 
 
+def get_profile_id(profile_id: str) -> str:
+    """
+    Return the ID of a profile given as a public ID, a URN ID or a profile URN.
+
+    Example: urn:li:fsd_profile:<id> -> <id>
+    Example: <id> -> <id>
+    """
+    if profile_id.startswith("urn:li:"):
+        return get_id_from_urn(profile_id)
+    return profile_id
+
+
+def split_profile_id(profile_id: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (public ID, URN ID) of a profile given as a public ID, a URN ID or a
+    profile URN, the one it isn't given as being None.
+
+    Example: urn:li:fsd_profile:<urn id> -> (None, <urn id>)
+    Example: ACoAA<...> -> (None, ACoAA<...>)
+    Example: <public id> -> (<public id>, None)
+    """
+    profile_id = get_profile_id(profile_id)
+    # URN IDs of members all start with the same encoded prefix
+    if profile_id.startswith("ACo"):
+        return None, profile_id
+    return profile_id, None
+
+
+def get_public_id_from_url(url: str) -> Optional[str]:
+    """
+    Return the public ID of a profile URL, or None if [url] isn't a profile URL.
+
+    Example: https://www.linkedin.com/in/<id>?miniProfileUrn=... -> <id>
+    """
+    parts = urlsplit(url or "").path.strip("/").split("/")
+    if len(parts) < 2 or parts[0] != "in":
+        return None
+    return unquote(parts[1])
+
+
+def get_endpoint_family(uri: str) -> str:
+    """
+    Return the endpoint family of a given Linkedin API URI.
+
+    Families group endpoints that share a request budget.
+
+    Example: /identity/profiles/<id>/profileView -> profiles
+    Example: /graphql?queryId=voyagerSearchDashClusters.<hash> -> search
+    """
+    parts = urlsplit(uri)
+    path = parts.path.rstrip()
+    if path.startswith("/graphql"):
+        query_id = parse_qs(parts.query).get("queryId", [""])[0]
+        return _GRAPHQL_FAMILIES.get(query_id.split(".")[0], "graphql")
+
+    for prefix, family in _ENDPOINT_FAMILY_PREFIXES:
+        if path.startswith(prefix) or path == prefix.rstrip("/"):
+            return family
+
+    return path.strip("/").split("/")[0] or "root"
+
+
+# collections whose next path segment is the ID of one of their items
+_ID_COLLECTIONS = {
+    "conversations",
+    "followingStates",
+    "invitations",
+    "jobPostings",
+    "profiles",
+}
+
+
+def get_endpoint_template(uri: str) -> str:
+    """
+    Return the template of a given Linkedin API URI, with its IDs left out.
+
+    Example: /identity/profiles/<id>/profileView -> /identity/profiles/{id}/profileView
+    Example: /graphql?queryId=voyagerSearchDashClusters.<hash>&... -> /graphql?queryId=voyagerSearchDashClusters
+    """
+    parts = urlsplit(uri)
+    if parts.path.startswith("/graphql"):
+        query_id = parse_qs(parts.query).get("queryId", [""])[0]
+        return f"/graphql?queryId={query_id.split('.')[0]}"
+
+    segments = []
+    for segment in parts.path.split("/"):
+        if (segments and segments[-1] in _ID_COLLECTIONS) or any(
+            c.isdigit() or c in ":%(" for c in segment
+        ):
+            segment = "{id}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
 def get_urn_from_raw_update(raw_string: str) -> str:
     """
     Return the URN of a raw group update
@@ -176,9 +292,43 @@ def parse_list_raw_urns(l_raw_urns: List[str]) -> List[str]:
     return l_urns
 
 
+def iter_raw_posts(l_raw_posts: List[Dict], linkedin_base_url: str) -> Iterator[Dict]:
+    """Assemble the posts of an unsorted list of post fields, in a single pass
+
+    Fields are read off each raw item in turn and added to the current post; a
+    field the current post already has starts a new one.
+
+    :param l_raw_posts: Unsorted list containing posts information
+    :type l_raw_posts: list
+    :param linkedin_base_url: Linkedin URL
+    :type linkedin_base_url: str
+
+    :return: Iterator of dicts, each one of them is a post
+    :rtype: iterator
+    """
+    post: Dict = {}
+    for i in l_raw_posts:
+        fields = (
+            ("author_name", get_update_author_name(i)),
+            ("author_profile", get_update_author_profile(i, linkedin_base_url)),
+            ("old", get_update_old(i)),
+            ("content", get_update_content(i, linkedin_base_url)),
+            ("url", get_update_url(i, linkedin_base_url)),
+        )
+        for key, value in fields:
+            if not value:
+                continue
+            if key in post:
+                yield post
+                post = {}
+            post[key] = value
+    if post:
+        yield post
+
+
 def parse_list_raw_posts(l_raw_posts: List[Dict], linkedin_base_url: str) -> List[Dict]:
     """Iterates a unsorted list containing post fields and assemble a
-    list of dicts, each one of them contains a post
+    list of dicts, each one of them contains a post. See iter_raw_posts()
 
     :param l_raw_posts: Unsorted list containing posts information
     :type l_raw_posts: list
@@ -188,35 +338,49 @@ def parse_list_raw_posts(l_raw_posts: List[Dict], linkedin_base_url: str) -> Lis
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
-    l_posts = []
-    for i in l_raw_posts:
-        author_name = get_update_author_name(i)
-        if author_name:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "author_name", author_name
-            )
-
-        author_profile = get_update_author_profile(i, linkedin_base_url)
-        if author_profile:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "author_profile", author_profile
-            )
-
-        old = get_update_old(i)
-        if old:
-            l_posts = append_update_post_field_to_posts_list(i, l_posts, "old", old)
-
-        content = get_update_content(i, linkedin_base_url)
-        if content:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "content", content
-            )
-
-        url = get_update_url(i, linkedin_base_url)
-        if url:
-            l_posts = append_update_post_field_to_posts_list(i, l_posts, "url", url)
+    return list(iter_raw_posts(l_raw_posts, linkedin_base_url))
 
-    return l_posts
+
+def _get_post_urn(post: Dict) -> Optional[str]:
+    """Return the URN of a post assembled by iter_raw_posts(), from its URL"""
+    url = post.get("url")
+    if not url or "/feed/update/" not in url:
+        return None
+    return url.rsplit("/feed/update/", 1)[1]
+
+
+def _index_posts_by_urn(l_posts: List[Dict]) -> Dict[str, Dict]:
+    """Return the non-promoted posts of [l_posts] by URN, keeping the first of each URN"""
+    posts_by_urn: Dict[str, Dict] = {}
+    for post in l_posts:
+        if not post or "Promoted" in post.get("old", ""):
+            continue
+        urn = _get_post_urn(post)
+        if urn is not None and urn not in posts_by_urn:
+            posts_by_urn[urn] = post
+    return posts_by_urn
+
+
+def iter_posts_sorted_without_promoted(
+    l_urns: List[str], l_posts: List[Dict]
+) -> Iterator[Dict]:
+    """Yield the posts of [l_posts] in the order of [l_urns], leaving out promoted posts
+
+    Runs in linear time: posts are indexed once by URN, then looked up for each URN.
+
+    :param l_urns: List of posts URNs
+    :type l_urns: list
+    :param l_posts: List of dicts, which each of them is a post
+    :type l_posts: list
+
+    :return: Iterator of dicts, each one of them is a post
+    :rtype: iterator
+    """
+    posts_by_urn = _index_posts_by_urn(l_posts)
+    for urn in l_urns:
+        post = posts_by_urn.pop(urn, None)
+        if post is not None:
+            yield post
 
 
 def get_list_posts_sorted_without_promoted(
@@ -233,14 +397,18 @@ def get_list_posts_sorted_without_promoted(
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
-    l_posts_sorted_without_promoted = []
-    l_posts[:] = [d for d in l_posts if d and "Promoted" not in d.get("old", "")]
-    for urn in l_urns:
-        for post in l_posts:
-            if urn in post["url"]:
-                l_posts_sorted_without_promoted.append(post)
-                l_posts[:] = [d for d in l_posts if urn not in d.get("url", "")]
-                break
+    l_posts_sorted_without_promoted = list(
+        iter_posts_sorted_without_promoted(l_urns, l_posts)
+    )
+    # what is left: the non-promoted posts of URNs which weren't asked for
+    sorted_urns = {_get_post_urn(post) for post in l_posts_sorted_without_promoted}
+    l_posts[:] = [
+        d
+        for d in l_posts
+        if d
+        and "Promoted" not in d.get("old", "")
+        and _get_post_urn(d) not in sorted_urns
+    ]
     return l_posts_sorted_without_promoted
 
 
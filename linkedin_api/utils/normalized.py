@@ -0,0 +1,73 @@
+"""
+Index over the entities of normalized (`application/vnd.linkedin.normalized+json+2.1`)
+responses
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+class NormalizedResponse(object):
+    """
+    Normalized responses carry their entities in a flat `included` list, referenced
+    elsewhere by URN from `*`-prefixed keys (e.g. `"*elements": ["urn:li:..."]`).
+
+    Indexes `included` by `entityUrn` and by `$type` in a single pass, so entities
+    are looked up in constant time instead of by scanning the list. References are
+    only resolved when asked for.
+
+    :param data: Decoded normalized response
+    :type data: dict
+    """
+
+    def __init__(self, data: Dict):
+        self.raw = data
+        self.data: Dict = data.get("data") or {}
+        self.included: List[Dict] = data.get("included") or []
+        self._by_urn: Dict[str, Dict] = {}
+        self._by_type: Dict[str, List[Dict]] = {}
+        for entity in self.included:
+            urn = entity.get("entityUrn")
+            if urn is not None:
+                # keep the first, like a scan of `included` would find
+                self._by_urn.setdefault(urn, entity)
+            self._by_type.setdefault(entity.get("$type"), []).append(entity)
+
+    @classmethod
+    def of(cls, data: Union[Dict, "NormalizedResponse"]) -> "NormalizedResponse":
+        """Return [data] indexed, unless it already is"""
+        return data if isinstance(data, cls) else cls(data)
+
+    def get(self, urn: Optional[str], default=None) -> Optional[Dict]:
+        """Return the entity [urn], or [default] if it isn't included"""
+        return self._by_urn.get(urn, default) if urn is not None else default
+
+    def of_type(self, entity_type: str) -> List[Dict]:
+        """Return the entities of `$type` [entity_type], in the order they are included"""
+        return self._by_type.get(entity_type, [])
+
+    def resolve(self, ref: Union[None, str, List[str]]) -> Any:
+        """Return the entity, or list of entities, a reference points to.
+
+        Entities which aren't included are left out of lists, and returned as None
+        for single references.
+        """
+        if isinstance(ref, list):
+            return [e for e in (self._by_urn.get(urn) for urn in ref) if e is not None]
+        return self.get(ref)
+
+    def deref(self, entity: Dict, key: str) -> Any:
+        """Return what `entity["*" + key]` points to, see `resolve()`"""
+        return self.resolve(entity.get(f"*{key}"))
+
+    def elements(self) -> List[Dict]:
+        """Return the entities the top-level `*elements` references point to"""
+        return self.deref(self.data, "elements") or []
+
+    def __contains__(self, urn: str) -> bool:
+        return urn in self._by_urn
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.included)
+
+    def __len__(self):
+        return len(self.included)
@@ -0,0 +1,531 @@
+"""
+Response parsers shared by the synchronous and asynchronous Linkedin clients.
+
+Each parser takes an already-decoded response payload and returns the data in the
+shape exposed by the public API methods.
+"""
+
+import re
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union
+
+from linkedin_api.utils.helpers import (
+    get_id_from_urn,
+    get_public_id_from_url,
+    get_urn_from_raw_update,
+)
+from linkedin_api.utils.normalized import NormalizedResponse
+
+_PROFILE_URN_PREFIXES = ("urn:li:fs_miniProfile:", "urn:li:fsd_profile:")
+_JOB_POSTING_TYPE = "com.linkedin.voyager.dash.jobs.JobPosting"
+
+
+def is_error_payload(data: Dict) -> bool:
+    """Return True if a decoded payload carries a non-200 `status`"""
+    return bool(data and "status" in data and data["status"] != 200)
+
+
+def parse_paging_total(data: Dict) -> Optional[int]:
+    """Return the total size of the collection a page belongs to, if reported
+
+    Handles plain collections (`paging`), normalized responses (`data.paging`)
+    and GraphQL searches (`data.searchDashClustersByAll.paging`). A total of 0 is
+    treated as unknown, since it is also reported by collections which don't count.
+
+    :param data: Decoded response of a paginated collection
+    :type data: dict
+
+    :return: Total number of elements, or None
+    :rtype: int
+    """
+    paging = data.get("paging")
+    if paging is None:
+        data_ = data.get("data") or {}
+        paging = data_.get("paging")
+        if paging is None:
+            paging = (data_.get("searchDashClustersByAll") or {}).get("paging")
+    return (paging or {}).get("total") or None
+
+
+def _get_profile_urn_id(urn: str) -> Optional[str]:
+    for prefix in _PROFILE_URN_PREFIXES:
+        if urn.startswith(prefix):
+            return urn[len(prefix) :]
+    return None
+
+
+def parse_identities(data) -> List[Tuple[str, str]]:
+    """Return the (public_id, urn_id) pairs of every profile found in a payload
+
+    Picks up mini profiles (`publicIdentifier` and `entityUrn`) and search results
+    (`navigationUrl` and `entityUrn`), wherever they are nested.
+
+    :param data: Decoded response
+    :type data: dict
+
+    :return: List of (public_id, urn_id)
+    :rtype: list
+    """
+    identities = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        urn = node.get("entityUrn")
+        if isinstance(urn, str):
+            public_id = node.get("publicIdentifier")
+            if public_id is None and "navigationUrl" in node:
+                public_id = get_public_id_from_url(node["navigationUrl"])
+                # search results are wrapped in an entityResultViewModel URN
+                urn = get_urn_from_raw_update(urn) if "(" in urn else urn
+            urn_id = _get_profile_urn_id(urn)
+            if public_id and urn_id:
+                identities.append((public_id, urn_id))
+        stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+    return identities
+
+
+def parse_profile(data: Dict) -> Dict:
+    """Massage a `profileView` payload into a profile dict
+
+    :param data: Decoded `/identity/profiles/{id}/profileView` response
+    :type data: dict
+
+    :return: Profile data
+    :rtype: dict
+    """
+    # massage [profile] data
+    profile = data["profile"]
+    if "miniProfile" in profile:
+        if "picture" in profile["miniProfile"]:
+            profile["displayPictureUrl"] = profile["miniProfile"]["picture"][
+                "com.linkedin.common.VectorImage"
+            ]["rootUrl"]
+
+            images_data = profile["miniProfile"]["picture"][
+                "com.linkedin.common.VectorImage"
+            ]["artifacts"]
+            for img in images_data:
+                w, h, url_segment = itemgetter(
+                    "width", "height", "fileIdentifyingUrlPathSegment"
+                )(img)
+                profile[f"img_{w}_{h}"] = url_segment
+
+        profile["profile_id"] = get_id_from_urn(profile["miniProfile"]["entityUrn"])
+        profile["profile_urn"] = profile["miniProfile"]["entityUrn"]
+        profile["member_urn"] = profile["miniProfile"]["objectUrn"]
+        profile["public_id"] = profile["miniProfile"]["publicIdentifier"]
+
+        del profile["miniProfile"]
+
+    del profile["defaultLocale"]
+    del profile["supportedLocales"]
+    del profile["versionTag"]
+    del profile["showEducationOnProfileTopCard"]
+
+    # massage [experience] data
+    experience = data["positionView"]["elements"]
+    for item in experience:
+        if "company" in item and "miniCompany" in item["company"]:
+            if "logo" in item["company"]["miniCompany"]:
+                logo = item["company"]["miniCompany"]["logo"].get(
+                    "com.linkedin.common.VectorImage"
+                )
+                if logo:
+                    item["companyLogoUrl"] = logo["rootUrl"]
+            del item["company"]["miniCompany"]
+
+    profile["experience"] = experience
+
+    # massage [education] data
+    education = data["educationView"]["elements"]
+    for item in education:
+        if "school" in item:
+            if "logo" in item["school"]:
+                item["school"]["logoUrl"] = item["school"]["logo"][
+                    "com.linkedin.common.VectorImage"
+                ]["rootUrl"]
+                del item["school"]["logo"]
+
+    profile["education"] = education
+
+    # massage [languages] data
+    languages = data["languageView"]["elements"]
+    for item in languages:
+        del item["entityUrn"]
+    profile["languages"] = languages
+
+    # massage [publications] data
+    publications = data["publicationView"]["elements"]
+    for item in publications:
+        del item["entityUrn"]
+        for author in item.get("authors", []):
+            del author["entityUrn"]
+    profile["publications"] = publications
+
+    # massage [certifications] data
+    certifications = data["certificationView"]["elements"]
+    for item in certifications:
+        del item["entityUrn"]
+    profile["certifications"] = certifications
+
+    # massage [volunteer] data
+    volunteer = data["volunteerExperienceView"]["elements"]
+    for item in volunteer:
+        del item["entityUrn"]
+    profile["volunteer"] = volunteer
+
+    # massage [honors] data
+    honors = data["honorView"]["elements"]
+    for item in honors:
+        del item["entityUrn"]
+    profile["honors"] = honors
+
+    # massage [projects] data
+    projects = data["projectView"]["elements"]
+    for item in projects:
+        del item["entityUrn"]
+    profile["projects"] = projects
+    # massage [skills] data
+    skills = data["skillView"]["elements"]
+    for item in skills:
+        del item["entityUrn"]
+    profile["skills"] = skills
+
+    profile["urn_id"] = profile["entityUrn"].replace("urn:li:fs_profile:", "")
+
+    return profile
+
+
+def parse_profile_contact_info(data: Dict) -> Dict:
+    """Massage a `profileContactInfo` payload into a contact info dict
+
+    :param data: Decoded `/identity/profiles/{id}/profileContactInfo` response
+    :type data: dict
+
+    :return: Contact data
+    :rtype: dict
+    """
+    contact_info = {
+        "email_address": data.get("emailAddress"),
+        "websites": [],
+        "twitter": data.get("twitterHandles"),
+        "birthdate": data.get("birthDateOn"),
+        "ims": data.get("ims"),
+        "phone_numbers": data.get("phoneNumbers", []),
+    }
+
+    websites = data.get("websites", [])
+    for item in websites:
+        if "com.linkedin.voyager.identity.profile.StandardWebsite" in item["type"]:
+            item["label"] = item["type"][
+                "com.linkedin.voyager.identity.profile.StandardWebsite"
+            ]["category"]
+        elif "" in item["type"]:
+            item["label"] = item["type"][
+                "com.linkedin.voyager.identity.profile.CustomWebsite"
+            ]["label"]
+
+        del item["type"]
+
+    contact_info["websites"] = websites
+
+    return contact_info
+
+
+def parse_profile_skills(data: Dict) -> List:
+    """Massage a `skills` payload into a list of skills
+
+    :param data: Decoded `/identity/profiles/{id}/skills` response
+    :type data: dict
+
+    :return: List of skill objects
+    :rtype: list
+    """
+    skills = data.get("elements", [])
+    for item in skills:
+        del item["entityUrn"]
+
+    return skills
+
+
+def _parse_experience_item(item: Dict, is_group_item=False) -> Dict:
+    """
+    Parse a single experience item.
+
+    Items as part of an 'experience group' (e.g. a company with multiple positions) have different data structures.
+    Therefore, some exceptions need to be made when parsing these items.
+    """
+    component = item["components"]["entityComponent"]
+    title = component["titleV2"]["text"]["text"]
+    subtitle = component["subtitle"]
+    company = subtitle["text"].split(" · ")[0] if subtitle else None
+    employment_type_parts = subtitle["text"].split(" · ") if subtitle else None
+    employment_type = (
+        employment_type_parts[1]
+        if employment_type_parts and len(employment_type_parts) > 1
+        else None
+    )
+    metadata = component.get("metadata", {}) or {}
+    location = metadata.get("text")
+
+    duration_text = component["caption"]["text"]
+    duration_parts = duration_text.split(" · ")
+    date_parts = duration_parts[0].split(" - ")
+
+    duration = duration_parts[1] if duration_parts and len(duration_parts) > 1 else None
+    start_date = date_parts[0] if date_parts else None
+    end_date = date_parts[1] if date_parts and len(date_parts) > 1 else None
+
+    sub_components = component["subComponents"]
+    fixed_list_component = (
+        sub_components["components"][0]["components"]["fixedListComponent"]
+        if sub_components
+        else None
+    )
+
+    fixed_list_text_component = (
+        fixed_list_component["components"][0]["components"]["textComponent"]
+        if fixed_list_component
+        else None
+    )
+
+    # Extract additional description
+    description = (
+        fixed_list_text_component["text"]["text"] if fixed_list_text_component else None
+    )
+
+    # Create a dictionary with the extracted information
+    parsed_data = {
+        "title": title,
+        "companyName": company if not is_group_item else None,
+        "employmentType": company if is_group_item else employment_type,
+        "locationName": location,
+        "duration": duration,
+        "startDate": start_date,
+        "endDate": end_date,
+        "description": description,
+    }
+
+    return parsed_data
+
+
+def _get_paged_list_component_id(item: Dict) -> Optional[str]:
+    sub_components = item["components"]["entityComponent"]["subComponents"]
+    sub_components_components = (
+        sub_components["components"][0]["components"] if sub_components else None
+    )
+    return (
+        sub_components_components.get("*pagedListComponent", "")
+        if sub_components_components
+        else None
+    )
+
+
+def _get_grouped_experience_item_id(item: Dict) -> Optional[str]:
+    paged_list_component_id = _get_paged_list_component_id(item)
+    if (
+        paged_list_component_id
+        and "fsd_profilePositionGroup" in paged_list_component_id
+    ):
+        pattern = r"urn:li:fsd_profilePositionGroup:\([^)]+\)"
+        match = re.search(pattern, paged_list_component_id)
+        return match.group(0) if match else None
+    return None
+
+
+def parse_profile_experiences(data: Union[Dict, NormalizedResponse]) -> List:
+    """Parse a `voyagerIdentityDashProfileComponents` experience payload
+
+    :param data: Decoded normalized GraphQL response
+    :type data: dict or NormalizedResponse
+
+    :return: List of experiences
+    :rtype: list
+    """
+    response = NormalizedResponse.of(data)
+    included = response.included
+    items = []
+
+    # Find the index with the most items
+    # When dealing with grouped experiences (e.g. multiple positions at the same company),
+    # the API response will contain multiple indexes in data["included"].
+    # The index with the most elements will contain all experiences, both grouped and individual,
+    # while other indexes may only contain partial data for the grouped experiences.
+    # Therefore, we want to use the index with the most items to ensure we process all experiences.
+    max_items_index = max(
+        range(len(included)),
+        key=lambda i: len(included[i].get("components", {}).get("elements", [])),
+    )
+
+    for item in included[max_items_index]["components"]["elements"]:
+        grouped_item_id = _get_grouped_experience_item_id(item)
+        # if the item is part of a group (e.g. a company with multiple positions),
+        # find the group items and parse them.
+        if grouped_item_id:
+            component = item["components"]["entityComponent"]
+            # use the company and location from the main item
+            company = component["titleV2"]["text"]["text"]
+
+            location = component["caption"]["text"] if component["caption"] else None
+
+            # find the group: the entity the item references, if included
+            group = response.get(_get_paged_list_component_id(item))
+            if group is None:
+                group = next(
+                    (i for i in included if grouped_item_id in i.get("entityUrn", "")),
+                    None,
+                )
+            if group is None:
+                continue
+            for group_item in group["components"]["elements"]:
+                parsed_data = _parse_experience_item(group_item, is_group_item=True)
+                parsed_data["companyName"] = company
+                parsed_data["locationName"] = location
+                items.append(parsed_data)
+            continue
+
+        # else, parse the regular item
+        parsed_data = _parse_experience_item(item)
+        items.append(parsed_data)
+
+    return items
+
+
+def parse_search_clusters(data: Dict) -> List[Dict]:
+    """Return the `EntityResultViewModel` elements of a `voyagerSearchDashClusters` page
+
+    :param data: Decoded GraphQL search response
+    :type data: dict
+
+    :return: List of search results
+    :rtype: list
+    """
+    data_clusters = data.get("data", {}).get("searchDashClustersByAll", [])
+
+    if not data_clusters:
+        return []
+
+    if (
+        not data_clusters.get("_type", [])
+        == "com.linkedin.restli.common.CollectionResponse"
+    ):
+        return []
+
+    new_elements = []
+    for it in data_clusters.get("elements", []):
+        if (
+            not it.get("_type", [])
+            == "com.linkedin.voyager.dash.search.SearchClusterViewModel"
+        ):
+            continue
+
+        for el in it.get("items", []):
+            if not el.get("_type", []) == "com.linkedin.voyager.dash.search.SearchItem":
+                continue
+
+            e = el.get("item", {}).get("entityResult", [])
+            if not e:
+                continue
+            if (
+                not e.get("_type", [])
+                == "com.linkedin.voyager.dash.search.EntityResultViewModel"
+            ):
+                continue
+            new_elements.append(e)
+
+    return new_elements
+
+
+def parse_search_people_item(
+    item: Dict, include_private_profiles=False
+) -> Optional[Dict]:
+    """Return the minimal profile data of a people search result
+
+    :param item: `EntityResultViewModel` search result
+    :type item: dict
+    :param include_private_profiles: Keep out-of-network results
+    :type include_private_profiles: boolean, optional
+
+    :return: Profile data, or None if the result should be skipped
+    :rtype: dict
+    """
+    if (
+        not include_private_profiles
+        and (item.get("entityCustomTrackingInfo") or {}).get("memberDistance", None)
+        == "OUT_OF_NETWORK"
+    ):
+        return None
+    return {
+        "urn_id": get_id_from_urn(get_urn_from_raw_update(item.get("entityUrn", None))),
+        "distance": (item.get("entityCustomTrackingInfo") or {}).get(
+            "memberDistance", None
+        ),
+        "jobtitle": (item.get("primarySubtitle") or {}).get("text", None),
+        "location": (item.get("secondarySubtitle") or {}).get("text", None),
+        "name": (item.get("title") or {}).get("text", None),
+    }
+
+
+def parse_search_companies_item(item: Dict) -> Optional[Dict]:
+    """Return the minimal company data of a company search result
+
+    :param item: `EntityResultViewModel` search result
+    :type item: dict
+
+    :return: Company data, or None if the result is not a company
+    :rtype: dict
+    """
+    if "company" not in item.get("trackingUrn"):
+        return None
+    return {
+        "urn_id": get_id_from_urn(item.get("trackingUrn", None)),
+        "name": (item.get("title") or {}).get("text", None),
+        "headline": (item.get("primarySubtitle") or {}).get("text", None),
+        "subline": (item.get("secondarySubtitle") or {}).get("text", None),
+    }
+
+
+def parse_job_postings(data: Union[Dict, NormalizedResponse]) -> List[Dict]:
+    """Return the `JobPosting` entities of a `voyagerJobsDashJobCards` page
+
+    :param data: Decoded normalized job search response
+    :type data: dict or NormalizedResponse
+
+    :return: List of jobs
+    :rtype: list
+    """
+    return list(NormalizedResponse.of(data).of_type(_JOB_POSTING_TYPE))
+
+
+def parse_conversation_details(data: Dict) -> Dict:
+    """Return the first conversation of a `messaging/conversations` payload
+
+    :param data: Decoded conversations response
+    :type data: dict
+
+    :return: Conversation data
+    :rtype: dict
+    """
+    if data["elements"] == []:
+        return {}
+
+    item = data["elements"][0]
+    item["id"] = get_id_from_urn(item["entityUrn"])
+
+    return item
+
+
+def parse_current_profile_views(data: Dict) -> int:
+    """Return the number of profile views from a `wvmpCards` payload"""
+    return data["elements"][0]["value"][
+        "com.linkedin.voyager.identity.me.wvmpOverview.WvmpViewersCard"
+    ]["insightCards"][0]["value"][
+        "com.linkedin.voyager.identity.me.wvmpOverview.WvmpSummaryInsightCard"
+    ][
+        "numViews"
+    ]
@@ -0,0 +1,97 @@
+import copy
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from linkedin_api import Linkedin, RateLimiter, RetryPolicy
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Transport adapter returning canned responses instead of hitting the network.
+
+    Routes are matched on the longest prefix of the request path (relative to the
+    API base URL). A route payload may also be a callable taking the prepared request.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+        self.requests = []
+
+    def add(self, path_prefix, payload=None, status=200, headers=None):
+        self.routes[path_prefix] = (status, payload, headers or {})
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        path = request.path_url.replace("/voyager/api", "", 1)
+        for prefix in sorted(self.routes, key=len, reverse=True):
+            if path.startswith(prefix):
+                status, payload, headers = self.routes[prefix]
+                if callable(payload):
+                    payload = payload(request)
+                break
+        else:
+            status, payload, headers = 404, {}, {}
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = json.dumps(payload).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def adapter():
+    return FakeAdapter()
+
+
+@pytest.fixture
+def linkedin(adapter):
+    api = Linkedin(
+        "user@example.com",
+        "password",
+        authenticate=False,
+        rate_limiter=RateLimiter(per_minute=10**9, burst=10**9),
+        retry_policy=RetryPolicy(max_retries=0),
+    )
+    api.client.session.mount("https://", adapter)
+    return api
+
+
+PROFILE_VIEW = {
+    "profile": {
+        "entityUrn": "urn:li:fs_profile:ACoAAA",
+        "miniProfile": {
+            "entityUrn": "urn:li:fs_miniProfile:ACoAAA",
+            "objectUrn": "urn:li:member:1",
+            "publicIdentifier": "tom-quirk",
+        },
+        "defaultLocale": {},
+        "supportedLocales": [],
+        "versionTag": "1",
+        "showEducationOnProfileTopCard": True,
+    },
+    "positionView": {"elements": []},
+    "educationView": {"elements": []},
+    "languageView": {"elements": []},
+    "publicationView": {"elements": []},
+    "certificationView": {"elements": []},
+    "volunteerExperienceView": {"elements": []},
+    "honorView": {"elements": []},
+    "projectView": {"elements": []},
+    "skillView": {"elements": [{"entityUrn": "urn:li:skill:1", "name": "Python"}]},
+}
+
+
+@pytest.fixture
+def profile_view():
+    """Return a minimal `profileView` payload of the tom-quirk profile"""
+    return copy.deepcopy(PROFILE_VIEW)
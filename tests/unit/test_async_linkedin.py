@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from linkedin_api import AsyncLinkedin, RateLimiter, RetryPolicy
+
+
+def make_api(handler, **kwargs):
+    return AsyncLinkedin(
+        "user@example.com",
+        "password",
+        authenticate=False,
+        rate_limiter=RateLimiter(per_minute=10**9, burst=10**9),
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def test_get_profile_reuses_sync_parsing(profile_view):
+    def handler(request):
+        assert request.url.path.endswith("/identity/profiles/tom-quirk/profileView")
+        return httpx.Response(200, json=profile_view)
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.get_profile("tom-quirk")
+
+    profile = asyncio.run(run())
+    assert profile["public_id"] == "tom-quirk"
+    assert profile["urn_id"] == "ACoAAA"
+    assert profile["skills"] == [{"name": "Python"}]
+
+
+def test_max_concurrency_bounds_in_flight_requests():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"elements": [{"name": "LinkedIn"}]})
+
+    # built outside of the loop the requests run in
+    api = make_api(handler, max_concurrency=3)
+
+    async def run():
+        async with api:
+            return await asyncio.gather(
+                *[api.get_company(f"company-{i}") for i in range(12)]
+            )
+
+    companies = asyncio.run(run())
+    assert len(companies) == 12
+    assert peak == 3
+
+
+def test_get_profiles(profile_view):
+    def handler(request):
+        if "ACoBBB" in request.url.path:
+            return httpx.Response(403, json={})
+        return httpx.Response(200, json=profile_view)
+
+    async def run():
+        async with make_api(handler) as api:
+            return {
+                profile_id: result
+                async for profile_id, result in api.get_profiles(
+                    ["ACoAAA", "ACoAAA", "ACoBBB"], workers=2
+                )
+            }
+
+    results = asyncio.run(run())
+    assert results["ACoAAA"]["public_id"] == "tom-quirk"
+    assert isinstance(results["ACoBBB"], Exception)
+
+
+def test_refreshed_client_cookies_are_picked_up():
+    from requests.cookies import RequestsCookieJar, create_cookie
+
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers.get("cookie"), request.headers["csrf-token"]))
+        return httpx.Response(200, json={})
+
+    def make_cookies(value):
+        cookies = RequestsCookieJar()
+        cookies.set_cookie(create_cookie("JSESSIONID", f'"{value}"'))
+        return cookies
+
+    async def run():
+        async with make_api(handler) as api:
+            api.client._set_session_cookies(make_cookies("ajax:old"))
+            await api._fetch("/me")
+            # what Client.refresh_session() does, e.g. from a SessionKeeper
+            api.client.session = api.client._build_session()
+            api.client._set_session_cookies(make_cookies("ajax:new"))
+            await api._fetch("/me")
+
+    asyncio.run(run())
+    assert seen[-1] == ('JSESSIONID="ajax:new"', "ajax:new")
+
+
+def test_request_hooks_get_an_event_per_request():
+    events = []
+
+    def handler(request):
+        return httpx.Response(200, json={"plainId": 1})
+
+    async def run():
+        async with make_api(handler, request_hooks=[events.append]) as api:
+            await api._fetch("/identity/profiles/tom-quirk/profileView")
+
+    asyncio.run(run())
+    (event,) = events
+    assert (event.family, event.endpoint, event.status) == (
+        "profiles",
+        "/identity/profiles/{id}/profileView",
+        200,
+    )
+    assert event.bytes_in > 0 and event.decode is not None
+
+
+def test_transport_errors_are_retried_then_raised():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("down", request=request)
+        if len(calls) == 2:
+            return httpx.Response(200, json={"plainId": 1})
+        raise httpx.ReadTimeout("slow", request=request)
+
+    events = []
+    retry_policy = RetryPolicy(max_retries=1, backoff=0)
+
+    async def run():
+        async with make_api(
+            handler, retry_policy=retry_policy, request_hooks=[events.append]
+        ) as api:
+            res = await api._fetch("/me")
+            assert res.json() == {"plainId": 1}
+            with pytest.raises(httpx.ReadTimeout):
+                await api._fetch("/me")
+
+    asyncio.run(run())
+    assert len(calls) == 4
+    assert [(e.status, type(e.error)) for e in events] == [
+        (None, httpx.ConnectError),
+        (200, type(None)),
+        (None, httpx.ReadTimeout),
+        (None, httpx.ReadTimeout),
+    ]
+
+
+def test_searches_take_keywords_first():
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with make_api(handler) as api:
+            assert await api.search_people("software") == []
+            assert await api.search_jobs("python") == []
+
+    asyncio.run(run())
+    assert "keywords:software" in urls[0]
+    assert "keywords:python" in urls[1]
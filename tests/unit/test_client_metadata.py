@@ -0,0 +1,144 @@
+import io
+import json
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import RequestsCookieJar, create_cookie
+
+from linkedin_api.client import Client, LazyMetadata, _read_head, parse_metadata
+from linkedin_api.cookie_repository import FileCookieStorage, SQLiteCookieStorage
+
+APPLICATION_INSTANCE = {"applicationUrn": "urn:li:application:voyager", "version": "1"}
+HEAD = (
+    "<html><head><title>LinkedIn</title>"
+    "<meta name=\"applicationInstance\" content='{}'>"
+    '<meta name="clientPageInstanceId" content="page-1">'
+    "</HEAD>".format(json.dumps(APPLICATION_INSTANCE))
+)
+METADATA = {
+    "clientApplicationInstance": APPLICATION_INSTANCE,
+    "clientPageInstanceId": "page-1",
+}
+
+
+class CountingBytesIO(io.BytesIO):
+    read_bytes = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.read_bytes += len(data)
+        return data
+
+
+class HomepageAdapter(BaseAdapter):
+    """Streams a homepage with a large body after its <head>"""
+
+    def __init__(self, body=HEAD + "<body>" + "x" * 1_000_000 + "</body></html>"):
+        super().__init__()
+        self.body = body.encode()
+        self.requests = []
+        self.raw = None
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        self.raw = response.raw = CountingBytesIO(self.body)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_cookies():
+    cookies = RequestsCookieJar()
+    cookies.set_cookie(
+        create_cookie("JSESSIONID", '"ajax:1"', expires=int(time.time()) + 3600)
+    )
+    return cookies
+
+
+def make_client(storage):
+    client = Client(cookie_storage=storage)
+    adapter = HomepageAdapter()
+    client._adapter = adapter
+    return client, adapter
+
+
+def test_parse_metadata():
+    assert parse_metadata(HEAD) == METADATA
+    assert parse_metadata("<html><head></head></html>") == {}
+
+
+def test_read_head_stops_at_the_end_of_head():
+    adapter = HomepageAdapter()
+    res = adapter.send(requests.Request("GET", "https://x").prepare())
+
+    head = _read_head(res)
+
+    assert head == HEAD
+    assert adapter.raw.read_bytes < len(adapter.body)
+    assert adapter.raw.closed
+
+
+def test_read_head_is_capped():
+    adapter = HomepageAdapter(body="<head>" + "x" * 100_000)
+    res = adapter.send(requests.Request("GET", "https://x").prepare())
+
+    assert len(_read_head(res, max_bytes=20_000)) < 40_000
+
+
+def test_lazy_metadata_loads_once_on_first_access():
+    calls = []
+    metadata = LazyMetadata(lambda: calls.append(1) or metadata.update(METADATA))
+
+    metadata["me"] = {"plainId": 1}
+    assert metadata["me"] == {"plainId": 1}
+    assert not calls
+
+    assert metadata["clientPageInstanceId"] == "page-1"
+    assert metadata.get("clientApplicationInstance") == APPLICATION_INSTANCE
+    assert calls == [1]
+    assert metadata.loaded
+
+
+def test_metadata_is_fetched_lazily_and_persisted(tmp_path):
+    storage = SQLiteCookieStorage(str(tmp_path / "cookies.sqlite3"))
+    storage.save("user", make_cookies(), time.time() + 3600)
+    client, adapter = make_client(storage)
+
+    client.authenticate("user", "password")
+    assert adapter.requests == []
+
+    assert client.metadata["clientPageInstanceId"] == "page-1"
+    assert len(adapter.requests) == 1
+    assert storage.load_metadata("user") == METADATA
+
+
+def test_persisted_metadata_skips_the_homepage(tmp_path):
+    storage = FileCookieStorage(f"{tmp_path}/")
+    storage.save("user", make_cookies(), time.time() + 3600)
+    storage.save_metadata("user", METADATA)
+    client, adapter = make_client(storage)
+
+    client.authenticate("user", "password")
+
+    assert client.metadata["clientApplicationInstance"] == APPLICATION_INSTANCE
+    assert adapter.requests == []
+
+
+def test_new_cookies_drop_the_persisted_metadata(tmp_path):
+    for storage in (
+        FileCookieStorage(f"{tmp_path}/"),
+        SQLiteCookieStorage(str(tmp_path / "cookies.sqlite3")),
+    ):
+        storage.save("user", make_cookies(), time.time() + 3600)
+        storage.save_metadata("user", METADATA)
+        assert storage.load_metadata("user") == METADATA
+
+        storage.save("user", make_cookies(), time.time() + 3600)
+        assert storage.load_metadata("user") is None
@@ -6,7 +6,9 @@ from datetime import datetime
 
 from linkedin_api.cookie_repository import (
     CookieRepository,
+    FileCookieStorage,
     LinkedinSessionExpired,
+    SQLiteCookieStorage,
 )
 
 
@@ -51,3 +53,67 @@ def test_get_expired():
         assert False
     except LinkedinSessionExpired:
         assert True
+
+
+def test_file_storage_writes_atomically(tmp_path):
+    repo = CookieRepository(cookies_dir=f"{tmp_path}/")
+    repo.save(mock_cookies(), "testuser")
+    assert os.listdir(tmp_path) == ["testuser.jr"]
+    assert repo.get("testuser") == mock_cookies()
+
+
+def test_sqlite_storage(tmp_path):
+    path = str(tmp_path / "cookies.sqlite3")
+    repo = CookieRepository(storage=SQLiteCookieStorage(path))
+    assert repo.get("testuser") is None
+
+    repo.save(mock_cookies(), "testuser")
+    repo.save(
+        mock_cookies(date=datetime.strptime("2001-05-04", "%Y-%m-%d")), "testuserex"
+    )
+
+    # another instance, as in another worker, reads the same rows
+    storage = SQLiteCookieStorage(path, cache_ttl=0)
+    other = CookieRepository(storage=storage)
+    assert other.get("testuser") == mock_cookies()
+    assert (
+        storage.get_expiry("testuser")
+        == datetime.strptime("2050-05-04", "%Y-%m-%d").timestamp()
+    )
+    with pytest.raises(LinkedinSessionExpired):
+        other.get("testuserex")
+
+
+def test_sqlite_storage_cache_hands_out_copies(tmp_path):
+    storage = SQLiteCookieStorage(str(tmp_path / "cookies.sqlite3"))
+    repo = CookieRepository(storage=storage)
+    repo.save(mock_cookies(), "testuser")
+
+    first = repo.get("testuser")
+    first.set("li_at", "changed")
+    assert repo.get("testuser") == mock_cookies()
+
+    storage.delete("testuser")
+    assert repo.get("testuser") is None
+
+
+def test_in_memory_sqlite_storages_are_separate():
+    first, second = SQLiteCookieStorage(":memory:"), SQLiteCookieStorage(":memory:")
+
+    CookieRepository(storage=first).save(mock_cookies(), "testuser")
+
+    assert CookieRepository(storage=first).get("testuser") == mock_cookies()
+    assert CookieRepository(storage=second).get("testuser") is None
+    assert second.get_expiry("testuser") is None
+
+
+def test_file_storage_get_expiry(tmp_path):
+    storage = FileCookieStorage(f"{tmp_path}/")
+    assert storage.get_expiry("testuser") is None
+
+    CookieRepository(storage=storage).save(mock_cookies(), "testuser")
+
+    assert (
+        storage.get_expiry("testuser")
+        == datetime.strptime("2050-05-04", "%Y-%m-%d").timestamp()
+    )
@@ -0,0 +1,55 @@
+from linkedin_api.entity_cache import EntityCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+COMPANY = {"elements": [{"name": "LinkedIn", "entityUrn": "urn:li:fs_company:1"}]}
+
+
+def test_get_company_is_memoized(linkedin, adapter):
+    linkedin.entity_cache = EntityCache()
+    adapter.add("/organization/companies", COMPANY)
+
+    company = linkedin.get_company("linkedin")
+    # mutating the result must not corrupt the cached entry
+    del company["entityUrn"]
+
+    assert linkedin.get_company("linkedin")["entityUrn"] == "urn:li:fs_company:1"
+    assert len(adapter.requests) == 1
+    assert linkedin.entity_cache.stats()["hits"] == 1
+
+    linkedin.get_company("linkedin", cache="refresh")
+    linkedin.get_company("linkedin", cache="bypass")
+    assert len(adapter.requests) == 3
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = EntityCache(ttl=60, clock=clock)
+    cache.set("a", {"name": "A"})
+
+    clock.now += 30
+    assert cache.get("a") == {"name": "A"}
+    clock.now += 31
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = EntityCache(max_bytes=50)
+    cache.set("a", {"name": "A" * 10})
+    cache.set("b", {"name": "B" * 10})
+    cache.get("a")
+    cache.set("c", {"name": "C" * 10})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.size <= 50
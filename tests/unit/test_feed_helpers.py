@@ -0,0 +1,57 @@
+from linkedin_api.utils.helpers import (
+    get_list_posts_sorted_without_promoted,
+    parse_list_raw_posts,
+)
+
+BASE_URL = "https://www.linkedin.com"
+
+
+def raw_post(urn, old="2h"):
+    return {
+        "actor": {
+            "name": {"text": "Tom"},
+            "urn": "urn:li:member:1",
+            "subDescription": {"text": old},
+        },
+        "commentary": {"text": {"text": f"Post {urn}"}},
+        "updateMetadata": {"urn": urn},
+    }
+
+
+def test_parse_list_raw_posts_splits_on_repeated_fields():
+    posts = parse_list_raw_posts(
+        [{"actor": {"name": {"text": "Tom"}}}, raw_post("urn:li:activity:1")],
+        BASE_URL,
+    )
+    assert posts == [
+        {"author_name": "Tom"},
+        {
+            "author_name": "Tom",
+            "author_profile": f"{BASE_URL}/in/1",
+            "old": "2h",
+            "content": "Post urn:li:activity:1",
+            "url": f"{BASE_URL}/feed/update/urn:li:activity:1",
+        },
+    ]
+
+
+def test_posts_are_sorted_by_urn_without_promoted_ones():
+    urns = ["urn:li:activity:12", "urn:li:activity:1", "urn:li:activity:3"]
+    posts = parse_list_raw_posts(
+        [
+            raw_post("urn:li:activity:1"),
+            raw_post("urn:li:activity:3", old="Promoted"),
+            raw_post("urn:li:activity:12"),
+            raw_post("urn:li:activity:99"),
+        ],
+        BASE_URL,
+    )
+
+    sorted_posts = get_list_posts_sorted_without_promoted(urns, posts)
+
+    assert [p["url"].rsplit("/", 1)[1] for p in sorted_posts] == [
+        "urn:li:activity:12",
+        "urn:li:activity:1",
+    ]
+    # only the post of no requested URN is left
+    assert [p["url"].rsplit("/", 1)[1] for p in posts] == ["urn:li:activity:99"]
@@ -0,0 +1,37 @@
+import pytest
+
+from linkedin_api.identity_index import IdentityIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    return IdentityIndex(str(tmp_path / "identities.sqlite3"))
+
+
+def test_index_is_bidirectional(index):
+    index.add("tom-quirk", "ACoAAA")
+    index.add("tom-quirk-2", "ACoAAA")
+
+    assert index.get_urn_id("tom-quirk-2") == "ACoAAA"
+    assert index.get_public_id("ACoAAA") == "tom-quirk-2"
+    assert index.get_urn_id("unknown") is None
+    assert len(index) == 1
+
+
+def test_get_profile_fills_index(linkedin, adapter, index, profile_view):
+    linkedin.identity_index = index
+    adapter.add("/identity/profiles/tom-quirk/profileView", profile_view)
+
+    linkedin.get_profile("tom-quirk")
+
+    assert index.get_urn_id("tom-quirk") == "ACoAAA"
+
+
+def test_get_profile_posts_resolves_urn_from_index(linkedin, adapter, index):
+    linkedin.identity_index = index
+    index.add("tom-quirk", "ACoAAA")
+    adapter.add("/identity/profileUpdatesV2", {"elements": [{"id": 1}], "metadata": {}})
+
+    assert linkedin.get_profile_posts(public_id="tom-quirk") == [{"id": 1}]
+    assert len(adapter.requests) == 1
+    assert "urn%3Ali%3Afsd_profile%3AACoAAA" in adapter.requests[0].url
@@ -0,0 +1,51 @@
+import json
+import os
+import subprocess
+import sys
+
+# seconds a cold `import linkedin_api` may take, override for slow machines
+IMPORT_BUDGET = float(os.environ.get("LINKEDIN_API_IMPORT_BUDGET", 0.5))
+
+# only imported by the code paths which need them
+LAZY_MODULES = ["asyncio", "bs4", "httpx", "lxml", "msgspec", "orjson", "uuid"]
+
+COLD_IMPORT = """
+import json, sys, time
+start = time.perf_counter()
+import linkedin_api
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "modules": sorted(sys.modules)}))
+"""
+
+
+def cold_import():
+    out = subprocess.run(
+        [sys.executable, "-c", COLD_IMPORT],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def test_import_leaves_heavy_dependencies_out():
+    modules = set(cold_import()["modules"])
+
+    assert [m for m in LAZY_MODULES if m in modules] == []
+
+
+def test_cold_import_is_within_budget():
+    # best of a few runs, to leave out the noise of the machine
+    seconds = min(cold_import()["seconds"] for _ in range(3))
+
+    assert seconds < IMPORT_BUDGET, (
+        f"import linkedin_api took {seconds * 1000:.0f} ms, "
+        f"over the budget of {IMPORT_BUDGET * 1000:.0f} ms"
+    )
+
+
+def test_async_client_is_still_exported():
+    from linkedin_api import AsyncLinkedin
+    from linkedin_api.async_linkedin import AsyncLinkedin as Imported
+
+    assert AsyncLinkedin is Imported
@@ -0,0 +1,201 @@
+import pytest
+import requests
+
+from linkedin_api import RequestMetrics
+from linkedin_api.instrumentation import OpenTelemetryHook, RequestEvent
+from linkedin_api.utils.helpers import get_endpoint_template
+
+
+def make_event(family="profiles", status=200, latency=0.1, **kwargs):
+    return RequestEvent(
+        "GET", "/me", family, "/me", status=status, latency=latency, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "uri,template",
+    [
+        (
+            "/identity/profiles/tom-quirk/profileView",
+            "/identity/profiles/{id}/profileView",
+        ),
+        ("/jobs/jobPostings/123?decorationId=x", "/jobs/jobPostings/{id}"),
+        (
+            "/graphql?variables=(start:0)&queryId=voyagerSearchDashClusters.b0928",
+            "/graphql?queryId=voyagerSearchDashClusters",
+        ),
+        (
+            "/messaging/conversations?keyVersion=LEGACY_INBOX",
+            "/messaging/conversations",
+        ),
+        ("/me", "/me"),
+    ],
+)
+def test_get_endpoint_template(uri, template):
+    assert get_endpoint_template(uri) == template
+
+
+def test_hooks_get_an_event_per_request(linkedin, adapter, profile_view):
+    adapter.add("/identity/profiles/tom-quirk/profileView", profile_view)
+    events = []
+    linkedin.add_request_hook(events.append)
+
+    linkedin.get_profile("tom-quirk")
+
+    (event,) = events
+    assert event.method == "GET"
+    assert event.family == "profiles"
+    assert event.endpoint == "/identity/profiles/{id}/profileView"
+    assert event.status == 200
+    assert event.bytes_in > 0
+    assert event.bytes_out == 0
+    assert event.decode is not None
+    assert event.latency >= 0 and event.wait >= 0
+    # the body decoded for the event is reused by the parser
+    assert linkedin.json_decoder.stats()["decodes"] == 1
+
+
+def test_bodies_are_only_decoded_for_hooks_reading_them(linkedin, adapter):
+    adapter.add("/me", {"plainId": 1})
+    statuses = []
+    linkedin.add_request_hook(lambda event: statuses.append(event.status))
+
+    linkedin._fetch("/me")
+
+    assert statuses == [200]
+    assert linkedin.json_decoder.stats()["decodes"] == 0
+    linkedin.add_request_hook(lambda event: event.decode)
+    linkedin._fetch("/me")
+    assert linkedin.json_decoder.stats()["decodes"] == 1
+
+
+def test_failed_requests_are_reported(linkedin, adapter):
+    def fail(request):
+        raise requests.exceptions.ConnectionError("down")
+
+    adapter.add("/me", fail)
+    events = []
+    linkedin.add_request_hook(events.append)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        linkedin._fetch("/me")
+
+    assert [(e.status, type(e.error)) for e in events] == [
+        (None, requests.exceptions.ConnectionError)
+    ]
+
+
+def test_failing_hooks_dont_fail_requests(linkedin, adapter):
+    def broken(event):
+        raise RuntimeError("broken hook")
+
+    adapter.add("/me", {"plainId": 1})
+    linkedin.add_request_hook(broken)
+
+    assert linkedin._fetch("/me").status_code == 200
+
+
+def test_metrics_percentiles_and_stats():
+    metrics = RequestMetrics()
+    for n in range(1, 101):
+        metrics(make_event(latency=n / 100, bytes_in=10, decode=0.001))
+    metrics(make_event(status=None, error=ConnectionError()))
+    metrics(make_event(family="search", status=429))
+
+    assert metrics.percentiles("profiles") == {50: 0.5, 90: 0.9, 99: 0.99}
+    assert metrics.percentiles("companies") == {50: None, 90: None, 99: None}
+    stats = metrics.stats()
+    assert stats["profiles"]["requests"] == 101
+    assert stats["profiles"]["errors"] == 1
+    assert stats["profiles"]["bytes_in"] == 1000
+    assert stats["profiles"]["latency"]["count"] == 100
+    assert stats["profiles"]["decode"]["count"] == 100
+    assert stats["search"]["statuses"] == {"GET 429": 1}
+    with pytest.raises(ValueError):
+        metrics.percentiles("profiles", metric="size")
+
+
+def test_metrics_percentiles_are_computed_over_a_window():
+    metrics = RequestMetrics(window=10)
+    for n in range(100):
+        metrics(make_event(latency=n))
+
+    assert metrics.percentiles("profiles", q=[50]) == {50: 94}
+    assert metrics.stats()["profiles"]["latency"]["count"] == 100
+
+
+def test_to_prometheus():
+    metrics = RequestMetrics(buckets=(0.1, 1))
+    metrics(make_event(latency=0.05, bytes_in=100))
+    metrics(make_event(latency=0.5, bytes_in=50))
+    metrics(make_event(status=None))
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE linkedin_api_requests_total counter" in text
+    assert (
+        'linkedin_api_requests_total{family="profiles",method="GET",status="200"} 2'
+        in text
+    )
+    assert (
+        'linkedin_api_requests_total{family="profiles",method="GET",status="error"} 1'
+        in text
+    )
+    assert 'linkedin_api_response_bytes_total{family="profiles"} 150' in text
+    assert "# TYPE linkedin_api_request_duration_seconds histogram" in text
+    lines = text.splitlines()
+    assert [
+        line.split(" ")[-1]
+        for line in lines
+        if line.startswith("linkedin_api_request_duration_seconds_bucket")
+    ] == ["1", "2", "2"]
+    assert (
+        'linkedin_api_request_duration_seconds_bucket{family="profiles",le="+Inf"} 2'
+        in lines
+    )
+    assert 'linkedin_api_request_duration_seconds_count{family="profiles"} 2' in lines
+
+
+class RecordingInstrument(object):
+    def __init__(self):
+        self.values = []
+
+    def add(self, value, attributes):
+        self.values.append((value, attributes))
+
+    record = add
+
+
+class RecordingMeter(object):
+    def __init__(self):
+        self.instruments = {}
+
+    def create_counter(self, name, unit="", description=""):
+        return self.instruments.setdefault(name, RecordingInstrument())
+
+    create_histogram = create_counter
+
+
+def test_opentelemetry_hook_records_with_attributes():
+    meter = RecordingMeter()
+    hook = OpenTelemetryHook(meter)
+
+    hook(make_event(latency=0.25, decode=0.01))
+    hook(make_event(status=None))
+
+    attributes = {
+        "family": "profiles",
+        "endpoint": "/me",
+        "method": "GET",
+        "status": "200",
+    }
+    assert meter.instruments["linkedin_api.requests"].values == [
+        (1, attributes),
+        (1, dict(attributes, status="error")),
+    ]
+    assert meter.instruments["linkedin_api.request.duration"].values == [
+        (0.25, attributes)
+    ]
+    assert meter.instruments["linkedin_api.response.decode"].values == [
+        (0.01, attributes)
+    ]
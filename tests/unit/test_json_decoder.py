@@ -0,0 +1,56 @@
+import pytest
+import requests
+
+from linkedin_api.json_decoder import JsonDecoder
+
+
+def make_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def test_body_is_decoded_once():
+    calls = []
+
+    def loads(content):
+        calls.append(content)
+        return {"elements": []}
+
+    decoder = JsonDecoder(loads=loads)
+    response = make_response(b'{"elements": []}')
+    assert decoder.decode(response) is decoder.decode(response)
+    assert len(calls) == 1
+
+    stats = decoder.stats()
+    assert stats["backend"] == "custom"
+    assert (stats["decodes"], stats["cache_hits"], stats["bytes"]) == (1, 1, 16)
+    assert stats["seconds"] >= 0
+
+
+def test_forget_drops_the_cached_body():
+    decoder = JsonDecoder(backend="json")
+    response = make_response(b'{"a": 1}')
+    data = decoder.decode(response)
+    JsonDecoder.forget(response)
+    assert decoder.decode(response) == data
+    assert decoder.stats()["decodes"] == 2
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+def test_invalid_body_raises_value_error(backend):
+    pytest.importorskip(backend)
+    decoder = JsonDecoder(backend=backend)
+    assert decoder.decode(make_response(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+    with pytest.raises(ValueError):
+        decoder.decode(make_response(b"<html>"))
+
+
+def test_linkedin_decodes_each_response_once(linkedin, adapter):
+    adapter.add(
+        "/identity/profiles/tom-quirk/skills",
+        {"elements": [{"entityUrn": "urn:li:skill:1", "name": "Go"}]},
+    )
+    assert linkedin.get_profile_skills("tom-quirk") == [{"name": "Go"}]
+    assert linkedin.json_decoder.stats()["decodes"] == 1
@@ -0,0 +1,317 @@
+import re
+
+import pytest
+
+import requests
+
+
+def search_page(*urn_ids, distance="DISTANCE_2"):
+    return {
+        "data": {
+            "searchDashClustersByAll": {
+                "_type": "com.linkedin.restli.common.CollectionResponse",
+                "elements": [
+                    {
+                        "_type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+                        "items": [
+                            {
+                                "_type": "com.linkedin.voyager.dash.search.SearchItem",
+                                "item": {
+                                    "entityResult": {
+                                        "_type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+                                        "entityUrn": f"urn:li:fsd_entityResultViewModel:(urn:li:fsd_profile:{urn_id},SEARCH_SRP,DEFAULT)",
+                                        "trackingUrn": f"urn:li:member:{urn_id}",
+                                        "entityCustomTrackingInfo": {
+                                            "memberDistance": distance
+                                        },
+                                        "title": {"text": f"Name {urn_id}"},
+                                        "primarySubtitle": {"text": "Engineer"},
+                                        "secondarySubtitle": {"text": "Brisbane"},
+                                    }
+                                },
+                            }
+                            for urn_id in urn_ids
+                        ],
+                    }
+                ],
+            }
+        }
+    }
+
+
+def paged_search(pages):
+    """Return a route serving [pages] of search results according to `start`"""
+
+    def handler(request):
+        start = int(re.search(r"start:(\d+)", request.url).group(1))
+        offset = 0
+        for page in pages:
+            if start == offset:
+                return search_page(*page)
+            offset += len(page)
+        return search_page()
+
+    return handler
+
+
+def test_search_people(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1", "A2"], ["A3"]]))
+
+    results = linkedin.search_people(keywords="software")
+
+    assert [r["urn_id"] for r in results] == ["A1", "A2", "A3"]
+    assert results[0] == {
+        "urn_id": "A1",
+        "distance": "DISTANCE_2",
+        "jobtitle": "Engineer",
+        "location": "Brisbane",
+        "name": "Name A1",
+    }
+    assert "keywords:software" in adapter.requests[0].url
+    assert len(adapter.requests) == 3
+
+
+def test_search_people_excludes_private_profiles(linkedin, adapter):
+    adapter.add(
+        "/graphql", lambda request: search_page("A1", distance="OUT_OF_NETWORK")
+    )
+
+    assert linkedin.search_people(keywords="software", limit=1) == []
+
+
+def test_iter_search_people_fetches_lazily(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1", "A2"], ["A3", "A4"], ["A5"]]))
+
+    results = linkedin.iter_search_people(keywords="software")
+    first = next(results)
+
+    assert first["urn_id"] == "A1"
+    assert len(adapter.requests) == 1
+
+    for result in results:
+        if result["urn_id"] == "A3":
+            break
+
+    assert len(adapter.requests) == 2
+    assert results.offset == 3
+
+
+def test_iter_searches_take_keywords_first(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1"]]))
+    adapter.add("/voyagerJobsDashJobCards", {"included": []})
+
+    assert [r["urn_id"] for r in linkedin.iter_search_people("software")] == ["A1"]
+    assert list(linkedin.iter_search_jobs("python")) == []
+
+    assert "keywords:software" in adapter.requests[0].url
+    assert "keywords:python" in adapter.requests[-1].url
+    with pytest.raises(TypeError):
+        linkedin.iter_search_jobs("python", 10)
+
+
+def test_iter_search_resumes_from_offset(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1", "A2"], ["A3", "A4"], ["A5"]]))
+
+    resumed = linkedin.iter_search_people(keywords="software", offset=2)
+
+    assert [r["urn_id"] for r in resumed] == ["A3", "A4", "A5"]
+    assert "start:2" in adapter.requests[0].url
+
+
+def test_iter_search_people_resumes_from_cursor(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1", "A2"], ["A3", "A4"], ["A5"]]))
+
+    results = linkedin.iter_search_people(keywords="software")
+    next(results)
+    cursor = results.cursor
+
+    resumed = linkedin.iter_search_people(keywords="software").resume(cursor)
+
+    assert [r["urn_id"] for r in resumed] == ["A2", "A3", "A4", "A5"]
+
+
+def test_search_limit(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1", "A2"], ["A3", "A4"], ["A5"]]))
+
+    results = linkedin.search({"keywords": "software"}, limit=3)
+
+    assert len(results) == 3
+    assert len(adapter.requests) == 2
+
+
+def paged_collection(total, total_reported=True):
+    """Return a route serving a start/count paginated collection of [total] elements"""
+
+    def handler(request):
+        start = int(re.search(r"start=(\d+)", request.url).group(1))
+        count = int(re.search(r"count=(\d+)", request.url).group(1))
+        data = {
+            "elements": [{"id": i} for i in range(start, min(start + count, total))]
+        }
+        if total_reported:
+            data["paging"] = {"start": start, "count": count, "total": total}
+        return data
+
+    return handler
+
+
+def test_get_post_reactions_stops_at_paging_total(linkedin, adapter):
+    adapter.add("/voyagerSocialDashReactions", paged_collection(250))
+
+    results = linkedin.get_post_reactions("123")
+
+    assert [r["id"] for r in results] == list(range(250))
+    # pages of 100, and no trailing request for an empty page
+    assert len(adapter.requests) == 3
+
+
+def test_get_company_updates_honors_max_results(linkedin, adapter):
+    adapter.add("/feed/updates", paged_collection(500, total_reported=False))
+
+    results = linkedin.get_company_updates(public_id="linkedin", max_results=150)
+
+    assert len(results) == 150
+    assert "count=50" in adapter.requests[1].url
+
+
+def test_search_stops_at_paging_total(linkedin, adapter):
+    def handler(request):
+        data = paged_search([["A1", "A2"], ["A3"]])(request)
+        data["data"]["searchDashClustersByAll"]["paging"] = {"total": 3}
+        return data
+
+    adapter.add("/graphql", handler)
+    linkedin.page_workers = 2
+
+    results = linkedin.search({"keywords": "software"})
+
+    assert len(results) == 3
+    assert len(adapter.requests) == 2
+
+
+def test_search_prefetch_follows_the_served_page_size(linkedin, adapter):
+    # search ignores the requested count and serves 10 results per page
+    pages = [[f"A{n}" for n in range(start, start + 10)] for start in range(0, 100, 10)]
+
+    def handler(request):
+        data = paged_search(pages)(request)
+        data["data"]["searchDashClustersByAll"]["paging"] = {"total": 100}
+        return data
+
+    adapter.add("/graphql", handler)
+    linkedin.page_workers = 4
+
+    results = linkedin.search({"keywords": "software"})
+
+    assert len(results) == 100
+    assert len(adapter.requests) == 10
+
+
+def test_search_prefetch_stops_at_the_limit(linkedin, adapter):
+    # search ignores the requested count and serves 10 results per page
+    pages = [[f"A{n}" for n in range(start, start + 10)] for start in range(0, 100, 10)]
+
+    def handler(request):
+        data = paged_search(pages)(request)
+        data["data"]["searchDashClustersByAll"]["paging"] = {"total": 100}
+        return data
+
+    adapter.add("/graphql", handler)
+    linkedin.page_workers = 4
+
+    results = linkedin.search({"keywords": "software"}, limit=25)
+
+    assert len(results) == 25
+    assert len(adapter.requests) == 3
+
+
+def test_get_profile_bundle(linkedin, adapter, profile_view):
+    adapter.add("/identity/profiles/tom-quirk/profileView", profile_view)
+    adapter.add("/identity/profiles/tom-quirk/skills", {"elements": []})
+    adapter.add("/identity/profiles/tom-quirk/networkinfo", {"data": {"distance": 2}})
+
+    def fail(request):
+        raise requests.ConnectionError("connection reset")
+
+    # contact info fails, and must not fail the other parts
+    adapter.add("/identity/profiles/tom-quirk/profileContactInfo", fail)
+    adapter.add("/graphql", {"included": [{"components": {"elements": []}}]})
+
+    bundle = linkedin.get_profile_bundle(
+        "tom-quirk",
+        parts=["profile", "contact_info", "skills", "network_info", "experiences"],
+    )
+
+    assert bundle["profile"]["urn_id"] == "ACoAAA"
+    assert bundle["skills"] == []
+    assert bundle["network_info"] == {"distance": 2}
+    assert bundle["experiences"] == []
+    assert bundle["contact_info"] is None
+    assert list(bundle["errors"]) == ["contact_info"]
+    # the URN ID needed by experiences comes from the profile part
+    (experiences_request,) = [r for r in adapter.requests if "/graphql" in r.url]
+    assert "ACoAAA" in experiences_request.url
+    assert len(adapter.requests) == 5
+
+
+def test_get_profiles_dedupes_and_reports_errors(linkedin, adapter, profile_view):
+    adapter.add("/identity/profiles/ACoAAA/profileView", profile_view)
+    adapter.add("/identity/profiles/ACoBBB/profileView", {}, status=403)
+    progress = []
+
+    results = dict(
+        linkedin.get_profiles(
+            ["ACoAAA", "urn:li:fsd_profile:ACoAAA", "ACoBBB"],
+            workers=2,
+            progress=lambda completed, failed: progress.append((completed, failed)),
+        )
+    )
+
+    assert results["ACoAAA"]["public_id"] == "tom-quirk"
+    assert isinstance(results["ACoBBB"], Exception)
+    assert len(adapter.requests) == 2
+    assert sorted(progress)[-1] == (2, 1)
+
+
+def test_get_profiles_routes_public_and_urn_ids(linkedin):
+    calls = []
+
+    def get_profile(public_id=None, urn_id=None):
+        calls.append((public_id, urn_id))
+        return {}
+
+    linkedin.get_profile = get_profile
+
+    list(linkedin.get_profiles(["tom-quirk", "ACoAAA", "urn:li:fsd_profile:ACoBBB"]))
+
+    assert sorted(calls, key=str) == sorted(
+        [("tom-quirk", None), (None, "ACoAAA"), (None, "ACoBBB")], key=str
+    )
+
+
+def test_get_profiles_bounds_in_flight(linkedin, adapter, profile_view):
+    adapter.add("/identity/profiles", profile_view)
+    consumed = []
+
+    def ids():
+        for i in range(100):
+            consumed.append(i)
+            yield f"id-{i}"
+
+    profiles = linkedin.get_profiles(ids(), workers=2, max_in_flight=3)
+    next(profiles)
+
+    assert len(consumed) <= 4
+    profiles.close()
+
+
+def test_get_company_updates_continues_from_results(linkedin, adapter):
+    adapter.add("/feed/updates", {"elements": [{"id": 3}, {"id": 4}]})
+
+    updates = linkedin.get_company_updates(
+        "linkedin", results=[{"id": 1}, {"id": 2}], max_results=4
+    )
+
+    assert [u["id"] for u in updates] == [1, 2, 3, 4]
+    (request,) = adapter.requests
+    assert "start=2" in request.url and "count=2" in request.url
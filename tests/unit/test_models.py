@@ -0,0 +1,92 @@
+import sys
+
+import pytest
+
+from linkedin_api.models import Company, JobPosting, PeopleSearchHit, Profile
+from test_linkedin import paged_search
+
+
+def test_search_people_typed(linkedin, adapter):
+    adapter.add("/graphql", paged_search([["A1", "A2"]]))
+
+    results = linkedin.search_people(keywords="software", typed=True)
+
+    assert results == [
+        PeopleSearchHit(
+            urn_id=urn_id,
+            name=f"Name {urn_id}",
+            jobtitle="Engineer",
+            location="Brisbane",
+            distance="DISTANCE_2",
+        )
+        for urn_id in ("A1", "A2")
+    ]
+    assert not hasattr(results[0], "__dict__")
+
+
+def test_get_profile_typed(linkedin, adapter, profile_view):
+    profile_view["profile"].update(firstName="Tom", lastName="Quirk")
+    profile_view["positionView"]["elements"] = [
+        {
+            "title": "Engineer",
+            "companyName": "Codalabs",
+            "timePeriod": {"startDate": {"year": 2020, "month": 3}},
+        }
+    ]
+    adapter.add("/identity/profiles/tom-quirk/profileView", profile_view)
+
+    profile = linkedin.get_profile("tom-quirk", typed=True)
+
+    assert isinstance(profile, Profile)
+    assert (profile.public_id, profile.first_name, profile.urn_id) == (
+        "tom-quirk",
+        "Tom",
+        "ACoAAA",
+    )
+    assert profile.skills == ("Python",)
+    assert profile.experience[0].company_name == "Codalabs"
+    assert profile.experience[0].start_date == "2020-03"
+    assert profile.to_dict()["experience"][0]["title"] == "Engineer"
+
+
+def test_get_company_and_search_jobs_typed(linkedin, adapter):
+    adapter.add(
+        "/organization/companies",
+        {"elements": [{"entityUrn": "urn:li:fs_normalized_company:1337", "name": "X"}]},
+    )
+    adapter.add(
+        "/voyagerJobsDashJobCards",
+        {
+            "included": [
+                {
+                    "$type": "com.linkedin.voyager.dash.jobs.JobPosting",
+                    "entityUrn": "urn:li:fsd_jobPosting:42",
+                    "title": "Engineer",
+                }
+            ]
+        },
+    )
+
+    company = linkedin.get_company("x", typed=True)
+    assert (company.urn_id, company.name, company.industries) == ("1337", "X", ())
+
+    [job] = linkedin.search_jobs(keywords="python", limit=1, typed=True)
+    assert isinstance(job, JobPosting)
+    assert (job.job_id, job.title) == ("42", "Engineer")
+
+
+def test_records_are_smaller_than_dicts():
+    data = {
+        "urn_id": "A1",
+        "name": "Name A1",
+        "jobtitle": "Engineer",
+        "location": "Brisbane",
+        "distance": "DISTANCE_2",
+    }
+    assert sys.getsizeof(PeopleSearchHit.from_dict(data)) < sys.getsizeof(data) / 2
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(TypeError):
+        Company(ceo="nobody")
+    assert Company.from_dict({}) is None
@@ -0,0 +1,91 @@
+from linkedin_api.utils.normalized import NormalizedResponse
+from linkedin_api.utils.parsers import parse_job_postings, parse_profile_experiences
+
+GROUP_URN = (
+    "urn:li:fsd_profilePagedListComponent:(ACoAAA,EXPERIENCE_VIEW_DETAILS,"
+    "urn:li:fsd_profilePositionGroup:(ACoAAA,1),NONE,en_US)"
+)
+
+
+def experience_item(title, subtitle=None, caption="2020 - 2021 · 1 yr", group=None):
+    return {
+        "components": {
+            "entityComponent": {
+                "titleV2": {"text": {"text": title}},
+                "subtitle": {"text": subtitle} if subtitle else None,
+                "caption": {"text": caption},
+                "metadata": {"text": "Brisbane"},
+                "subComponents": (
+                    {"components": [{"components": {"*pagedListComponent": group}}]}
+                    if group
+                    else None
+                ),
+            }
+        }
+    }
+
+
+def test_index_and_references():
+    response = NormalizedResponse(
+        {
+            "data": {"*elements": ["urn:li:a:1", "urn:li:a:missing", "urn:li:a:2"]},
+            "included": [
+                {"entityUrn": "urn:li:a:1", "$type": "A", "*friend": "urn:li:a:2"},
+                {"entityUrn": "urn:li:a:2", "$type": "A"},
+                {"$type": "B"},
+            ],
+        }
+    )
+    first = response.get("urn:li:a:1")
+    assert response.deref(first, "friend") is response.get("urn:li:a:2")
+    assert [e["entityUrn"] for e in response.elements()] == ["urn:li:a:1", "urn:li:a:2"]
+    assert len(response.of_type("A")) == 2
+    assert response.of_type("C") == []
+    assert "urn:li:a:2" in response and len(response) == 3
+    assert NormalizedResponse.of(response) is response
+
+
+def test_parse_job_postings():
+    data = {
+        "included": [
+            {"$type": "com.linkedin.voyager.dash.jobs.JobPosting", "title": "Dev"},
+            {"$type": "com.linkedin.voyager.dash.jobs.JobPostingCard"},
+        ]
+    }
+    assert parse_job_postings(data) == [data["included"][0]]
+
+
+def test_parse_profile_experiences_resolves_groups():
+    data = {
+        "included": [
+            {"components": {"elements": [experience_item("Dev", "Acme · Full-time")]}},
+            {
+                "entityUrn": GROUP_URN,
+                "components": {
+                    "elements": [
+                        experience_item("Lead", "Full-time"),
+                        experience_item("Engineer", "Part-time"),
+                    ]
+                },
+            },
+            {
+                "components": {
+                    "elements": [
+                        experience_item("Codalabs", group=GROUP_URN),
+                        experience_item("Tester", "Initech"),
+                        experience_item("Intern", "Initech"),
+                    ]
+                }
+            },
+        ]
+    }
+
+    experiences = parse_profile_experiences(data)
+
+    assert [(e["title"], e["companyName"]) for e in experiences] == [
+        ("Lead", "Codalabs"),
+        ("Engineer", "Codalabs"),
+        ("Tester", "Initech"),
+        ("Intern", "Initech"),
+    ]
+    assert experiences[0]["employmentType"] == "Full-time"
@@ -0,0 +1,151 @@
+import gc
+import time
+
+import pytest
+
+from linkedin_api.pagination import (
+    Cursor,
+    FileCheckpointStore,
+    Page,
+    PageIterator,
+    SQLiteCheckpointStore,
+)
+
+
+def make_fetch_page(pages, calls=None):
+    """Return a fetcher serving [pages] of integers by offset"""
+
+    def fetch_page(cursor, count):
+        if calls is not None:
+            calls.append((cursor.start, count))
+        offset = 0
+        for page in pages:
+            if cursor.start == offset:
+                return Page(list(page))
+            offset += len(page)
+        return Page([])
+
+    return fetch_page
+
+
+def test_cursor_round_trip():
+    cursor = Cursor(start=10, pagination_token="abc", skip=2, fetched=10, requests=1)
+
+    assert Cursor.from_json(cursor.to_json()) == cursor
+
+
+def test_resume_mid_page():
+    pages = [[1, 2, 3], [4, 5, 6], [7]]
+    results = PageIterator(make_fetch_page(pages), page_size=3)
+    assert [next(results) for _ in range(4)] == [1, 2, 3, 4]
+
+    calls = []
+    resumed = PageIterator(make_fetch_page(pages, calls), page_size=3)
+    resumed.resume(Cursor.from_json(results.cursor.to_json()))
+
+    assert list(resumed) == [5, 6, 7]
+    # the partially consumed page is fetched again, and its head skipped
+    assert calls[0] == (3, 3)
+
+
+def test_pages_yields_cursor_after_each_page():
+    results = PageIterator(make_fetch_page([[1, 2], [3]]), page_size=2)
+
+    pages = list(results.pages())
+
+    assert [items for items, _ in pages] == [[1, 2], [3]]
+    assert pages[0][1].start == 2
+    assert results.done
+
+
+def test_token_pagination_stops_on_last_page():
+    tokens = []
+
+    def fetch_page(cursor, count):
+        tokens.append(cursor.pagination_token)
+        if cursor.pagination_token is None:
+            return Page([1, 2], pagination_token="next")
+        return Page([3], last=True)
+
+    assert list(PageIterator(fetch_page, page_size=2)) == [1, 2, 3]
+    assert tokens == [None, "next"]
+
+
+@pytest.mark.parametrize("store_type", ["file", "sqlite"])
+def test_checkpoint_resumes_interrupted_crawl(tmp_path, store_type):
+    if store_type == "file":
+        store = FileCheckpointStore(str(tmp_path))
+    else:
+        store = SQLiteCheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    pages = [[1, 2], [3, 4], [5]]
+
+    first = PageIterator(make_fetch_page(pages), page_size=2)
+    first.checkpoint(store, "crawl")
+    assert [next(first) for _ in range(3)] == [1, 2, 3]
+    # a checkpoint is saved once a page has been fully consumed
+    assert store.load("crawl").start == 2
+
+    calls = []
+    second = PageIterator(make_fetch_page(pages, calls), page_size=2)
+    second.checkpoint(store, "crawl")
+
+    assert list(second) == [3, 4, 5]
+    assert calls[0][0] == 2
+    assert store.load("crawl") is None
+
+
+def test_get_post_comments_follows_pagination_token(linkedin, adapter):
+    def handler(request):
+        if "paginationToken=token-1" in request.url:
+            return {"elements": [{"id": 2}], "metadata": {}}
+        return {"elements": [{"id": 1}], "metadata": {"paginationToken": "token-1"}}
+
+    adapter.add("/feed/comments", handler)
+
+    assert linkedin.get_post_comments("123") == [{"id": 1}, {"id": 2}]
+    assert len(adapter.requests) == 2
+
+
+def test_prefetch_plans_pages_from_total():
+    calls = []
+
+    def fetch_page(cursor, count):
+        calls.append((cursor.start, count))
+        items = list(range(cursor.start, min(cursor.start + count, 10)))
+        return Page(items, total=10)
+
+    results = PageIterator(fetch_page, page_size=3, workers=4)
+
+    assert list(results) == list(range(10))
+    # no trailing request for an empty page
+    assert sorted(calls) == [(0, 3), (3, 3), (6, 3), (9, 1)]
+
+
+def test_prefetch_respects_limit_and_keeps_order():
+    def fetch_page(cursor, count):
+        # later pages come back first
+        time.sleep(0.01 * (10 - cursor.start) / 10)
+        return Page(list(range(cursor.start, cursor.start + count)), total=100)
+
+    results = PageIterator(fetch_page, page_size=2, limit=7, workers=3)
+
+    assert list(results) == list(range(7))
+
+
+def test_breaking_early_stops_the_prefetch_threads():
+    def fetch_page(cursor, count):
+        return Page(list(range(cursor.start, cursor.start + count)), total=100)
+
+    with PageIterator(fetch_page, page_size=2, workers=3) as results:
+        assert next(results) == 0
+        executor = results._executor
+        assert executor is not None
+    assert results._executor is None
+    assert executor._shutdown
+
+    results = PageIterator(fetch_page, page_size=2, workers=3)
+    next(results)
+    executor = results._executor
+    del results
+    gc.collect()
+    assert executor._shutdown
@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+from linkedin_api.rate_limiter import RateLimiter, TokenBucket
+from linkedin_api.utils.helpers import get_endpoint_family
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bucket_allows_burst_without_waiting(clock):
+    bucket = TokenBucket(per_minute=60, burst=5, clock=clock)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_against_elapsed_time(clock):
+    bucket = TokenBucket(per_minute=60, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+    assert bucket.available() == pytest.approx(0.5)
+
+
+def test_bucket_never_exceeds_burst(clock):
+    bucket = TokenBucket(per_minute=60, burst=3, clock=clock)
+    clock.now += 3600
+    assert bucket.available() == 3
+
+
+def test_limiter_only_sleeps_when_budget_exhausted(clock):
+    limiter = RateLimiter(per_minute=60, burst=3, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        limiter.acquire("profiles")
+    assert clock.slept == []
+
+    limiter.acquire("profiles")
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_limiter_family_budget(clock):
+    limiter = RateLimiter(
+        per_minute=600,
+        burst=100,
+        families={"search": (6, 1)},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    assert limiter.acquire("search") == 0.0
+    assert limiter.acquire("profiles") == 0.0
+    assert limiter.acquire("search") == pytest.approx(10.0)
+
+
+def test_shared_limiter_is_per_account():
+    a = RateLimiter.shared("shared-test-a@example.com", per_minute=10)
+    assert RateLimiter.shared("shared-test-a@example.com") is a
+    assert RateLimiter.shared("shared-test-b@example.com") is not a
+
+
+def test_limiter_is_thread_safe(clock):
+    limiter = RateLimiter(per_minute=60, burst=50, clock=clock, sleep=lambda s: None)
+    threads = [
+        threading.Thread(target=lambda: [limiter.reserve() for _ in range(10)])
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert limiter.bucket.available() == pytest.approx(-50)
+
+
+@pytest.mark.parametrize(
+    "uri,family",
+    [
+        ("/identity/profiles/tom-quirk/profileView", "profiles"),
+        ("/organization/companies?q=universalName&universalName=linkedin", "companies"),
+        ("/feed/updatesV2", "feed"),
+        ("/voyagerJobsDashJobCards?count=49", "search"),
+        (
+            "/graphql?variables=(start:0)&queryId=voyagerSearchDashClusters.b0928897b",
+            "search",
+        ),
+        ("/messaging/conversations", "messaging"),
+        ("/me", "me"),
+    ],
+)
+def test_get_endpoint_family(uri, family):
+    assert get_endpoint_family(uri) == family
+
+
+def test_linkedin_fetch_uses_rate_limiter(linkedin, adapter):
+    families = []
+    linkedin.rate_limiter.acquire = lambda family=None: families.append(family)
+    adapter.add("/identity/profiles/", {})
+    adapter.add("/me", {})
+
+    linkedin._fetch("/identity/profiles/tom-quirk/profileContactInfo")
+    linkedin._fetch("/me")
+
+    assert families == ["profiles", "me"]
+
+
+def test_penalize_slows_down_and_reward_recovers(clock):
+    limiter = RateLimiter(
+        per_minute=60, burst=1, recovery=0.25, clock=clock, sleep=clock.sleep
+    )
+    limiter.penalize()
+    assert limiter.bucket.rate == pytest.approx(0.5)
+    limiter.penalize(retry_after=10)
+    assert limiter.bucket.rate == pytest.approx(0.25)
+    # nothing goes through until retry_after has elapsed
+    assert limiter.reserve() >= 10
+
+    limiter.reward()
+    limiter.reward()
+    limiter.reward()
+    limiter.reward()
+    assert limiter.bucket.rate == pytest.approx(1.0)
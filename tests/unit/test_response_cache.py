@@ -0,0 +1,136 @@
+import pytest
+
+from linkedin_api.response_cache import CacheMissError, ResponseCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(str(tmp_path / "responses.sqlite3"), clock=clock)
+
+
+COMPANY = {"elements": [{"name": "LinkedIn"}]}
+
+
+def test_cache_hit_skips_request(linkedin, adapter, cache):
+    linkedin.response_cache = cache
+    adapter.add("/organization/companies", COMPANY)
+
+    assert linkedin.get_company("linkedin") == {"name": "LinkedIn"}
+    assert linkedin.get_company("linkedin") == {"name": "LinkedIn"}
+    assert len(adapter.requests) == 1
+
+    linkedin.get_company("microsoft")
+    assert len(adapter.requests) == 2
+
+
+def test_cache_hit_skips_evade(linkedin, adapter, cache):
+    calls = []
+    linkedin.response_cache = cache
+    adapter.add("/organization/companies", COMPANY)
+
+    linkedin._fetch("/organization/companies", evade=lambda: calls.append(1))
+    res = linkedin._fetch("/organization/companies", evade=lambda: calls.append(1))
+
+    assert res.from_cache
+    assert res.json() == COMPANY
+    assert calls == [1]
+
+
+def test_cache_entries_expire_by_family(linkedin, adapter, cache, clock):
+    linkedin.response_cache = cache
+    adapter.add("/organization/companies", COMPANY)
+    adapter.add("/feed/updates", {"elements": []})
+
+    linkedin.get_company("linkedin")
+    clock.now += 6 * 24 * 60 * 60
+    linkedin.get_company("linkedin")
+    assert len(adapter.requests) == 1
+
+    clock.now += 2 * 24 * 60 * 60
+    linkedin.get_company("linkedin")
+    assert len(adapter.requests) == 2
+
+    # feed responses are never cached
+    linkedin._fetch("/feed/updates")
+    linkedin._fetch("/feed/updates")
+    assert len(adapter.requests) == 4
+
+
+def test_cache_modes(linkedin, adapter, cache):
+    linkedin.response_cache = cache
+    adapter.add("/organization/companies", COMPANY)
+
+    with pytest.raises(CacheMissError):
+        linkedin._fetch("/organization/companies", cache="only")
+    linkedin.get_company("linkedin", cache="bypass")
+    with pytest.raises(CacheMissError):
+        linkedin.get_company("linkedin", cache="only")
+
+    linkedin.get_company("linkedin", cache="refresh")
+    linkedin.get_company("linkedin", cache="refresh")
+    assert len(adapter.requests) == 3
+    assert linkedin.get_company("linkedin", cache="only") == {"name": "LinkedIn"}
+    assert len(adapter.requests) == 3
+
+
+def test_error_payloads_are_not_cached(linkedin, adapter, cache):
+    linkedin.response_cache = cache
+    adapter.add("/jobs/jobPostings", {"status": 403, "message": "forbidden"})
+
+    assert linkedin.get_job("1") == {}
+    assert linkedin.get_job("1") == {}
+    assert len(adapter.requests) == 2
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    cache = ResponseCache(
+        str(tmp_path / "responses.sqlite3"), max_bytes=250, clock=clock
+    )
+    body = bytes(range(100))  # incompressible enough
+
+    for key in ("a", "b"):
+        cache.set(key, key, 200, {}, body)
+        clock.now += 1
+    assert cache.get("a", ttl=60) is not None
+    clock.now += 1
+    cache.set("c", "c", 200, {}, body)
+
+    assert cache.get("b", ttl=60) is None
+    assert cache.get("a", ttl=60) == (200, {}, body)
+    assert cache.get("c", ttl=60) is not None
+
+
+def test_cache_only_misses_raise(linkedin, adapter, cache):
+    linkedin.response_cache = cache
+    adapter.add("/identity/profiles/tom-quirk/skills", {"elements": []})
+
+    with pytest.raises(CacheMissError):
+        linkedin.get_profile_skills("tom-quirk", cache="only")
+    assert linkedin.get_profile_skills("tom-quirk") == []
+    assert linkedin.get_profile_skills("tom-quirk", cache="only") == []
+    assert len(adapter.requests) == 1
+
+
+def test_viewer_dependent_endpoints_are_not_cached(linkedin, adapter, cache):
+    linkedin.response_cache = cache
+    adapter.add("/identity/profiles/tom-quirk/profileContactInfo", {})
+
+    linkedin.get_profile_contact_info("tom-quirk")
+    linkedin.get_profile_contact_info("tom-quirk")
+    assert len(adapter.requests) == 2
+    with pytest.raises(CacheMissError):
+        linkedin.get_profile_contact_info("tom-quirk", cache="only")
+    assert cache.get_ttl("profiles", "/identity/profiles/{id}/profileView") > 0
@@ -0,0 +1,95 @@
+import pytest
+
+from linkedin_api import Linkedin, RateLimiter, RetryPolicy
+from linkedin_api.client import RateLimitedException
+from linkedin_api.retry import parse_retry_after
+
+
+@pytest.fixture
+def slept():
+    return []
+
+
+@pytest.fixture
+def linkedin(adapter, slept):
+    api = Linkedin(
+        "user@example.com",
+        "password",
+        authenticate=False,
+        rate_limiter=RateLimiter(per_minute=10**9, burst=10**9),
+        retry_policy=RetryPolicy(max_retries=2, jitter=0, sleep=slept.append),
+    )
+    api.client.session.mount("https://", adapter)
+    return api
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_get_delay_backs_off_exponentially_and_honors_retry_after():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=0)
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+
+    response = type("Response", (), {"headers": {"Retry-After": "3"}})()
+    assert policy.get_delay(0, response) == 3
+
+
+def test_transient_get_is_retried(linkedin, adapter, slept):
+    adapter.add("/me", {}, status=503)
+    res = linkedin._fetch("/me")
+    assert res.status_code == 503
+    assert len(adapter.requests) == 3
+    # the rate limiter doesn't hold back transient failures, the retry policy does
+    assert slept == [1, 2]
+
+
+def test_transient_post_is_not_retried(linkedin, adapter, slept):
+    adapter.add("/messaging", {}, status=503)
+    res = linkedin._post("/messaging", data="{}")
+    assert res.status_code == 503
+    assert len(adapter.requests) == 1
+    assert slept == []
+
+
+def test_persistent_throttling_returns_the_last_response(linkedin, adapter, slept):
+    adapter.add("/me", {}, status=429)
+    res = linkedin._fetch("/me", evade=lambda: None)
+    assert res.status_code == 429
+    assert len(adapter.requests) == 3
+
+
+def test_persistent_throttling_raises_when_asked_to(linkedin, adapter, slept):
+    linkedin.retry_policy.raise_on_throttled = True
+    adapter.add("/me", {}, status=429, headers={"Retry-After": "7"})
+    with pytest.raises(RateLimitedException) as e:
+        # without rate limiting, the retry policy waits itself
+        linkedin._fetch("/me", evade=lambda: None)
+    assert e.value.status_code == 429
+    assert e.value.retry_after == 7
+    assert slept == [7, 7]
+
+
+def test_throttling_slows_down_the_rate_limiter(linkedin, adapter, slept):
+    sent = []
+
+    def route(request):
+        sent.append(request)
+        return {"ok": len(sent)}
+
+    adapter.add("/me", route)
+    linkedin.rate_limiter = RateLimiter(
+        per_minute=60, burst=10, recovery=0.25, sleep=slept.append
+    )
+    linkedin._fetch("/me")
+    assert linkedin.rate_limiter.bucket.scale == 1.0
+
+    adapter.add("/me", {}, status=999)
+    assert linkedin._fetch("/me").status_code == 999
+    # halved on each of the 3 throttled attempts
+    assert linkedin.rate_limiter.bucket.scale == pytest.approx(1 / 8)
+    # the limiter, not the retry policy, held the retries back
+    assert sum(slept) >= 1 + 2
@@ -0,0 +1,126 @@
+import threading
+
+from requests.cookies import RequestsCookieJar, create_cookie
+
+from linkedin_api.client import Client
+from linkedin_api.session_keeper import SessionKeeper
+
+NOW = 1_700_000_000.0
+
+
+def make_cookies(value, expires):
+    cookies = RequestsCookieJar()
+    cookies.set_cookie(create_cookie("JSESSIONID", f'"{value}"', expires=expires))
+    return cookies
+
+
+def make_client(expires, new_expires=NOW + 365 * 86400):
+    client = Client()
+    client._set_session_cookies(make_cookies("ajax:old", expires))
+    client.logins = []
+
+    def login(username, password):
+        client.logins.append(username)
+        return make_cookies("ajax:new", new_expires)
+
+    client._request_authenticated_cookies = login
+    return client
+
+
+def make_keeper(**kwargs):
+    return SessionKeeper(refresh_before=3600, clock=lambda: NOW, **kwargs)
+
+
+def test_only_sessions_about_to_expire_are_refreshed():
+    keeper = make_keeper()
+    expiring = make_client(expires=NOW + 600)
+    fresh = make_client(expires=NOW + 86400)
+    keeper.add(expiring, "expiring", "password")
+    keeper.add(fresh, "fresh", "password")
+
+    refreshed = keeper.check()
+
+    assert [s.name for s in refreshed] == ["expiring"]
+    assert expiring.logins == ["expiring"]
+    assert fresh.logins == []
+    stats = {s["name"]: s for s in keeper.stats()}
+    assert stats["expiring"]["refreshes"] == 1
+    assert stats["expiring"]["time_to_expiry"] == 365 * 86400
+    assert stats["fresh"]["time_to_expiry"] == 86400
+
+
+def test_refresh_swaps_the_session_at_once():
+    keeper = make_keeper()
+    client = make_client(expires=NOW + 60)
+    client.session.headers["x-custom"] = "kept"
+    client.metadata["me"] = {"plainId": 1}
+    in_flight = client.session
+    keeper.add(client, "user", "password")
+
+    keeper.check()
+
+    # a request already sent with the previous session keeps its cookies
+    assert in_flight.cookies["JSESSIONID"] == '"ajax:old"'
+    assert in_flight.headers["csrf-token"] == "ajax:old"
+    assert client.session is not in_flight
+    assert client.cookies["JSESSIONID"] == '"ajax:new"'
+    assert client.session.headers["csrf-token"] == "ajax:new"
+    assert client.session.headers["x-custom"] == "kept"
+    assert client.session.get_adapter(Client.API_BASE_URL) is client._adapter
+    assert client.metadata["me"] == {"plainId": 1}
+
+
+def test_failed_refresh_is_retried_later():
+    clock = [NOW]
+    keeper = SessionKeeper(
+        refresh_before=3600, retry_interval=300, clock=lambda: clock[0]
+    )
+    client = make_client(expires=NOW + 60)
+
+    def fail(username, password):
+        client.logins.append(username)
+        raise ConnectionError("down")
+
+    client._request_authenticated_cookies = fail
+    keeper.add(client, "user", "password")
+
+    assert keeper.check() == []
+    assert keeper.check() == []
+    assert client.logins == ["user"]
+    assert keeper.stats()[0]["failures"] == 1
+    assert "down" in keeper.stats()[0]["last_error"]
+
+    clock[0] += 300
+    keeper.check()
+    assert client.logins == ["user", "user"]
+
+
+def test_background_thread_refreshes_sessions():
+    keeper = make_keeper(check_interval=0.01)
+    client = make_client(expires=NOW + 60)
+    refreshed = threading.Event()
+    login = client._request_authenticated_cookies
+
+    def login_and_notify(username, password):
+        cookies = login(username, password)
+        refreshed.set()
+        return cookies
+
+    client._request_authenticated_cookies = login_and_notify
+    keeper.add(client, "user", "password")
+
+    with keeper:
+        assert refreshed.wait(5)
+    assert keeper._thread is None
+    assert client.cookies["JSESSIONID"] == '"ajax:new"'
+
+
+def test_removed_sessions_are_left_alone():
+    keeper = make_keeper()
+    client = make_client(expires=NOW + 60)
+    keeper.add(client, "user", "password")
+
+    keeper.remove(client)
+
+    assert keeper.check() == []
+    assert len(keeper) == 0
@@ -0,0 +1,104 @@
+import pytest
+
+from linkedin_api import Linkedin
+from linkedin_api.client import ChallengeException, Client
+from linkedin_api.session_pool import NoAvailableAccountException, SessionPool
+
+from conftest import FakeAdapter
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(adapter):
+    client = Client()
+    client.session.mount("https://", adapter)
+    return client
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(clock):
+    return SessionPool(quarantine_seconds=60, clock=clock)
+
+
+def make_api(pool):
+    return Linkedin("", "", authenticate=False, session_pool=pool, rate_limiter=None)
+
+
+def test_requests_are_spread_over_accounts(pool):
+    adapters = [FakeAdapter(), FakeAdapter()]
+    for i, adapter in enumerate(adapters):
+        adapter.add("/organization/companies", {"elements": [{"name": f"c{i}"}]})
+        pool.add(make_client(adapter), name=f"account-{i}")
+    api = make_api(pool)
+
+    for _ in range(4):
+        api._fetch("/organization/companies", evade=lambda: None)
+
+    assert [len(adapter.requests) for adapter in adapters] == [2, 2]
+    assert [stats["requests"] for stats in pool.stats()] == [2, 2]
+
+
+def test_unauthorized_account_is_quarantined(pool, clock):
+    bad, good = FakeAdapter(), FakeAdapter()
+    bad.add("/organization/companies", {}, status=401)
+    good.add("/organization/companies", {"elements": []})
+    pool.add(make_client(bad), name="bad")
+    pool.add(make_client(good), name="good")
+    api = make_api(pool)
+
+    for _ in range(3):
+        api._fetch("/organization/companies", evade=lambda: None)
+
+    assert len(bad.requests) == 1
+    assert len(good.requests) == 2
+    assert pool.stats()[0]["quarantines"] == 1
+
+    clock.now += 61
+    assert pool.acquire().name == "bad"
+
+
+def test_no_healthy_account(pool):
+    account = pool.add(make_client(FakeAdapter()))
+    pool.quarantine(account, "challenge")
+
+    with pytest.raises(NoAvailableAccountException):
+        make_api(pool)._fetch("/me", evade=lambda: None)
+
+
+def test_account_failing_to_authenticate_stays_out_until_it_does(
+    pool, clock, monkeypatch
+):
+    attempts = []
+
+    def authenticate(client, username, password):
+        attempts.append(username)
+        if len(attempts) < 3:
+            raise ChallengeException("CHALLENGE")
+
+    monkeypatch.setattr(Client, "authenticate", authenticate)
+    account = pool.add_account("user", "password")
+    assert pool.stats()[0]["authenticated"] is False
+
+    with pytest.raises(NoAvailableAccountException):
+        pool.acquire()
+    # the quarantine is over, but authenticating again fails
+    clock.now += 61
+    with pytest.raises(NoAvailableAccountException):
+        pool.acquire()
+    assert attempts == ["user", "user"]
+
+    clock.now += 61
+    assert pool.acquire() is account
+    assert attempts == ["user", "user", "user"]
+    assert pool.stats()[0]["authenticated"] is True
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from linkedin_api import SingleFlight
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_concurrent_fetches_share_one_request(linkedin, adapter):
+    release = threading.Event()
+
+    def route(request):
+        release.wait(5)
+        return {"universalName": "linkedin"}
+
+    adapter.add("/organization/companies", route)
+    results = []
+
+    def fetch():
+        res = linkedin._fetch("/organization/companies?universalName=linkedin")
+        results.append(res)
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: linkedin.single_flight.stats()["shared"] == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(adapter.requests) == 1
+    assert [res.json() for res in results] == [{"universalName": "linkedin"}] * 4
+    # every caller gets its own response object
+    assert len({id(res) for res in results}) == 4
+    assert linkedin.single_flight.stats() == {"calls": 4, "shared": 3, "in_flight": 0}
+
+
+def test_sequential_fetches_are_not_shared(linkedin, adapter):
+    adapter.add("/me", {})
+    linkedin._fetch("/me")
+    linkedin._fetch("/me")
+    assert len(adapter.requests) == 2
+    assert linkedin.single_flight.stats()["shared"] == 0
+
+
+def test_followers_get_the_leader_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    wait_for(lambda: flight.stats()["shared"] == 1)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+    assert flight.stats()["in_flight"] == 0
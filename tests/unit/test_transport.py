@@ -0,0 +1,47 @@
+from linkedin_api.client import Client
+from linkedin_api.transport import TransportConfig
+
+from conftest import FakeAdapter
+
+
+class RecordingAdapter(FakeAdapter):
+    def send(self, request, **kwargs):
+        self.timeouts = getattr(self, "timeouts", []) + [kwargs.get("timeout")]
+        return super().send(request, **kwargs)
+
+
+def test_auth_requests_share_the_connection_pool():
+    client = Client(transport_config=TransportConfig(pool_maxsize=32))
+    adapter = RecordingAdapter()
+    adapter.add("/uas/authenticate", {})
+    client._adapter = adapter
+    sessions = []
+    build_session = client._build_session
+
+    def record_session():
+        sessions.append(build_session())
+        return sessions[-1]
+
+    client._build_session = record_session
+
+    client._request_session_cookies()
+    client._request_session_cookies()
+
+    assert len(adapter.requests) == 2
+    # one session per authentication request, so concurrent ones can't mix cookies
+    assert sessions[0] is not sessions[1]
+    assert client.session.get_adapter(Client.LINKEDIN_BASE_URL)._pool_maxsize == 32
+
+
+def test_requests_use_configured_timeouts():
+    client = Client(transport_config=TransportConfig(connect_timeout=3, read_timeout=7))
+    adapter = RecordingAdapter()
+    adapter.add("/uas/authenticate", {})
+    client._adapter = adapter
+    client.session.mount("https://", adapter)
+
+    client._request_session_cookies()
+    client.request("GET", f"{Client.API_BASE_URL}/me")
+
+    assert adapter.timeouts == [(3, 7), (3, 7)]
+    assert adapter.requests[0].headers["User-Agent"] == "ANDROID OS"